@@ -7,21 +7,101 @@ Version: 1.0.0
 
 Usage:
     python basion_bot.py <private_key> [proxy]
-    python basion_bot.py wallets.txt
+    python basion_bot.py wallets.txt [--async] [--blocks] [--workers[=N]]
+    python basion_bot.py status <private_key|wallets.txt>
 """
 
+from __future__ import annotations
+
+import os
+import re
+import sys
+import math
 import time
 import json
 import asyncio
-from typing import Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+import threading
+import atexit
+import array
+import bisect
+import itertools
+import functools
+import importlib
+import signal
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Iterator, Callable, TYPE_CHECKING
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import BrokenExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 
-from web3 import Web3
-from web3.middleware import ExtraDataToPOAMiddleware
-from eth_account import Account
-from eth_account.messages import encode_defunct
-import httpx
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+    from http.server import ThreadingHTTPServer
+    from eth_account.signers.local import LocalAccount
+
+
+# =============================================================================
+# LAZY IMPORTS
+# =============================================================================
+
+class _LazyImport:
+    """
+    Module-level name for a heavy dependency, imported on first use.
+    
+    web3 / eth_account / httpx take over a second to import; with these
+    stand-ins `python basion_bot.py --help` (and `status`, which only
+    needs eth_abi / eth_keys / httpx) doesn't pay for them. The first
+    attribute access or call imports the target and rebinds the module
+    global to it, so later uses go straight to the real object.
+    """
+    
+    def __init__(self, name: str, module: str, attr: Optional[str] = None):
+        self._name = name
+        self._module = module
+        self._attr = attr
+    
+    def _load(self) -> Any:
+        target = importlib.import_module(self._module)
+        if self._attr:
+            target = getattr(target, self._attr)
+        globals()[self._name] = target
+        return target
+    
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+    
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._load()(*args, **kwargs)
+    
+    def __repr__(self) -> str:
+        return f"<lazy {self._module}{'.' + self._attr if self._attr else ''}>"
+
+
+Web3 = _LazyImport("Web3", "web3", "Web3")
+AsyncWeb3 = _LazyImport("AsyncWeb3", "web3", "AsyncWeb3")
+WebSocketProvider = _LazyImport("WebSocketProvider", "web3", "WebSocketProvider")
+web3_middleware = _LazyImport("web3_middleware", "web3.middleware")
+Account = _LazyImport("Account", "eth_account", "Account")
+encode_defunct = _LazyImport("encode_defunct", "eth_account.messages", "encode_defunct")
+keys = _LazyImport("keys", "eth_keys", "keys")
+HexBytes = _LazyImport("HexBytes", "hexbytes", "HexBytes")
+abi_encode = _LazyImport("abi_encode", "eth_abi", "encode")
+abi_decode = _LazyImport("abi_decode", "eth_abi", "decode")
+get_abi_input_types = _LazyImport("get_abi_input_types", "eth_utils.abi", "get_abi_input_types")
+get_abi_output_types = _LazyImport("get_abi_output_types", "eth_utils.abi", "get_abi_output_types")
+keccak = _LazyImport("keccak", "eth_utils", "keccak")
+to_checksum_address = _LazyImport("to_checksum_address", "eth_utils", "to_checksum_address")
+httpx = _LazyImport("httpx", "httpx")
+# Stdlib modules only some entry points need (state store, worker processes, /metrics)
+sqlite3 = _LazyImport("sqlite3", "sqlite3")
+multiprocessing = _LazyImport("multiprocessing", "multiprocessing")
+connection_wait = _LazyImport("connection_wait", "multiprocessing.connection", "wait")
+futures_process = _LazyImport("futures_process", "concurrent.futures.process")
+http_server = _LazyImport("http_server", "http.server")
 
 
 # =============================================================================
@@ -32,6 +112,17 @@ API_BASE = "https://basion.app"
 RPC_URL = "https://mainnet.base.org"
 CONTRACT_ADDRESS = "0x21f7944eD2F9ae2d09C9CcF55EDa92D1956d921a"
 CHAIN_ID = 8453
+BLOCK_TIME = 2.0  # Base block time (seconds)
+ZERO_ADDRESS = "0x" + "0" * 40
+
+# /api/tap limits: count per request, signature validity (the server rejects
+# timestamps older than 5 minutes) and how early a signature is renewed
+API_TAP_MAX_COUNT = 100
+API_SIGNATURE_TTL = 300.0
+API_SIGNATURE_REFRESH = 60.0
+
+# /api/leaderboard returns at most this many entries (?limit is capped)
+API_LEADERBOARD_MAX = 100
 
 # Package options: {package_id: (usd_price, taps, eth_price)}
 PACKAGES = {
@@ -144,6 +235,110 @@ CONTRACT_ABI = [
     },
 ]
 
+# Contract events keyed by user (src/config/abi.ts), for the event indexer
+EVENT_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "user", "type": "address"},
+            {"indexed": True, "internalType": "uint256", "name": "packageId", "type": "uint256"},
+            {"indexed": False, "internalType": "uint256", "name": "taps", "type": "uint256"},
+            {"indexed": False, "internalType": "uint256", "name": "totalPaid", "type": "uint256"}
+        ],
+        "name": "Deposit",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "user", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "burner", "type": "address"}
+        ],
+        "name": "BurnerRegistered",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "user", "type": "address"},
+            {"indexed": False, "internalType": "uint256", "name": "points", "type": "uint256"},
+            {"indexed": False, "internalType": "bool", "name": "isPremium", "type": "bool"}
+        ],
+        "name": "Tap",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "user", "type": "address"},
+            {"indexed": False, "internalType": "uint256", "name": "multiplier", "type": "uint256"},
+            {"indexed": False, "internalType": "uint256", "name": "bonusTaps", "type": "uint256"}
+        ],
+        "name": "BoostSet",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "user", "type": "address"},
+            {"indexed": True, "internalType": "address", "name": "referrer", "type": "address"}
+        ],
+        "name": "ReferralRegistered",
+        "type": "event"
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "user", "type": "address"},
+            {"indexed": False, "internalType": "bool", "name": "status", "type": "bool"}
+        ],
+        "name": "Blacklisted",
+        "type": "event"
+    },
+]
+
+# Multicall3 (same address on every EVM chain, incl. Base)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL_CHUNK_SIZE = 500  # Max calls per aggregate3 eth_call
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"internalType": "address", "name": "addr", "type": "address"}],
+        "name": "getEthBalance",
+        "outputs": [{"internalType": "uint256", "name": "balance", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+]
+
 
 # =============================================================================
 # DATA CLASSES
@@ -171,222 +366,4915 @@ class BurnerWallet:
 
 
 # =============================================================================
-# BASION BOT CLASS
+# MULTICALL (BATCHED READS)
+# =============================================================================
+
+def _encode_call(fn) -> Tuple[str, bytes]:
+    """Encode a bound contract function as a Multicall3 Call3 target + calldata"""
+    data = bytes.fromhex(fn.selector[2:]) + abi_encode(fn.argument_types, fn.args)
+    return fn.address, data
+
+
+def _decode_result(fn, success: bool, data: bytes) -> Any:
+    """Decode one aggregate3 result (None if the call failed)"""
+    if not success:
+        return None
+    types = get_abi_output_types(fn.abi)
+    values = [
+        to_checksum_address(v) if t == "address" else v
+        for t, v in zip(types, abi_decode(types, data))
+    ]
+    return values[0] if len(values) == 1 else values
+
+
+class _AbiCall:
+    """
+    Contract read built from its ABI alone: stands in for a bound web3
+    contract function in _encode_call / _decode_result (multicall_rpc)
+    """
+    
+    def __init__(self, address: str, abi: list, name: str, *args):
+        self.abi = next(f for f in abi if f.get("type") == "function" and f["name"] == name)
+        self.argument_types = get_abi_input_types(self.abi)
+        self.selector = "0x" + keccak(text=f"{name}({','.join(self.argument_types)})")[:4].hex()
+        self.address = address
+        self.args = args
+
+
+def multicall_rpc(pool: RPCPool, fns: list, chunk_size: int = MULTICALL_CHUNK_SIZE) -> list:
+    """
+    multicall() over a bare RPCPool, without web3.
+    
+    Args:
+        pool: RPCPool
+        fns: _AbiCall reads
+        chunk_size: Max calls per eth_call
+    
+    Returns:
+        Decoded results in order (None for calls that reverted)
+    """
+    results = []
+    for i in range(0, len(fns), chunk_size):
+        chunk = fns[i:i + chunk_size]
+        calls = [(target, True, data) for target, data in map(_encode_call, chunk)]
+        aggregate3 = _AbiCall(MULTICALL3_ADDRESS, MULTICALL3_ABI, "aggregate3", calls)
+        target, data = _encode_call(aggregate3)
+        response = pool.make_request("eth_call", [{"to": target, "data": "0x" + data.hex()}, "latest"])
+        if "error" in response:
+            raise RPCPoolError(f"aggregate3 failed: {response['error']}")
+        raw = _decode_result(aggregate3, True, bytes.fromhex(response["result"][2:]))
+        results.extend(_decode_result(fn, ok, data) for fn, (ok, data) in zip(chunk, raw))
+    return results
+
+
+def _multicall_contract(w3):
+    return w3.eth.contract(
+        address=Web3.to_checksum_address(MULTICALL3_ADDRESS),
+        abi=MULTICALL3_ABI
+    )
+
+
+def multicall(
+    w3,
+    fns: list,
+    chunk_size: int = MULTICALL_CHUNK_SIZE,
+    block_identifier: Any = "latest"
+) -> list:
+    """
+    Execute many contract reads via Multicall3 aggregate3.
+    
+    Args:
+        w3: Web3 instance
+        fns: Bound contract functions, e.g. contract.functions.getPoints(addr)
+        chunk_size: Max calls per eth_call
+        block_identifier: Block to read at (all chunks read the same block)
+    
+    Returns:
+        Decoded results in order (None for calls that reverted)
+    """
+    mc = _multicall_contract(w3)
+    results = []
+    for i in range(0, len(fns), chunk_size):
+        chunk = fns[i:i + chunk_size]
+        calls = [(target, True, data) for target, data in map(_encode_call, chunk)]
+        raw = mc.functions.aggregate3(calls).call(block_identifier=block_identifier)
+        results.extend(_decode_result(fn, ok, data) for fn, (ok, data) in zip(chunk, raw))
+    return results
+
+
+async def multicall_async(w3, fns: list, chunk_size: int = MULTICALL_CHUNK_SIZE) -> list:
+    """Async version of multicall() for AsyncWeb3 (chunks are sent concurrently)"""
+    mc = _multicall_contract(w3)
+    chunks = [fns[i:i + chunk_size] for i in range(0, len(fns), chunk_size)]
+    raws = await asyncio.gather(*(
+        mc.functions.aggregate3([
+            (target, True, data) for target, data in map(_encode_call, chunk)
+        ]).call()
+        for chunk in chunks
+    ))
+    results = []
+    for chunk, raw in zip(chunks, raws):
+        results.extend(_decode_result(fn, ok, data) for fn, (ok, data) in zip(chunk, raw))
+    return results
+
+
 # =============================================================================
+# METRICS
+# =============================================================================
+
+# Histogram buckets (seconds): sub-ms signing up to slow receipts
+LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+METRIC_HELP = {
+    "basion_tx_build_seconds": "Time to build a tap transaction",
+    "basion_tx_sign_seconds": "Time to sign a transaction",
+    "basion_tx_send_seconds": "Time for eth_sendRawTransaction",
+    "basion_receipt_seconds": "Time from tracking a transaction to its receipt",
+    "basion_rpc_seconds": "JSON-RPC request latency by method",
+    "basion_rpc_requests_total": "JSON-RPC calls by method",
+    "basion_rpc_errors_total": "Failed RPC endpoint requests by endpoint",
+    "basion_receipts_total": "Resolved transactions by outcome",
+    "basion_txs_sent_total": "Transactions broadcast",
+    "basion_taps_total": "Taps sent by wallet",
+    "basion_errors_total": "Tap loop errors by exception class",
+    "basion_taps_per_second": "Recent tap rate by wallet",
+    "basion_fleet_taps_per_second": "Recent tap rate of all wallets",
+    "basion_blocks_total": "New block heads seen by the block clock",
+    "basion_blocks_missed_total": "Block numbers skipped between observed heads",
+    "basion_indexed_logs_total": "Contract logs applied by the event indexer by event",
+    "basion_api_cache_total": "API GET reads by cache outcome",
+    "basion_worker_restarts_total": "Fleet worker processes restarted after a crash by worker",
+    "basion_wallet_failures_total": "Fleet wallets dropped after their bot failed (e.g. in setup)",
+}
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
-class BasionBot:
+
+def _series(name: str, labels: tuple) -> str:
+    """Prometheus series name: name{label="value",...}"""
+    if not labels:
+        return name
+    return name + "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels) + "}"
+
+
+class Metrics:
     """
-    Complete Basion Bot implementation.
+    Process-wide counters, latency histograms and tap-rate meters.
+    
+    Bots, RPC pools and receipt trackers record into Metrics.shared().
+    Export as Prometheus text (serve() starts a local /metrics endpoint)
+    or as JSON snapshots (snapshot(), write_snapshots()).
     
     Usage:
-        bot = BasionBot(private_key="0x...", proxy="http://...")
-        bot.setup()  # First time only
-        bot.tap_loop(count=100)
+        metrics = Metrics.shared()
+        metrics.serve(9464)                       # http://127.0.0.1:9464/metrics
+        metrics.write_snapshots("metrics.json")   # every 10s
     """
     
-    def __init__(
-        self,
-        private_key: str,
-        proxy: Optional[str] = None,
-        rpc_url: str = RPC_URL,
-        burner_file: Optional[str] = None
-    ):
+    _shared: Optional["Metrics"] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS, rate_window: float = 60.0):
         """
-        Initialize Basion Bot.
-        
         Args:
-            private_key: Main wallet private key (0x...)
-            proxy: Optional proxy URL (http://user:pass@ip:port or socks5://...)
-            rpc_url: RPC endpoint URL
-            burner_file: Optional file to save/load burner wallet
+            buckets: Histogram bucket upper bounds (seconds)
+            rate_window: Time constant (s) of the taps/s moving averages
         """
-        # Validate private key
-        if not private_key.startswith("0x"):
-            private_key = "0x" + private_key
-        
-        self.private_key = private_key
-        self.proxy = proxy
-        self.rpc_url = rpc_url
-        
-        # Create main account
-        self.account = Account.from_key(private_key)
-        self.address = self.account.address
-        
-        # Setup Web3
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-        
-        # Setup contract
-        self.contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(CONTRACT_ADDRESS),
-            abi=CONTRACT_ABI
-        )
-        
-        # HTTP client with proxy
-        transport = None
-        if proxy:
-            transport = httpx.HTTPTransport(proxy=proxy)
-        self.http = httpx.Client(transport=transport, timeout=30.0)
-        
-        # Burner wallet (loaded or created later)
-        self.burner: Optional[BurnerWallet] = None
-        self.burner_file = burner_file or f"burner_{self.address[:10]}.json"
-        
-        # Nonce management for fast taps
-        self._nonce: Optional[int] = None
-        
-        # Gas price cache
-        self._gas_price: Optional[int] = None
-        self._gas_price_time: float = 0
-        
-        # Load existing burner if available
-        self._load_burner()
-        
-        self._log(f"Initialized bot for {self.address[:10]}...{self.address[-6:]}")
+        self.buckets = tuple(buckets)
+        self.rate_window = rate_window
+        self._counters: Dict[Tuple[str, tuple], float] = {}
+        # (name, labels) -> [count per bucket..., +Inf count, sum]
+        self._histograms: Dict[Tuple[str, tuple], list] = {}
+        self._meters: Dict[str, Tuple[float, float]] = {}  # wallet -> (rate, updated)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stop = threading.Event()
     
-    # =========================================================================
-    # LOGGING
-    # =========================================================================
+    @classmethod
+    def shared(cls) -> "Metrics":
+        """Process-wide metrics registry"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
     
-    def _log(self, message: str, level: str = "INFO"):
-        """Print log message with timestamp"""
-        timestamp = time.strftime("%H:%M:%S")
-        wallet_short = f"{self.address[:6]}...{self.address[-4:]}"
-        print(f"[{timestamp}] [{wallet_short}] {message}")
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
     
-    # =========================================================================
-    # BURNER WALLET MANAGEMENT
-    # =========================================================================
+    def inc(self, name: str, value: float = 1.0, **labels):
+        """Add to a counter"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
     
-    def _load_burner(self) -> bool:
-        """Load burner wallet from file if exists"""
-        try:
-            path = Path(self.burner_file)
-            if path.exists():
-                data = json.loads(path.read_text())
-                self.burner = BurnerWallet(
-                    address=data["address"],
-                    private_key=data["private_key"]
-                )
-                self._log(f"Loaded burner: {self.burner.address[:10]}...")
-                return True
-        except Exception as e:
-            self._log(f"Failed to load burner: {e}")
-        return False
+    def observe(self, name: str, seconds: float, **labels):
+        """Record a latency in a histogram"""
+        key = (name, tuple(sorted(labels.items())))
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            histogram[index] += 1
+            histogram[-1] += seconds
     
-    def _save_burner(self):
-        """Save burner wallet to file"""
-        if self.burner:
-            path = Path(self.burner_file)
-            path.write_text(json.dumps({
-                "address": self.burner.address,
-                "private_key": self.burner.private_key
-            }))
-            self._log(f"Saved burner to {self.burner_file}")
+    def since(self, name: str, start: float, **labels):
+        """Record perf_counter() - start in a histogram"""
+        self.observe(name, time.perf_counter() - start, **labels)
     
-    def create_burner(self) -> BurnerWallet:
-        """Create new random burner wallet"""
-        account = Account.create()
-        self.burner = BurnerWallet(
-            address=account.address,
-            private_key=account.key.hex()
-        )
-        self._save_burner()
-        self._log(f"Created new burner: {self.burner.address}")
-        return self.burner
+    def taps(self, wallet: str, taps: int):
+        """Count taps sent by a wallet and update its taps/s meter"""
+        self.inc("basion_taps_total", taps, wallet=wallet)
+        now = time.time()
+        with self._lock:
+            rate, updated = self._meters.get(wallet, (0.0, now))
+            decay = math.exp(-(now - updated) / self.rate_window)
+            self._meters[wallet] = (rate * decay + taps / self.rate_window, now)
     
-    # =========================================================================
-    # SIGNATURE HELPERS
-    # =========================================================================
+    def error(self, error: BaseException):
+        """Count an error by exception class"""
+        self.inc("basion_errors_total", error=type(error).__name__)
     
-    def _sign_message(self, message: str, use_burner: bool = False) -> str:
-        """Sign a message with main or burner wallet"""
-        key = self.burner.private_key if use_burner and self.burner else self.private_key
-        msg = encode_defunct(text=message)
-        signed = Account.sign_message(msg, private_key=key)
-        return signed.signature.hex()
+    def merge(self, counters: Dict[Tuple[str, tuple], float], histograms: Dict[Tuple[str, tuple], list]):
+        """
+        Add counter / histogram increments recorded elsewhere (e.g. by a
+        FleetSupervisor worker process, see raw()). Tap counts also feed
+        the taps/s meters.
+        """
+        for (name, labels), value in counters.items():
+            if name == "basion_taps_total" and value:
+                self.taps(dict(labels)["wallet"], value)
+            elif value:
+                self.inc(name, value, **dict(labels))
+        with self._lock:
+            for key, increment in histograms.items():
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+                for i, value in enumerate(increment):
+                    histogram[i] += value
     
-    def _get_timestamp(self) -> str:
-        """Get current timestamp in milliseconds"""
-        return str(int(time.time() * 1000))
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
     
-    # =========================================================================
-    # API METHODS
-    # =========================================================================
+    def tap_rates(self) -> Dict[str, float]:
+        """Exponentially weighted taps/s per wallet"""
+        now = time.time()
+        with self._lock:
+            meters = list(self._meters.items())
+        return {
+            wallet: rate * math.exp(-(now - updated) / self.rate_window)
+            for wallet, (rate, updated) in meters
+        }
     
-    def api_get_burner(self) -> Optional[str]:
-        """Check if burner exists on backend. Returns burner address or None."""
-        try:
-            resp = self.http.get(f"{API_BASE}/api/get-burner?wallet={self.address}")
-            data = resp.json()
-            if data.get("exists"):
-                return data.get("burnerAddress")
-        except Exception as e:
-            self._log(f"API get-burner error: {e}")
-        return None
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get((name, tuple(sorted(labels.items()))), 0.0)
     
-    def api_register_burner(self) -> bool:
-        """Register burner wallet with backend"""
-        if not self.burner:
-            raise ValueError("No burner wallet created")
+    def raw(self) -> Tuple[Dict[Tuple[str, tuple], float], Dict[Tuple[str, tuple], list]]:
+        """Copies of (counters, histograms) keyed by (name, labels), for merge()"""
+        with self._lock:
+            return dict(self._counters), {key: list(h) for key, h in self._histograms.items()}
+    
+    def _quantile(self, histogram: list, q: float) -> Optional[float]:
+        """Quantile estimate from bucket counts (linear within a bucket)"""
+        total = sum(histogram[:-1])
+        if not total:
+            return None
+        target, seen = q * total, 0
+        for i, count in enumerate(histogram[:-1]):
+            if seen + count >= target and count:
+                low = self.buckets[i - 1] if i else 0.0
+                high = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return round(low + (high - low) * (target - seen) / count, 6)
+            seen += count
+        return self.buckets[-1]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly view: counters, histogram summaries, taps/s"""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: list(h) for key, h in self._histograms.items()}
+        rates = self.tap_rates()
+        return {
+            "time": time.time(),
+            "counters": {_series(name, labels): value for (name, labels), value in counters.items()},
+            "histograms": {
+                _series(name, labels): {
+                    "count": sum(h[:-1]),
+                    "sum": round(h[-1], 6),
+                    "mean": round(h[-1] / max(1, sum(h[:-1])), 6),
+                    **{f"p{int(q * 100)}": self._quantile(h, q) for q in (0.5, 0.9, 0.99)},
+                }
+                for (name, labels), h in histograms.items()
+            },
+            "taps_per_second": {
+                "fleet": round(sum(rates.values()), 3),
+                "wallets": {wallet: round(rate, 3) for wallet, rate in rates.items()},
+            },
+        }
+    
+    def prometheus(self) -> str:
+        """Prometheus text exposition format"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((key, list(h)) for key, h in self._histograms.items())
+        lines, typed = [], set()
         
-        timestamp = self._get_timestamp()
-        message = f"Register burner {self.burner.address} for {self.address} at {timestamp}"
-        signature = self._sign_message(message)
+        def header(name: str, kind: str):
+            if name not in typed:
+                typed.add(name)
+                if name in METRIC_HELP:
+                    lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
         
-        try:
-            resp = self.http.post(
-                f"{API_BASE}/api/register-burner",
-                json={
-                    "mainWallet": self.address,
-                    "burnerWallet": self.burner.address,
-                    "privateKey": self.burner.private_key,
-                    "signature": signature,
-                    "timestamp": timestamp
-                }
-            )
-            data = resp.json()
-            if data.get("success"):
-                self._log("Registered burner with backend")
-                return True
-            else:
-                self._log(f"Register burner failed: {data.get('error')}")
-        except Exception as e:
-            self._log(f"API register-burner error: {e}")
-        return False
+        for (name, labels), value in counters:
+            header(name, "counter")
+            lines.append(f"{_series(name, labels)} {value:g}")
+        for (name, labels), h in histograms:
+            header(name, "histogram")
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), h[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f"{_series(name + '_bucket', labels + (('le', le),))} {cumulative}")
+            lines.append(f"{_series(name + '_sum', labels)} {h[-1]:.6f}")
+            lines.append(f"{_series(name + '_count', labels)} {cumulative}")
+        rates = self.tap_rates()
+        header("basion_taps_per_second", "gauge")
+        for wallet, rate in sorted(rates.items()):
+            lines.append(f"{_series('basion_taps_per_second', (('wallet', wallet),))} {rate:.4f}")
+        header("basion_fleet_taps_per_second", "gauge")
+        lines.append(f"basion_fleet_taps_per_second {sum(rates.values()):.4f}")
+        return "\n".join(lines) + "\n"
     
-    def api_get_user_info(self) -> Optional[Dict[str, Any]]:
-        """Get user info from API"""
-        try:
-            resp = self.http.get(f"{API_BASE}/api/user/{self.address}")
-            return resp.json()
-        except Exception as e:
-            self._log(f"API user info error: {e}")
-        return None
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
     
-    def api_tap(self, count: int = 1) -> Dict[str, Any]:
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> ThreadingHTTPServer:
         """
-        Send tap via API (slower than direct contract call).
-        Use this if you want server-side processing.
+        Serve /metrics (Prometheus text) and /metrics.json on a daemon thread.
+        Binds to localhost by default.
         """
-        timestamp = self._get_timestamp()
-        message = f"Basion tap for {self.address} at {timestamp}"
-        signature = self._sign_message(message)
+        metrics = self
         
-        resp = self.http.post(
-            f"{API_BASE}/api/tap",
-            json={
-                "wallet": self.address,
-                "signature": signature,
-                "timestamp": timestamp,
-                "count": count
-            }
-        )
-        return resp.json()
+        class Handler(http_server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.startswith("/metrics.json"):
+                    body, kind = json.dumps(metrics.snapshot()).encode(), "application/json"
+                elif self.path.startswith("/metrics"):
+                    body, kind = metrics.prometheus().encode(), "text/plain; version=0.0.4"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", kind)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass  # Keep scrapes out of the bot log
+        
+        self._server = http_server.ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="metrics-http").start()
+        print(f"[metrics] Serving http://{host}:{self._server.server_port}/metrics")
+        return self._server
+    
+    def write_snapshots(self, path: str, interval: float = 10.0) -> threading.Thread:
+        """Write snapshot() as JSON to `path` every `interval` seconds (atomic replace)"""
+        def loop():
+            while not self._stop.wait(interval):
+                self.dump(path)
+        
+        thread = threading.Thread(target=loop, daemon=True, name="metrics-json")
+        thread.start()
+        return thread
+    
+    def dump(self, path: str):
+        """Write one JSON snapshot to `path`"""
+        tmp = f"{path}.tmp"
+        try:
+            Path(tmp).write_text(json.dumps(self.snapshot(), indent=2))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"[metrics] Snapshot to {path} failed: {e}")
+    
+    def close(self):
+        """Stop the HTTP endpoint and snapshot writer"""
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+# Requests/s and burst per bucket kind or API route (None: learned from 429s).
+# basion.app limits API routes per client IP, i.e. per proxy.
+DEFAULT_RATE_LIMITS: Dict[str, Optional[Tuple[float, float]]] = {
+    "rpc": None,                         # Per RPC endpoint
+    "proxy": None,                       # Per proxy, all API routes together
+    "/api/user": (30 / 60, 5),           # 30 req/min per IP
+    "/api/boost/redeem": (5 / 60, 1),    # 5 req/min per IP, then a 5 min block
+}
+
+_ADDRESS_SEGMENT_RE = re.compile(r"/0x[0-9a-fA-F]{40}$")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with FIFO reservations and 429-driven backoff.
+    
+    reserve() takes a token immediately and returns how long the caller
+    must wait for it, so concurrent callers are served in arrival order.
+    Bots have one request in flight each, which makes that order fair
+    across wallets.
+    
+    The rate adapts AIMD-style: a 429 cuts it to 70% of the observed
+    request rate and pauses the bucket for Retry-After; while demand
+    exceeds the rate it grows by `increase` per second up to the
+    configured ceiling. Throughput settles just under the server limit.
+    A bucket without a rate is unlimited until its first 429.
+    """
+    
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        min_rate: float = 0.1,
+        increase: float = 0.05
+    ):
+        """
+        Args:
+            rate: Max requests/s (None = learn from 429s)
+            burst: Bucket size (default: one second of rate, at least 1)
+            min_rate: Floor for the adapted rate
+            increase: Relative rate increase per second while saturated
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst or max(1.0, rate or 1.0)
+        self.min_rate = min_rate
+        self.increase = increase
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self._gap: Optional[float] = None   # EWMA of time between sends (s)
+        self._last: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def observed(self) -> Optional[float]:
+        """Recent send rate (req/s)"""
+        return None if not self._gap else 1 / self._gap
+    
+    def _observe(self, send_at: float):
+        if self._last is not None:
+            gap = max(send_at - self._last, 0.0)
+            self._gap = gap if self._gap is None else self._gap + 0.05 * (gap - self._gap)
+        self._last = max(send_at, self._last or send_at)
+    
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens; returns the seconds to wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self.requests += 1
+            pause = max(0.0, self.paused_until - now)
+            if self.rate is None:
+                self._observe(now + pause)
+                return pause
+            elapsed = now - self.updated
+            self.updated = now
+            if self.tokens < 1 and (self.max_rate is None or self.rate < self.max_rate):
+                # Saturated: probe upwards (additive increase)
+                self.rate = self.rate * (1 + self.increase * elapsed)
+                if self.max_rate is not None:
+                    self.rate = min(self.rate, self.max_rate)
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate) - tokens
+            wait = max(-self.tokens / self.rate if self.tokens < 0 else 0.0, pause)
+            self._observe(now + wait)
+            return wait
+    
+    def throttle(self, retry_after: Optional[float] = None):
+        """Back off after a 429 / rate-limit error (multiplicative decrease)"""
+        with self._lock:
+            now = time.monotonic()
+            self.throttled += 1
+            if now >= self.paused_until:
+                # One decrease per pause: a burst of 429s counts once
+                current = min(self.rate or float("inf"), self.observed or self.rate or 1.0)
+                self.rate = max(self.min_rate, current * 0.7)
+                self.burst = min(self.burst, max(1.0, self.rate))
+                self.tokens = min(self.tokens, 0.0)
+                self.updated = now
+            self.paused_until = max(self.paused_until, now + (retry_after or 1 / self.rate))
+    
+    def set_limit(self, rate: Optional[float], burst: Optional[float] = None):
+        """Change the configured ceiling (rate / burst as in __init__)"""
+        with self._lock:
+            if rate is not None and (self.rate is None or self.rate >= (self.max_rate or rate)):
+                self.rate = rate  # Not backing off from a 429: use the new limit
+            elif rate is not None:
+                self.rate = min(self.rate, rate)
+            self.max_rate = rate
+            self.burst = burst or max(1.0, self.rate or 1.0)
+            self.tokens = min(self.tokens, self.burst)
+    
+    def acquire(self, tokens: float = 1.0):
+        """Block until tokens are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, tokens: float = 1.0):
+        """Wait (without blocking the event loop) until tokens are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "rate": None if self.rate is None else round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "observed": None if self.observed is None else round(self.observed, 3),
+            "requests": self.requests,
+            "throttled": self.throttled,
+        }
+
+
+class RateLimiter:
+    """
+    Token buckets shared by a fleet: one per RPC endpoint, one per proxy
+    and one per (API route, proxy). RPC pool providers and SharedClients
+    HTTP clients use RateLimiter.shared() unless given their own.
+    
+    Usage:
+        limiter = RateLimiter({"rpc": (25, 25), "/api/tap": (2, 5)})
+        clients = SharedClients(limiter=limiter)
+    """
+    
+    _shared: Optional["RateLimiter"] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Optional[Tuple[float, float]]]] = None,
+        direct_limits: Optional[Dict[str, Optional[Tuple[float, float]]]] = None
+    ):
+        """
+        Args:
+            limits: (requests/s, burst) or None per kind ("rpc", "proxy")
+                or API route ("/api/tap"), merged over DEFAULT_RATE_LIMITS
+            direct_limits: Limits for API requests sent without a proxy
+                (default: `limits`)
+        """
+        self.limits = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+        self.direct_limits = {**self.limits, **(direct_limits or {})}
+        self._buckets: Dict[Tuple[str, Optional[str]], TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls) -> "RateLimiter":
+        """Process-wide limiter (default limits)"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
+    def bucket(self, kind: str, key: Optional[str] = None) -> TokenBucket:
+        """Bucket for a kind / route and key (endpoint URL or proxy)"""
+        with self._lock:
+            bucket = self._buckets.get((kind, key))
+            if bucket is None:
+                rate, burst = self._limit(kind, key)
+                bucket = self._buckets[(kind, key)] = TokenBucket(rate, burst)
+            return bucket
+    
+    def _limit(self, kind: str, key: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
+        limits = self.direct_limits if key is None else self.limits
+        return limits.get(kind) or (None, None)
+    
+    def update(
+        self,
+        limits: Optional[Dict[str, Optional[Tuple[float, float]]]] = None,
+        direct_limits: Optional[Dict[str, Optional[Tuple[float, float]]]] = None
+    ):
+        """Replace the limits (as in __init__), existing buckets included"""
+        with self._lock:
+            self.limits = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+            self.direct_limits = {**self.limits, **(direct_limits or {})}
+            for (kind, key), bucket in self._buckets.items():
+                bucket.set_limit(*self._limit(kind, key))
+    
+    @staticmethod
+    def route(path: str) -> str:
+        """API route of a request path (/api/user/0x... -> /api/user)"""
+        return _ADDRESS_SEGMENT_RE.sub("", path)
+    
+    def api_buckets(self, proxy: Optional[str], path: str) -> Tuple[TokenBucket, TokenBucket]:
+        """(proxy bucket, route bucket) for an API request"""
+        return self.bucket("proxy", proxy), self.bucket(self.route(path), proxy)
+    
+    def http_hooks(self, proxy: Optional[str], asynchronous: bool = False) -> Dict[str, list]:
+        """httpx event hooks that rate-limit API requests sent through a proxy"""
+        def throttle(response: httpx.Response):
+            if response.status_code == 429:
+                retry_after = _RPCPool._retry_after(response.headers.get("retry-after"))
+                self.api_buckets(proxy, response.request.url.path)[1].throttle(retry_after)
+        
+        if asynchronous:
+            async def acquire_async(request: httpx.Request):
+                for bucket in self.api_buckets(proxy, request.url.path):
+                    await bucket.acquire_async()
+            
+            async def throttle_async(response: httpx.Response):
+                throttle(response)
+            
+            return {"request": [acquire_async], "response": [throttle_async]}
+        
+        def acquire(request: httpx.Request):
+            for bucket in self.api_buckets(proxy, request.url.path):
+                bucket.acquire()
+        
+        return {"request": [acquire], "response": [throttle]}
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-bucket stats keyed "kind key" """
+        with self._lock:
+            buckets = list(self._buckets.items())
+        return {f"{kind} {key or 'direct'}": b.stats() for (kind, key), b in buckets}
+
+
+# =============================================================================
+# RPC POOL (MULTI-ENDPOINT PROVIDER)
+# =============================================================================
+
+# JSON-RPC errors that mean "this node is busy", not "this request is bad"
+_RATE_LIMIT_CODES = {-32005, -32016, -32029, 429}
+_RATE_LIMIT_HINTS = ("rate limit", "too many requests", "exceeded", "capacity", "try again")
+
+
+class RPCPoolError(Exception):
+    """Every endpoint in an RPC pool failed for a request"""
+
+
+class RPCRateLimitError(RPCPoolError):
+    """An RPC endpoint answered with HTTP 429 or a rate-limit error"""
+
+
+@dataclass
+class RPCEndpoint:
+    """Latency / health stats of one endpoint in an RPC pool"""
+    url: str
+    latency: Optional[float] = None  # EWMA of successful response time (s)
+    error_rate: float = 0.0     # EWMA of failures (0..1)
+    requests: int = 0
+    errors: int = 0
+    cooldown_until: float = 0.0
+    
+    @property
+    def healthy(self) -> bool:
+        return time.time() >= self.cooldown_until
+    
+    @property
+    def score(self) -> float:
+        """Lower is better: latency penalised by recent failures (unmeasured first)"""
+        if self.latency is None:
+            return 0.0
+        return self.latency * (1 + 10 * self.error_rate)
+    
+    def record(self, latency: Optional[float] = None, error: bool = False, alpha: float = 0.2):
+        self.requests += 1
+        self.errors += error
+        self.error_rate += alpha * (error - self.error_rate)
+        if latency is not None:
+            self.latency = latency if self.latency is None else self.latency + alpha * (latency - self.latency)
+    
+    def cool_down(self, seconds: float):
+        self.cooldown_until = max(self.cooldown_until, time.time() + seconds)
+
+
+class _RPCPool:
+    """
+    Endpoint ranking and failure handling shared by RPCPoolProvider and
+    AsyncRPCPoolProvider (transport is left to the subclasses, JSON-RPC
+    framing to web3's provider bases or _JSONCodec).
+    """
+    
+    def _init_pool(
+        self,
+        urls: list,
+        broadcast: int,
+        timeout: float,
+        cooldown: float,
+        explore_every: int,
+        limiter: Optional[RateLimiter],
+        retries: int
+    ):
+        if not urls:
+            raise ValueError("RPC pool needs at least one endpoint")
+        self.endpoints = [RPCEndpoint(url) for url in urls]
+        self.broadcast = broadcast
+        self.timeout = timeout
+        self.cooldown = cooldown
+        self.explore_every = explore_every
+        self.limiter = limiter or RateLimiter.shared()
+        self.retries = retries
+        self.metrics = Metrics.shared()
+        self._requests = 0
+        self._pool_lock = threading.Lock()
+    
+    def __str__(self) -> str:
+        return f"RPC pool: {', '.join(e.url for e in self.endpoints)}"
+    
+    def _ranked(self) -> list:
+        """
+        Endpoints in the order to try: healthy ones fastest first, then
+        cooling-down ones as a last resort. Every explore_every requests a
+        slower healthy endpoint goes first so its latency stays current.
+        """
+        with self._pool_lock:
+            self._requests += 1
+            explore = self.explore_every and self._requests % self.explore_every == 0
+        healthy = sorted((e for e in self.endpoints if e.healthy), key=lambda e: e.score)
+        cooling = sorted(
+            (e for e in self.endpoints if not e.healthy), key=lambda e: e.cooldown_until
+        )
+        if explore and len(healthy) > 1:
+            healthy.insert(0, healthy.pop(self._requests % (len(healthy) - 1) + 1))
+        return healthy + cooling
+    
+    @staticmethod
+    def _rate_limited(error: Dict[str, Any]) -> bool:
+        msg = str(error.get("message", "")).lower()
+        return error.get("code") in _RATE_LIMIT_CODES or any(h in msg for h in _RATE_LIMIT_HINTS)
+    
+    @staticmethod
+    def _retry_after(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value else None
+        except ValueError:
+            return None
+    
+    def _failed(self, endpoint: RPCEndpoint, cooldown: Optional[float] = None):
+        endpoint.record(error=True)
+        self.metrics.inc("basion_rpc_errors_total", endpoint=endpoint.url)
+        endpoint.cool_down(self.cooldown if cooldown is None else cooldown)
+    
+    def _bucket(self, endpoint: RPCEndpoint) -> TokenBucket:
+        return self.limiter.bucket("rpc", endpoint.url)
+    
+    def _throttled(self, endpoint: RPCEndpoint, retry_after: Optional[float]) -> RPCRateLimitError:
+        self._failed(endpoint, retry_after)
+        self._bucket(endpoint).throttle(retry_after)
+        return RPCRateLimitError(f"{endpoint.url}: rate limited")
+    
+    def _retry(self, attempt: int, last: Optional[Exception]) -> bool:
+        """
+        Go round the endpoints again after every one failed (rate limits,
+        5xx, network errors); rate-limit buckets pace the retry.
+        """
+        return isinstance(last, RPCPoolError) and attempt < self.retries
+    
+    def _handle(
+        self,
+        endpoint: RPCEndpoint,
+        status: int,
+        retry_after: Optional[str],
+        content: bytes,
+        elapsed: float
+    ) -> Tuple[Any, bool]:
+        """
+        Classify an HTTP response. Returns (result, failover) where result
+        is the decoded JSON-RPC response, or an exception if failover.
+        """
+        if status == 429:
+            return self._throttled(endpoint, self._retry_after(retry_after)), True
+        if status >= 500:
+            # Brief cooldown: 5xx is often a single overloaded backend
+            self._failed(endpoint, min(self.cooldown, 5.0))
+            return RPCPoolError(f"{endpoint.url}: HTTP {status}"), True
+        try:
+            response = self.decode_rpc_response(content)
+        except Exception as e:
+            self._failed(endpoint)
+            return RPCPoolError(f"{endpoint.url}: bad response ({e})"), True
+        if isinstance(response, dict) and "error" in response:
+            if self._rate_limited(response["error"]):
+                return self._throttled(endpoint, None), True
+        if isinstance(response, list):
+            # Batch responses may come back in any order
+            response.sort(key=lambda r: r.get("id") if isinstance(r.get("id"), int) else -1)
+        endpoint.record(latency=elapsed)
+        return response, False
+    
+    def _transport_failed(self, endpoint: RPCEndpoint, error: Exception) -> Tuple[Any, bool]:
+        self._failed(endpoint)
+        return RPCPoolError(f"{endpoint.url}: {type(error).__name__}: {error}"), True
+    
+    def _count_batch(self, requests: list):
+        """One JSON-RPC call per batch member, by method"""
+        for method, _ in requests:
+            self.metrics.inc("basion_rpc_requests_total", method=method)
+    
+    @property
+    def _broadcasts(self) -> bool:
+        return self.broadcast > 1 and len(self.endpoints) > 1
+    
+    def _untried(self, targets: list) -> tuple:
+        """Endpoints to skip after a failed broadcast (none if it reached all)"""
+        return tuple(targets) if len(targets) < len(self.endpoints) else ()
+    
+    def _give_up(self, last: Optional[Exception]):
+        raise RPCPoolError(f"All RPC endpoints failed (last: {last})") from last
+    
+    @staticmethod
+    def _first_node_error(body: bytes, responses: list) -> Any:
+        """
+        Broadcast result when no node accepted the tx outright.
+        
+        A node answering "already known" has the tx in its mempool, which
+        counts as accepted: the response carries the tx hash instead of the
+        error. Otherwise the first real rejection (e.g. "nonce too low" for
+        the nonce manager), or None if every target was unreachable.
+        """
+        errors = [r for r in responses if not isinstance(r, Exception)]
+        for response in errors:
+            message = str(response.get("error", {}).get("message", "")).lower()
+            if "already known" in message:
+                raw_tx = json.loads(body)["params"][0]
+                tx_hash = "0x" + keccak(bytes(HexBytes(raw_tx))).hex()
+                return {"jsonrpc": "2.0", "id": response.get("id"), "result": tx_hash}
+        return errors[0] if errors else None
+    
+    def stats(self) -> list:
+        """Per-endpoint stats, best endpoint first"""
+        return [
+            {
+                "url": e.url,
+                "latency_ms": None if e.latency is None else round(e.latency * 1000, 1),
+                "error_rate": round(e.error_rate, 3),
+                "requests": e.requests,
+                "errors": e.errors,
+                "healthy": e.healthy,
+            }
+            for e in self._ranked()
+        ]
+
+
+class _SyncRPCPool(_RPCPool):
+    """
+    Web3 provider spreading requests over several RPC endpoints.
+    
+    - Keep-alive httpx session per endpoint
+    - Reads go to the healthy endpoint with the best latency / error score
+    - Requests are paced by a token bucket per endpoint (RateLimiter)
+    - Rate limits (HTTP 429, -32005, ...), 5xx and network errors put the
+      endpoint on cooldown and the request fails over to the next one;
+      429s also slow the endpoint's bucket down
+    - eth_sendRawTransaction is broadcast to the `broadcast` best endpoints
+      in parallel; the first node to accept it wins
+    
+    Usage:
+        w3 = Web3(RPCPoolProvider(["https://mainnet.base.org", "https://..."]))
+    """
+    
+    def __init__(
+        self,
+        urls: list,
+        broadcast: int = 3,
+        timeout: float = 10.0,
+        cooldown: float = 30.0,
+        explore_every: int = 50,
+        proxy: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        retries: int = 2
+    ):
+        """
+        Args:
+            urls: RPC endpoint URLs
+            broadcast: Endpoints each raw transaction is sent to
+            timeout: Per-request timeout (s)
+            cooldown: Seconds a failing / rate-limited endpoint is skipped
+                (HTTP Retry-After takes precedence)
+            explore_every: Probe a slower endpoint every N requests (0 = never)
+            proxy: Optional proxy for all endpoints
+            limiter: Rate limiter with a bucket per endpoint (default: shared)
+            retries: Extra rounds over the endpoints when all of them fail
+        """
+        super().__init__()
+        self._init_pool(list(urls), broadcast, timeout, cooldown, explore_every, limiter, retries)
+        limits = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+        self._clients = {
+            e.url: httpx.Client(timeout=timeout, limits=limits, proxy=proxy)
+            for e in self.endpoints
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, broadcast * 4), thread_name_prefix="rpc-broadcast"
+        )
+    
+    def _post(self, endpoint: RPCEndpoint, body: bytes) -> Tuple[Any, bool]:
+        self._bucket(endpoint).acquire()
+        start = time.perf_counter()
+        try:
+            resp = self._clients[endpoint.url].post(
+                endpoint.url, content=body, headers={"Content-Type": "application/json"}
+            )
+        except httpx.HTTPError as e:
+            return self._transport_failed(endpoint, e)
+        return self._handle(
+            endpoint, resp.status_code, resp.headers.get("retry-after"),
+            resp.content, time.perf_counter() - start
+        )
+    
+    def _request(self, body: bytes, skip: tuple = ()) -> Any:
+        last, attempt = None, 0
+        while attempt == 0 or self._retry(attempt - 1, last):
+            attempt += 1
+            for endpoint in self._ranked():
+                if endpoint in skip:
+                    continue
+                result, failover = self._post(endpoint, body)
+                if not failover:
+                    return result
+                last = result
+        self._give_up(last)
+    
+    def _broadcast(self, body: bytes) -> Any:
+        targets = self._ranked()[:self.broadcast]
+        futures = [self._executor.submit(self._post, e, body) for e in targets]
+        responses = []
+        for future in as_completed(futures):
+            result, failover = future.result()
+            if not failover and "error" not in result:
+                return result  # Stragglers finish in the background
+            responses.append(result)
+        node_error = self._first_node_error(body, responses)
+        if node_error is not None:
+            return node_error
+        # Every broadcast target was unavailable: try the remaining endpoints
+        return self._request(body, skip=self._untried(targets))
+    
+    def make_request(self, method, params) -> Any:
+        self.metrics.inc("basion_rpc_requests_total", method=method)
+        start = time.perf_counter()
+        body = self.encode_rpc_request(method, params)
+        try:
+            if method == "eth_sendRawTransaction" and self._broadcasts:
+                return self._broadcast(body)
+            return self._request(body)
+        finally:
+            self.metrics.since("basion_rpc_seconds", start, method=method)
+    
+    def make_batch_request(self, requests: list) -> Any:
+        self._count_batch(requests)
+        return self._request(self.encode_batch_rpc_request(requests))
+    
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        try:
+            response = self.make_request("web3_clientVersion", [])
+        except Exception:
+            if show_traceback:
+                raise
+            return False
+        return "error" not in response
+    
+    def close(self):
+        """Close all endpoint sessions"""
+        self._executor.shutdown(wait=False)
+        for client in self._clients.values():
+            client.close()
+
+
+class _AsyncRPCPool(_RPCPool):
+    """
+    Async version of RPCPoolProvider (httpx.AsyncClient per endpoint,
+    raw transactions broadcast with asyncio tasks).
+    
+    Usage:
+        w3 = AsyncWeb3(AsyncRPCPoolProvider(["https://mainnet.base.org", "https://..."]))
+    """
+    
+    def __init__(
+        self,
+        urls: list,
+        broadcast: int = 3,
+        timeout: float = 10.0,
+        cooldown: float = 30.0,
+        explore_every: int = 50,
+        proxy: Optional[str] = None,
+        limiter: Optional[RateLimiter] = None,
+        retries: int = 2
+    ):
+        """Same arguments as RPCPoolProvider"""
+        super().__init__()
+        self._init_pool(list(urls), broadcast, timeout, cooldown, explore_every, limiter, retries)
+        limits = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+        self._clients = {
+            e.url: httpx.AsyncClient(timeout=timeout, limits=limits, proxy=proxy)
+            for e in self.endpoints
+        }
+        self._background: set = set()
+    
+    async def _post(self, endpoint: RPCEndpoint, body: bytes) -> Tuple[Any, bool]:
+        await self._bucket(endpoint).acquire_async()
+        start = time.perf_counter()
+        try:
+            resp = await self._clients[endpoint.url].post(
+                endpoint.url, content=body, headers={"Content-Type": "application/json"}
+            )
+        except httpx.HTTPError as e:
+            return self._transport_failed(endpoint, e)
+        return self._handle(
+            endpoint, resp.status_code, resp.headers.get("retry-after"),
+            resp.content, time.perf_counter() - start
+        )
+    
+    async def _request(self, body: bytes, skip: tuple = ()) -> Any:
+        last, attempt = None, 0
+        while attempt == 0 or self._retry(attempt - 1, last):
+            attempt += 1
+            for endpoint in self._ranked():
+                if endpoint in skip:
+                    continue
+                result, failover = await self._post(endpoint, body)
+                if not failover:
+                    return result
+                last = result
+        self._give_up(last)
+    
+    async def _broadcast(self, body: bytes) -> Any:
+        targets = self._ranked()[:self.broadcast]
+        tasks = [asyncio.ensure_future(self._post(e, body)) for e in targets]
+        responses = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result, failover = await next_done
+                if not failover and "error" not in result:
+                    return result
+                responses.append(result)
+        finally:
+            # Let stragglers finish (their stats still count) without awaiting them
+            for task in tasks:
+                if not task.done():
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+        node_error = self._first_node_error(body, responses)
+        if node_error is not None:
+            return node_error
+        return await self._request(body, skip=self._untried(targets))
+    
+    async def make_request(self, method, params) -> Any:
+        self.metrics.inc("basion_rpc_requests_total", method=method)
+        start = time.perf_counter()
+        body = self.encode_rpc_request(method, params)
+        try:
+            if method == "eth_sendRawTransaction" and self._broadcasts:
+                return await self._broadcast(body)
+            return await self._request(body)
+        finally:
+            self.metrics.since("basion_rpc_seconds", start, method=method)
+    
+    async def make_batch_request(self, requests: list) -> Any:
+        self._count_batch(requests)
+        return await self._request(self.encode_batch_rpc_request(requests))
+    
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        try:
+            response = await self.make_request("web3_clientVersion", [])
+        except Exception:
+            if show_traceback:
+                raise
+            return False
+        return "error" not in response
+    
+    async def disconnect(self):
+        """Close all endpoint sessions"""
+        await asyncio.gather(*(c.aclose() for c in self._clients.values()))
+
+
+class _JSONCodec:
+    """JSON-RPC framing for a pool used without web3 (see RPCPool)"""
+    
+    def __init__(self):
+        self.request_counter = itertools.count()
+    
+    def encode_rpc_request(self, method: str, params: Any) -> bytes:
+        return json.dumps({
+            "jsonrpc": "2.0", "method": method, "params": params or [],
+            "id": next(self.request_counter)
+        }).encode()
+    
+    def encode_batch_rpc_request(self, requests: list) -> bytes:
+        return b"[" + b", ".join(self.encode_rpc_request(m, p) for m, p in requests) + b"]"
+    
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes) -> Any:
+        return json.loads(raw_response)
+
+
+class RPCPool(_SyncRPCPool, _JSONCodec):
+    """
+    RPCPoolProvider without web3: same endpoints, rate limits and failover,
+    raw JSON-RPC responses. For light tools (`python basion_bot.py status`)
+    that shouldn't import web3.
+    
+    Usage:
+        pool = RPCPool(["https://mainnet.base.org"])
+        block = int(pool.make_request("eth_blockNumber", [])["result"], 16)
+    """
+
+
+_PROVIDER_BASES = {
+    "RPCPoolProvider": (_SyncRPCPool, "web3.providers", "JSONBaseProvider"),
+    "AsyncRPCPoolProvider": (_AsyncRPCPool, "web3.providers.async_base", "AsyncJSONBaseProvider"),
+}
+_provider_lock = threading.Lock()
+
+
+def _provider_class(name: str) -> type:
+    """
+    RPCPoolProvider / AsyncRPCPoolProvider: the pool on web3's JSON-RPC
+    provider base, created on first use so importing this module doesn't
+    import web3.
+    """
+    with _provider_lock:
+        cls = globals().get(name)
+        if cls is None:
+            pool, module, base = _PROVIDER_BASES[name]
+            cls = type(name, (pool, getattr(importlib.import_module(module), base)), {
+                "__module__": __name__, "__doc__": pool.__doc__
+            })
+            globals()[name] = cls
+        return cls
+
+
+def __getattr__(name: str) -> Any:
+    # `from basion_bot import RPCPoolProvider` still works (PEP 562)
+    if name in _PROVIDER_BASES:
+        return _provider_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _rpc_urls(rpc_url: str) -> list:
+    """Split a comma-separated RPC setting into endpoint URLs"""
+    return [url.strip() for url in rpc_url.split(",") if url.strip()]
+
+
+def make_provider(rpc_url: str, limiter: Optional[RateLimiter] = None):
+    """
+    RPCPoolProvider for "url" or "url1,url2,..." (a single endpoint still
+    goes through the pool for shared rate limiting and 429 backoff)
+    """
+    return _provider_class("RPCPoolProvider")(_rpc_urls(rpc_url), limiter=limiter)
+
+
+def make_async_provider(rpc_url: str, limiter: Optional[RateLimiter] = None):
+    """AsyncRPCPoolProvider for "url" or "url1,url2,..." """
+    return _provider_class("AsyncRPCPoolProvider")(_rpc_urls(rpc_url), limiter=limiter)
+
+
+def _batch_request(provider, requests: list) -> Optional[list]:
+    """
+    Send requests as one JSON-RPC batch.
+    
+    Returns:
+        Responses in request order, or None if the endpoint does not take
+        batches. Transport errors are raised, not taken as a rejection.
+    """
+    try:
+        responses = provider.make_batch_request(requests)
+    except (AttributeError, NotImplementedError):
+        return None  # Provider without batch support
+    except Exception as e:
+        if "batch" in str(e).lower():
+            return None
+        raise
+    # A rejected batch comes back as a single error object
+    if not isinstance(responses, list) or len(responses) != len(requests):
+        return None
+    return responses
+
+
+# =============================================================================
+# NONCE MANAGEMENT
+# =============================================================================
+
+# Matches the expected nonce in node errors, e.g.
+# "nonce too low: address 0x..., tx: 3 state: 5" or "next nonce 5, tx nonce 3"
+_NONCE_HINT_RE = re.compile(r"(?:state:?|next nonce:?)\s*(\d+)")
+
+
+@dataclass
+class _NonceState:
+    """Per-address nonce bookkeeping"""
+    w3: Any
+    is_async: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    next_nonce: Optional[int] = None
+    holes: set = field(default_factory=set)
+    confirmed: int = -1
+    last_progress: float = field(default_factory=time.time)
+
+
+class NonceManager:
+    """
+    Thread-safe nonce allocator shared by all bots in the process.
+    
+    Nonces are handed out from a local counter per address, so the hot path
+    makes no RPC calls after the first one. A background thread reconciles
+    the counters of addresses with unconfirmed nonces with the chain (one
+    JSON-RPC batch per provider) and resyncs on gaps (dropped txs) and
+    stuck nonces.
+    
+    Usage:
+        nonce = NonceManager.shared().allocate(address, w3)
+    """
+    
+    _shared: Optional["NonceManager"] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        reconcile_interval: float = 15.0,
+        stuck_after: float = 60.0,
+        batch_size: int = 100
+    ):
+        """
+        Args:
+            reconcile_interval: Seconds between background chain checks
+            stuck_after: Seconds without on-chain progress before pending
+                nonces are considered stuck
+            batch_size: Addresses per JSON-RPC batch when reconciling
+        """
+        self.reconcile_interval = reconcile_interval
+        self.stuck_after = stuck_after
+        self.batch_size = batch_size
+        self._batching = True  # Cleared if the node rejects batch requests
+        self._states: Dict[str, _NonceState] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @classmethod
+    def shared(cls) -> "NonceManager":
+        """Process-wide default instance"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
+    def _log(self, message: str):
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] [nonce] {message}")
+    
+    def _state(self, address: str, w3) -> _NonceState:
+        with self._lock:
+            state = self._states.get(address)
+            if state is None:
+                state = self._states[address] = _NonceState(
+                    w3=w3, is_async=getattr(w3.provider, "is_async", False)
+                )
+            if self._thread is None:
+                self.start()
+            return state
+    
+    # -------------------------------------------------------------------------
+    # Allocation
+    # -------------------------------------------------------------------------
+    
+    def allocate(self, address: str, w3) -> int:
+        """Get next nonce for address (fetches from chain only on first use)"""
+        state = self._state(address, w3)
+        with state.lock:
+            if state.holes:
+                nonce = min(state.holes)
+                state.holes.discard(nonce)
+                return nonce
+            if state.next_nonce is None:
+                state.next_nonce = w3.eth.get_transaction_count(address, 'pending')
+            nonce = state.next_nonce
+            state.next_nonce += 1
+            return nonce
+    
+    async def allocate_async(self, address: str, w3) -> int:
+        """Async version of allocate() for AsyncWeb3 instances"""
+        state = self._state(address, w3)
+        if state.next_nonce is None and not state.holes:
+            chain_nonce = await w3.eth.get_transaction_count(address, 'pending')
+            with state.lock:
+                if state.next_nonce is None:
+                    state.next_nonce = chain_nonce
+        return self.allocate(address, w3)
+    
+    def seed(self, address: str, w3, next_nonce: int):
+        """Start from a known next nonce (e.g. from a StateStore) instead of the chain"""
+        state = self._state(address, w3)
+        with state.lock:
+            if state.next_nonce is None and not state.holes:
+                state.next_nonce = next_nonce
+    
+    def next_nonce(self, address: str) -> Optional[int]:
+        """Next nonce to be handed out for address (None if not known yet)"""
+        state = self._states.get(address)
+        return state.next_nonce if state else None
+    
+    def release(self, address: str, nonce: int):
+        """Return a nonce whose transaction was never broadcast"""
+        state = self._states.get(address)
+        if state is None:
+            return
+        with state.lock:
+            if state.next_nonce is None or nonce >= state.next_nonce:
+                return
+            if nonce == state.next_nonce - 1:
+                state.next_nonce -= 1
+            else:
+                # Later nonces are already out; fill this gap first
+                state.holes.add(nonce)
+    
+    def resync(self, address: str, hint: Optional[int] = None):
+        """
+        Resync address with the chain.
+        
+        Args:
+            hint: Next valid nonce reported by the node. Without a hint the
+                nonce is re-fetched from the chain on the next allocation.
+        """
+        state = self._states.get(address)
+        if state is None:
+            return
+        with state.lock:
+            state.next_nonce = hint
+            state.holes.clear()
+    
+    @staticmethod
+    def is_nonce_error(error: Exception) -> bool:
+        """Check if a send error means the nonce was already used"""
+        msg = str(error).lower()
+        return "nonce too low" in msg or "replacement transaction underpriced" in msg
+    
+    @staticmethod
+    def is_already_known(error: Exception) -> bool:
+        """Check if a send error means the node already has this exact tx"""
+        return "already known" in str(error).lower()
+    
+    def handle_error(self, address: str, nonce: int, error: Exception) -> bool:
+        """
+        Update state after a failed send of `nonce`.
+        
+        Returns True if it was a nonce error (and the address was resynced).
+        """
+        if not self.is_nonce_error(error):
+            self.release(address, nonce)
+            return False
+        
+        match = _NONCE_HINT_RE.search(str(error).lower())
+        hint = int(match.group(1)) if match else None
+        self._log(f"{address[:10]}... nonce {nonce} rejected, resync to {hint if hint is not None else 'chain'}")
+        self.resync(address, hint)
+        return True
+    
+    # -------------------------------------------------------------------------
+    # Background reconciliation
+    # -------------------------------------------------------------------------
+    
+    def start(self):
+        """Start background reconciliation thread"""
+        if self._thread is not None:
+            return
+        # A fresh event per thread, so a restart can't revive a stopping one
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._reconcile_loop, args=(self._stop,),
+            name="nonce-reconciler", daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self):
+        """Stop background reconciliation thread"""
+        self._stop.set()
+        self._thread = None
+    
+    def forget(self, address: str):
+        """Stop tracking address (stops the thread once nothing is tracked)"""
+        with self._lock:
+            self._states.pop(address, None)
+            if not self._states:
+                self.stop()
+    
+    def detach(self, w3):
+        """Forget every address using w3 (call before closing its provider)"""
+        with self._lock:
+            for address in [a for a, state in self._states.items() if state.w3 is w3]:
+                del self._states[address]
+            if not self._states:
+                self.stop()
+    
+    @staticmethod
+    def _unconfirmed(state: _NonceState) -> bool:
+        """Handed out nonces not mined yet (only these can be stuck or lost)"""
+        return state.next_nonce is not None and state.next_nonce > state.confirmed
+    
+    def _reconcile_loop(self, stop: threading.Event):
+        while not stop.wait(self.reconcile_interval):
+            # Async states are reconciled from the event loop via reconcile_async()
+            by_provider: Dict[int, list] = {}
+            with self._lock:
+                for address, state in self._states.items():
+                    if not state.is_async and self._unconfirmed(state):
+                        by_provider.setdefault(id(state.w3.provider), []).append((address, state))
+            for items in by_provider.values():
+                for i in range(0, len(items), self.batch_size):
+                    chunk = items[i:i + self.batch_size]
+                    try:
+                        self.reconcile_many(chunk)
+                    except Exception as e:
+                        self._log(f"Reconcile failed for {len(chunk)} addresses: {e}")
+    
+    def reconcile(self, address: str, state: _NonceState):
+        """Compare local counter with chain and fix gaps / stuck nonces"""
+        self.reconcile_many([(address, state)])
+    
+    def reconcile_many(self, items: list):
+        """
+        reconcile() for [(address, state), ...] sharing one provider, with
+        the latest / pending counts fetched in one JSON-RPC batch
+        """
+        items = [(address, state) for address, state in items if state.next_nonce is not None]
+        if not items:
+            return
+        requests = [
+            ("eth_getTransactionCount", [address, tag])
+            for address, _ in items for tag in ("latest", "pending")
+        ]
+        counts = self._fetch_counts(items[0][1].w3.provider, requests)
+        for i, (address, state) in enumerate(items):
+            self._apply_chain_state(address, state, counts[2 * i], counts[2 * i + 1])
+    
+    def _fetch_counts(self, provider, requests: list) -> list:
+        """Transaction counts for requests, batched when the node allows"""
+        responses = None
+        if self._batching:
+            responses = _batch_request(provider, requests)
+            self._batching = responses is not None
+        if responses is None:
+            responses = [provider.make_request(method, params) for method, params in requests]
+        counts = []
+        for response in responses:
+            if "error" in response:
+                raise ValueError(response["error"])
+            result = response["result"]
+            counts.append(int(result, 16) if isinstance(result, str) else result)
+        return counts
+    
+    async def reconcile_async(self, address: str):
+        """Async version of reconcile() for AsyncWeb3 instances"""
+        state = self._states.get(address)
+        if state is None or not self._unconfirmed(state):
+            return
+        latest = await state.w3.eth.get_transaction_count(address, 'latest')
+        pending = await state.w3.eth.get_transaction_count(address, 'pending')
+        self._apply_chain_state(address, state, latest, pending)
+    
+    def _apply_chain_state(self, address: str, state: _NonceState, latest: int, pending: int):
+        now = time.time()
+        with state.lock:
+            if state.next_nonce is None:
+                return
+            if latest > state.confirmed:
+                state.confirmed = latest
+                state.last_progress = now
+            
+            if pending > state.next_nonce:
+                # Sent from elsewhere (wallet UI, another process)
+                self._log(f"{address[:10]}... behind chain ({state.next_nonce} < {pending}), resync")
+                state.next_nonce = pending
+                state.holes = {n for n in state.holes if n >= pending}
+            elif latest >= state.next_nonce:
+                # Everything we handed out is mined
+                state.last_progress = now
+            elif now - state.last_progress > self.stuck_after:
+                if pending < state.next_nonce:
+                    # Node forgot some of our txs: re-issue from the first gap
+                    self._log(f"{address[:10]}... gap at {pending} (local {state.next_nonce}), resync")
+                    state.next_nonce = pending
+                    state.holes.clear()
+                else:
+                    self._log(f"{address[:10]}... nonce {latest} stuck for {now - state.last_progress:.0f}s")
+                state.last_progress = now
+
+
+# =============================================================================
+# FEE ORACLE (EIP-1559)
+# =============================================================================
+
+class FeeOracle:
+    """
+    EIP-1559 fee estimates shared by all bots on the same RPC.
+    
+    One eth_feeHistory call per block for the whole process gives the next
+    block's baseFeePerGas and recent priority fees. Every tx then gets
+        maxPriorityFeePerGas = median tip (reward_percentile) of recent blocks
+        maxFeePerGas         = base_fee_multiplier * baseFee + tip
+    New block headers can be pushed with on_block() to skip the poll.
+    Falls back to legacy gasPrice if the RPC has no fee history.
+    
+    Usage:
+        fees = FeeOracle.shared(RPC_URL).fees(w3)
+        # {'maxFeePerGas': ..., 'maxPriorityFeePerGas': ...}
+    """
+    
+    _shared: Dict[str, "FeeOracle"] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        block_time: float = BLOCK_TIME,
+        history_blocks: int = 10,
+        reward_percentile: int = 50,
+        base_fee_multiplier: int = 2,
+        min_priority_fee: int = 1_000_000
+    ):
+        """
+        Args:
+            block_time: Seconds between refreshes (one per block)
+            history_blocks: Blocks of fee history for the tip estimate
+            reward_percentile: Tip percentile within each block
+            base_fee_multiplier: Headroom for base fee growth in maxFeePerGas
+            min_priority_fee: Floor for the tip (wei)
+        """
+        self.block_time = block_time
+        self.history_blocks = history_blocks
+        self.reward_percentile = reward_percentile
+        self.base_fee_multiplier = base_fee_multiplier
+        self.min_priority_fee = min_priority_fee
+        
+        self.base_fee: Optional[int] = None
+        self.priority_fee: int = min_priority_fee
+        self.legacy_gas_price: Optional[int] = None
+        self.block_number: Optional[int] = None
+        self.updated_at: float = 0
+        
+        self._lock = threading.Lock()
+        self._inflight: Optional[asyncio.Future] = None
+    
+    @classmethod
+    def shared(cls, rpc_url: str) -> "FeeOracle":
+        """Process-wide instance for an RPC URL"""
+        with cls._shared_lock:
+            oracle = cls._shared.get(rpc_url)
+            if oracle is None:
+                oracle = cls._shared[rpc_url] = cls()
+            return oracle
+    
+    def _stale(self) -> bool:
+        return time.time() - self.updated_at >= self.block_time
+    
+    @property
+    def gas_price(self) -> int:
+        """Expected price per gas actually paid (base fee + tip)"""
+        if self.legacy_gas_price is not None:
+            return self.legacy_gas_price
+        return (self.base_fee or 0) + self.priority_fee
+    
+    def _tx_fees(self) -> Dict[str, int]:
+        if self.legacy_gas_price is not None:
+            return {'gasPrice': self.legacy_gas_price}
+        return {
+            'maxFeePerGas': self.base_fee_multiplier * self.base_fee + self.priority_fee,
+            'maxPriorityFeePerGas': self.priority_fee,
+        }
+    
+    def _apply_history(self, history):
+        """Update state from an eth_feeHistory result"""
+        # Last entry is the base fee of the next (pending) block
+        self.base_fee = int(history['baseFeePerGas'][-1])
+        tips = sorted(int(r[0]) for r in history.get('reward') or [] if r)
+        if tips:
+            self.priority_fee = max(self.min_priority_fee, tips[len(tips) // 2])
+        self.block_number = int(history['oldestBlock']) + len(history['baseFeePerGas']) - 2
+        self.updated_at = time.time()
+    
+    def on_block(self, block: Dict[str, Any]):
+        """Push a new block header (from a newHeads feed) instead of polling"""
+        base_fee = block.get('baseFeePerGas')
+        if base_fee is None:
+            return
+        with self._lock:
+            self.base_fee = int(base_fee)
+            self.block_number = int(block['number'])
+            self.updated_at = time.time()
+    
+    def fees(self, w3) -> Dict[str, int]:
+        """Fee fields for a tx; refreshes at most once per block"""
+        if self._stale():
+            with self._lock:
+                if self._stale():  # Another thread may have refreshed meanwhile
+                    self._refresh(w3)
+        return self._tx_fees()
+    
+    @staticmethod
+    def _unsupported(error: Exception) -> bool:
+        """Check if the RPC lacks eth_feeHistory (pre-London chain or node)"""
+        msg = str(error).lower()
+        return any(s in msg for s in ("not supported", "not found", "does not exist", "unsupported"))
+    
+    def _refresh(self, w3):
+        if self.legacy_gas_price is None:
+            try:
+                self._apply_history(w3.eth.fee_history(
+                    self.history_blocks, 'latest', [self.reward_percentile]
+                ))
+                return
+            except Exception as e:
+                if not self._unsupported(e):
+                    raise
+        self.legacy_gas_price = w3.eth.gas_price
+        self.updated_at = time.time()
+    
+    async def fees_async(self, w3) -> Dict[str, int]:
+        """Async version of fees(); concurrent callers share one request"""
+        if self._stale():
+            if self._inflight is None:
+                self._inflight = asyncio.ensure_future(self._refresh_async(w3))
+            inflight = self._inflight
+            try:
+                await asyncio.shield(inflight)
+            finally:
+                if self._inflight is inflight and inflight.done():
+                    self._inflight = None
+        return self._tx_fees()
+    
+    async def _refresh_async(self, w3):
+        if self.legacy_gas_price is None:
+            try:
+                self._apply_history(await w3.eth.fee_history(
+                    self.history_blocks, 'latest', [self.reward_percentile]
+                ))
+                return
+            except Exception as e:
+                if not self._unsupported(e):
+                    raise
+        self.legacy_gas_price = await w3.eth.gas_price
+        self.updated_at = time.time()
+
+
+# =============================================================================
+# RECEIPT TRACKER
+# =============================================================================
+
+# Receipt fields returned as hex quantities by the node
+_RECEIPT_QUANTITIES = (
+    "status", "blockNumber", "gasUsed", "cumulativeGasUsed",
+    "effectiveGasPrice", "transactionIndex", "type"
+)
+
+
+def _format_receipt(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Raw JSON-RPC receipt with quantities converted to int"""
+    receipt = dict(raw)
+    for key in _RECEIPT_QUANTITIES:
+        if isinstance(receipt.get(key), str):
+            receipt[key] = int(receipt[key], 16)
+    return receipt
+
+
+@dataclass
+class _Tracked:
+    hashes: list  # Original tx hash first, then replacements (same nonce)
+    future: Future
+    deadline: float
+    on_confirmed: list = field(default_factory=list)
+    on_reverted: list = field(default_factory=list)
+    tracked_at: float = field(default_factory=time.time)
+    
+    @property
+    def tx_hash(self) -> str:
+        return self.hashes[-1]
+
+
+class ReceiptTracker:
+    """
+    Background receipt polling shared by all bots on the same RPC.
+    
+    Outstanding tx hashes from every bot are polled together in one
+    batched JSON-RPC request of eth_getTransactionReceipt calls per block
+    (or immediately when a new block is pushed with on_block()). Each
+    track() returns a Future resolving to the receipt (status 0 included)
+    and can fire on_confirmed / on_reverted callbacks. Txs without a
+    receipt after `timeout` seconds fail with TimeoutError (dropped).
+    
+    A tx replaced with the same nonce (speed-up / cancel) is followed with
+    replace(): whichever of its hashes is mined resolves it.
+    
+    Callbacks run on the tracker thread and must not block.
+    
+    Usage:
+        tracker = ReceiptTracker.shared(RPC_URL)
+        future = tracker.track(tx_hash, on_reverted=lambda r: print("reverted"))
+        receipt = future.result(timeout=120)
+    """
+    
+    _shared: Dict[str, "ReceiptTracker"] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        rpc_url: str = RPC_URL,
+        poll_interval: float = BLOCK_TIME,
+        timeout: float = 120.0,
+        batch_size: int = 100
+    ):
+        """
+        Args:
+            rpc_url: RPC endpoint URL (comma-separated URLs for an RPC pool)
+            poll_interval: Seconds between polls (one per block)
+            timeout: Seconds before a tx without receipt counts as dropped
+            batch_size: Max receipt requests per JSON-RPC batch
+        """
+        self.provider = make_provider(rpc_url)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.metrics = Metrics.shared()
+        
+        self.confirmed = 0
+        self.reverted = 0
+        self.dropped = 0
+        
+        self._pending: Dict[str, _Tracked] = {}  # Every hash of a tx -> its entry
+        self._batching = True  # Cleared if the node rejects batch requests
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @classmethod
+    def shared(cls, rpc_url: str) -> "ReceiptTracker":
+        """Process-wide instance for an RPC URL"""
+        with cls._shared_lock:
+            tracker = cls._shared.get(rpc_url)
+            if tracker is None:
+                tracker = cls._shared[rpc_url] = cls(rpc_url)
+            return tracker
+    
+    def _log(self, message: str):
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] [receipts] {message}")
+    
+    def _items(self) -> list:
+        return list({id(item): item for item in list(self._pending.values())}.values())
+    
+    @property
+    def pending(self) -> int:
+        return len(self._items())
+    
+    @property
+    def success_rate(self) -> Optional[float]:
+        """Share of finished txs that were mined successfully"""
+        done = self.confirmed + self.reverted + self.dropped
+        return self.confirmed / done if done else None
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self.pending,
+            "confirmed": self.confirmed,
+            "reverted": self.reverted,
+            "dropped": self.dropped,
+            "success_rate": self.success_rate,
+        }
+    
+    def track(
+        self,
+        tx_hash: str,
+        on_confirmed=None,
+        on_reverted=None,
+        timeout: Optional[float] = None
+    ) -> Future:
+        """
+        Watch a transaction until its receipt arrives. Tracking a hash
+        again adds callbacks, extends the deadline if `timeout` allows
+        longer, and returns the same future.
+        
+        Args:
+            tx_hash: Transaction hash
+            on_confirmed: Called with the receipt if status == 1
+            on_reverted: Called with the receipt if status == 0
+            timeout: Override the tracker timeout for this tx
+        
+        Returns:
+            Future resolving to the receipt
+        """
+        tx_hash = self._normalize(tx_hash)
+        with self._lock:
+            deadline = time.time() + (timeout or self.timeout)
+            tracked = self._pending.get(tx_hash)
+            if tracked is None:
+                tracked = self._pending[tx_hash] = _Tracked([tx_hash], Future(), deadline)
+            elif timeout:
+                tracked.deadline = max(tracked.deadline, deadline)
+            if on_confirmed:
+                tracked.on_confirmed.append(on_confirmed)
+            if on_reverted:
+                tracked.on_reverted.append(on_reverted)
+            self._start()
+        return tracked.future
+    
+    def replace(
+        self,
+        old_hash: str,
+        new_hash: str,
+        on_confirmed=None,
+        on_reverted=None
+    ) -> Future:
+        """
+        Follow a replacement tx (same nonce) as well as the original.
+        Callbacks given here replace the original ones (e.g. for a cancel).
+        """
+        old_hash, new_hash = self._normalize(old_hash), self._normalize(new_hash)
+        with self._lock:
+            tracked = self._pending.get(old_hash)
+        if tracked is None:
+            return self.track(new_hash, on_confirmed, on_reverted)
+        with self._lock:
+            tracked.hashes.append(new_hash)
+            tracked.deadline = time.time() + self.timeout
+            if on_confirmed or on_reverted:
+                tracked.on_confirmed = [on_confirmed] if on_confirmed else []
+                tracked.on_reverted = [on_reverted] if on_reverted else []
+            self._pending[new_hash] = tracked
+        return tracked.future
+    
+    @staticmethod
+    def _normalize(tx_hash: str) -> str:
+        return tx_hash if tx_hash.startswith("0x") else "0x" + tx_hash
+    
+    def on_block(self, block: Optional[Dict[str, Any]] = None):
+        """Poll now (call from a newHeads feed instead of waiting)"""
+        self._wake.set()
+    
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._poll_loop, name="receipt-tracker", daemon=True
+            )
+            self._thread.start()
+    
+    def _poll_loop(self):
+        while True:
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            if not self._pending:
+                continue
+            try:
+                self.poll()
+            except Exception as e:
+                self._log(f"poll failed: {e}")
+    
+    def _fetch(self, hashes: list) -> list:
+        """Raw receipts (or None) for hashes, batched when the node allows"""
+        if self._batching:
+            responses = _batch_request(
+                self.provider, [("eth_getTransactionReceipt", [h]) for h in hashes]
+            )
+            if responses is not None:
+                return [r.get("result") for r in responses]
+            self._batching = False
+        return [
+            self.provider.make_request("eth_getTransactionReceipt", [h]).get("result")
+            for h in hashes
+        ]
+    
+    def poll(self):
+        """Fetch receipts for all pending txs and resolve the finished ones"""
+        pairs = [(item, h) for item in self._items() for h in item.hashes]
+        receipts: Dict[int, Dict[str, Any]] = {}
+        for i in range(0, len(pairs), self.batch_size):
+            chunk = pairs[i:i + self.batch_size]
+            for (item, _), raw in zip(chunk, self._fetch([h for _, h in chunk])):
+                if raw:
+                    receipts[id(item)] = raw
+        
+        for item in {id(item): item for item, _ in pairs}.values():
+            if id(item) in receipts:
+                self._resolve(item, _format_receipt(receipts[id(item)]))
+            elif time.time() > item.deadline:
+                self._drop(item)
+    
+    def _forget(self, item: _Tracked):
+        with self._lock:
+            for tx_hash in item.hashes:
+                self._pending.pop(tx_hash, None)
+    
+    def _resolve(self, item: _Tracked, receipt: Dict[str, Any]):
+        self._forget(item)
+        self.metrics.observe("basion_receipt_seconds", time.time() - item.tracked_at)
+        if receipt.get("status") == 1:
+            self.confirmed += 1
+            self.metrics.inc("basion_receipts_total", status="confirmed")
+            callbacks = item.on_confirmed
+        else:
+            self.reverted += 1
+            self.metrics.inc("basion_receipts_total", status="reverted")
+            callbacks = item.on_reverted
+        for callback in callbacks:
+            try:
+                callback(receipt)
+            except Exception as e:
+                self._log(f"callback failed for {item.tx_hash[:10]}...: {e}")
+        # A waiter may have cancelled the shared future (via wrap_future)
+        if not item.future.done():
+            item.future.set_result(receipt)
+    
+    def _drop(self, item: _Tracked):
+        self._forget(item)
+        self.dropped += 1
+        self.metrics.inc("basion_receipts_total", status="dropped")
+        if not item.future.done():
+            item.future.set_exception(TimeoutError(f"No receipt for {item.tx_hash} (dropped?)"))
+
+
+# =============================================================================
+# BLOCK CLOCK (NEW HEADS)
+# =============================================================================
+
+# Header fields returned as hex quantities by the node
+_HEADER_QUANTITIES = ("number", "timestamp", "baseFeePerGas", "gasUsed", "gasLimit")
+
+
+def _format_header(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Block header with quantities converted to int"""
+    header = dict(raw)
+    for key in _HEADER_QUANTITIES:
+        if isinstance(header.get(key), str):
+            header[key] = int(header[key], 16)
+    return header
+
+
+def _wake_waiter(future: asyncio.Future, number: int):
+    if not future.done():
+        future.set_result(number)
+
+
+class BlockClock:
+    """
+    New-block ticks shared by all bots on the same RPC.
+    
+    One background thread follows the chain head: a newHeads websocket
+    subscription when ws_url is set, otherwise eth_blockNumber polling that
+    sleeps until the next block is due and then polls every poll_interval
+    (about two calls per block). Each new header is pushed to subscribers,
+    e.g. FeeOracle.on_block and ReceiptTracker.on_block.
+    
+    tap_loop(clock=...) waits for the wallet's slot instead of sleeping
+    `delay`. Wallets get sequential slots spread over `every` blocks and,
+    within a block, over the first `window` of the block time, so each
+    wallet sends once per `every` blocks at a fixed offset from the head.
+    
+    Usage:
+        clock = BlockClock.shared(RPC_URL)
+        bot.tap_loop(clock=clock)
+        clock.close()   # Stops the thread
+    """
+    
+    _shared: Dict[Tuple[str, Optional[str]], "BlockClock"] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        rpc_url: str = RPC_URL,
+        ws_url: Optional[str] = None,
+        block_time: float = BLOCK_TIME,
+        every: int = 1,
+        window: float = 0.5,
+        poll_interval: float = 0.2,
+        ws_retry: float = 60.0
+    ):
+        """
+        Args:
+            rpc_url: RPC endpoint URL (comma-separated URLs for an RPC pool)
+            ws_url: Websocket URL for a newHeads subscription (None = poll)
+            block_time: Expected seconds between blocks
+            every: Each wallet sends once per this many blocks
+            window: Share of the block time the fleet's sends are spread over
+            poll_interval: Seconds between eth_blockNumber polls once a block is due
+            ws_retry: Seconds of polling before retrying a failed subscription
+        """
+        self.provider = make_provider(rpc_url)
+        self.rpc_url = rpc_url
+        self.ws_url = ws_url
+        self.block_time = block_time
+        self.every = max(1, every)
+        self.window = window
+        self.poll_interval = poll_interval
+        self.ws_retry = ws_retry
+        self.metrics = Metrics.shared()
+        
+        self.number: Optional[int] = None
+        self.header: Optional[Dict[str, Any]] = None
+        self.seen_at: float = 0  # Local time the current head was observed
+        self.source: Optional[str] = None  # "newHeads" or "polling"
+        self.blocks = 0
+        self.missed = 0
+        
+        self._slots: Dict[str, int] = {}
+        self._listeners: list = []
+        self._waiters: list = []  # (loop, future) of async waiters
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._follower: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Task]] = None
+    
+    @classmethod
+    def shared(cls, rpc_url: str, ws_url: Optional[str] = None) -> "BlockClock":
+        """Process-wide instance for an RPC URL and websocket URL"""
+        with cls._shared_lock:
+            clock = cls._shared.get((rpc_url, ws_url))
+            if clock is None:
+                clock = cls._shared[(rpc_url, ws_url)] = cls(rpc_url, ws_url)
+            return clock
+    
+    def close(self):
+        """Stop following the head and close the RPC sessions"""
+        with BlockClock._shared_lock:
+            if BlockClock._shared.get((self.rpc_url, self.ws_url)) is self:
+                del BlockClock._shared[(self.rpc_url, self.ws_url)]
+        self._stop.set()
+        if self._follower:
+            loop, task = self._follower
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed
+        if self._thread is not None:
+            self._thread.join(timeout=5 * self.block_time)
+        self.provider.close()
+    
+    def _log(self, message: str):
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] [blocks] {message}")
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "source": self.source,
+            "block": self.number,
+            "blocks": self.blocks,
+            "missed": self.missed,
+            "wallets": len(self._slots),
+        }
+    
+    def subscribe(self, callback: Callable[[Dict[str, Any]], None]):
+        """Call callback(header) on every new head (on the clock thread)"""
+        with self._cond:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+        self._start()
+    
+    def slot(self, key: str) -> int:
+        """Slot of a wallet (assigned in order of first use)"""
+        with self._cond:
+            return self._slots.setdefault(key, len(self._slots))
+    
+    def _due(self, slot: int, after: Optional[int]) -> Optional[float]:
+        """Send time of a slot in the current head, None if it waits for a later block"""
+        if self.number is None or (after is not None and self.number <= after):
+            return None
+        if self.number % self.every != slot % self.every:
+            return None
+        per_block = max(1, math.ceil(len(self._slots) / self.every))
+        offset = (slot // self.every) % per_block / per_block
+        return self.seen_at + offset * self.window * self.block_time
+    
+    def _timeout(self, timeout: Optional[float]) -> float:
+        return timeout if timeout is not None else 3 * self.every * self.block_time
+    
+    def wait(self, slot: int, after: Optional[int] = None, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Block until the slot's send time in the first due block after `after`.
+        
+        Returns:
+            The block number to pass as `after` next time. If no head arrives
+            within timeout, returns the current one so callers keep going.
+        """
+        self._start()
+        deadline = time.time() + self._timeout(timeout)
+        with self._cond:
+            while (due := self._due(slot, after)) is None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return self.number  # Head feed stalled
+                self._cond.wait(remaining)
+            number = self.number
+        time.sleep(max(0.0, due - time.time()))
+        return number
+    
+    async def wait_async(self, slot: int, after: Optional[int] = None, timeout: Optional[float] = None) -> Optional[int]:
+        """Async version of wait(); the event loop keeps running meanwhile"""
+        self._start()
+        loop = asyncio.get_running_loop()
+        deadline = time.time() + self._timeout(timeout)
+        while True:
+            with self._cond:
+                due, number = self._due(slot, after), self.number
+                if due is None:
+                    future = loop.create_future()
+                    self._waiters.append((loop, future))
+            if due is not None:
+                break
+            try:
+                await asyncio.wait_for(future, max(0.0, deadline - time.time()))
+            except asyncio.TimeoutError:
+                return self.number
+        await asyncio.sleep(max(0.0, due - time.time()))
+        return number
+    
+    def _tick(self, raw: Dict[str, Any]):
+        header = _format_header(raw)
+        number = header["number"]
+        with self._cond:
+            if self.number is not None and number <= self.number:
+                return
+            if self.number is not None:
+                self.missed += number - self.number - 1
+                self.metrics.inc("basion_blocks_missed_total", number - self.number - 1)
+            self.number, self.header, self.seen_at = number, header, time.time()
+            self.blocks += 1
+            waiters, self._waiters = self._waiters, []
+            listeners = list(self._listeners)
+            self._cond.notify_all()
+        self.metrics.inc("basion_blocks_total")
+        
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake_waiter, future, number)
+            except RuntimeError:
+                pass  # Loop already closed
+        for callback in listeners:
+            try:
+                callback(header)
+            except Exception as e:
+                self._log(f"on_block callback failed: {e}")
+    
+    def _start(self):
+        with self._cond:
+            if self._stop.is_set():
+                return
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="block-clock", daemon=True)
+                self._thread.start()
+    
+    def _run(self):
+        while not self._stop.is_set():
+            poll_until = float("inf")
+            if self.ws_url:
+                try:
+                    asyncio.run(self._follow())
+                except asyncio.CancelledError:
+                    return  # Closed
+                except Exception as e:
+                    self._log(f"newHeads subscription failed ({e}), polling for {self.ws_retry:.0f}s")
+                finally:
+                    self._follower = None
+                poll_until = time.time() + self.ws_retry
+            self.source = "polling"
+            while time.time() < poll_until and not self._stop.is_set():
+                try:
+                    self._poll()
+                except Exception as e:
+                    self._log(f"eth_blockNumber poll failed: {e}")
+                    self._stop.wait(self.block_time)
+    
+    async def _follow(self):
+        """Follow a newHeads subscription until it fails or stalls"""
+        provider = WebSocketProvider(
+            self.ws_url, max_connection_retries=1, request_timeout=5 * self.block_time
+        )
+        self._follower = (asyncio.get_running_loop(), asyncio.current_task())
+        async with AsyncWeb3(provider) as w3:
+            await w3.eth.subscribe("newHeads")
+            self.source = "newHeads"
+            self._log("Following newHeads subscription")
+            messages = w3.socket.process_subscriptions().__aiter__()
+            while not self._stop.is_set():
+                # A silent socket counts as failed after a few missed blocks
+                message = await asyncio.wait_for(messages.__anext__(), 5 * self.block_time)
+                self._tick(dict(message["result"]))
+    
+    def _rpc(self, method: str, params: list) -> Any:
+        response = self.provider.make_request(method, params)
+        if response.get("error"):
+            raise ValueError(response["error"])
+        return response.get("result")
+    
+    def _poll(self):
+        """One eth_blockNumber poll, sleeping first until the next block is due"""
+        if self.number is not None:
+            due = self.seen_at + self.block_time - self.poll_interval
+            if self._stop.wait(max(0.0, due - time.time())):
+                return
+        number = int(self._rpc("eth_blockNumber", []), 16)
+        if self.number is not None and number <= self.number:
+            self._stop.wait(self.poll_interval)
+            return
+        # Headers are only fetched for subscribers (fees need baseFeePerGas)
+        header = None
+        if self._listeners:
+            header = self._rpc("eth_getBlockByNumber", [hex(number), False])
+        self._tick(header or {"number": number})
+
+
+# =============================================================================
+# STUCK TX REPLACEMENT
+# =============================================================================
+
+MIN_REPLACEMENT_BUMP = 10  # % fee increase nodes require to replace a pending tx
+CANCEL_GAS = 21000
+FEE_FIELDS = ('gasPrice', 'maxFeePerGas', 'maxPriorityFeePerGas')
+
+
+@dataclass
+class SentTx:
+    """A sent transaction, kept until mined so it can be replaced"""
+    tx: Dict[str, Any]
+    tx_hash: str
+    sent_at: float
+    use_burner: bool
+    taps: int = 0  # Taps carried (0 = not a tap tx)
+    replacements: int = 0
+    cancelled: bool = False
+
+
+class TxReplacer:
+    """
+    Speed-up / cancel policy for stuck transactions.
+    
+    A tx still pending `stuck_blocks` blocks after it was sent is resent
+    with the same nonce and its fees raised by `bump_percent` (the node's
+    minimum replacement increment), or to the current oracle fees if those
+    are higher. Tap txs are cancelled instead (0-ETH self-transfer, 21000
+    gas) when obsolete: the bumped fee is above `max_tap_fee`, or the
+    ledger shows more taps in flight than the balance covers.
+    
+    Usage:
+        bot.tap_loop(replacer=TxReplacer(stuck_blocks=3))
+    """
+    
+    def __init__(
+        self,
+        stuck_blocks: int = 3,
+        bump_percent: int = MIN_REPLACEMENT_BUMP,
+        max_tap_fee: Optional[int] = None,
+        max_replacements: int = 5,
+        block_time: float = BLOCK_TIME
+    ):
+        """
+        Args:
+            stuck_blocks: Blocks without receipt before a tx is replaced
+            bump_percent: Fee increase per replacement (min 10)
+            max_tap_fee: Max fee per gas (wei) worth paying for taps;
+                stuck taps needing more are cancelled (None = no cap)
+            max_replacements: Give up on a nonce after this many replacements
+            block_time: Seconds per block
+        """
+        self.stuck_after = stuck_blocks * block_time
+        self.bump_percent = max(bump_percent, MIN_REPLACEMENT_BUMP)
+        self.max_tap_fee = max_tap_fee
+        self.max_replacements = max_replacements
+    
+    def stuck(self, sent: SentTx, now: Optional[float] = None) -> bool:
+        now = now if now is not None else time.time()
+        return now - sent.sent_at >= self.stuck_after and sent.replacements < self.max_replacements
+    
+    def bump(self, fees: Dict[str, int], current: Dict[str, int]) -> Dict[str, int]:
+        """Replacement fees: old fees + bump_percent, at least the current fees"""
+        bumped = {
+            key: max(value * (100 + self.bump_percent) // 100 + 1, current.get(key, 0))
+            for key, value in fees.items()
+        }
+        if 'maxFeePerGas' in bumped:
+            bumped['maxFeePerGas'] = max(bumped['maxFeePerGas'], bumped['maxPriorityFeePerGas'])
+        return bumped
+    
+    def obsolete(self, sent: SentTx, fees: Dict[str, int], ledger: "TapLedger") -> bool:
+        """Check if a stuck tap tx should be cancelled rather than sped up"""
+        if not sent.taps or sent.cancelled:
+            return False
+        price = fees.get('maxFeePerGas', fees.get('gasPrice'))
+        over_cap = self.max_tap_fee is not None and price > self.max_tap_fee
+        return over_cap or (ledger.balance is not None and ledger.balance < 0)
+    
+    @staticmethod
+    def cancel_tx(address: str, nonce: int, fees: Dict[str, int], chain_id: int = CHAIN_ID) -> Dict[str, Any]:
+        """Cheapest tx that takes over a nonce: 0 ETH to self"""
+        return {
+            'to': address, 'value': 0, 'gas': CANCEL_GAS, 'data': b'',
+            'nonce': nonce, 'chainId': chain_id, **fees
+        }
+
+
+# =============================================================================
+# TAP TRANSACTION TEMPLATES
+# =============================================================================
+
+TAP_GAS = 100000
+BATCH_TAP_GAS_PER_TAP = 5000
+MAX_BATCH_TAP = 100
+
+
+class TapTxTemplate:
+    """
+    Precompiled tap() / batchTap(n) transactions.
+    
+    Calldata for tap() is a constant selector and batchTap(n) only differs
+    in one uint256, so both are encoded once. Building a tx is a dict copy
+    plus nonce / fees; no ABI lookup or web3 formatters on the hot path.
+    
+    Usage:
+        fees = fee_oracle.fees(w3)
+        tx = template.tap(fees)        # nonce added by the sender
+        tx = template.batch_tap(10, fees)
+    """
+    
+    def __init__(self, contract_address: str = CONTRACT_ADDRESS, chain_id: int = CHAIN_ID):
+        to = Web3.to_checksum_address(contract_address)
+        base = {'to': to, 'value': 0, 'chainId': chain_id}
+        
+        self._tap = {**base, 'gas': TAP_GAS, 'data': Web3.keccak(text="tap()")[:4]}
+        
+        batch_selector = Web3.keccak(text="batchTap(uint256)")[:4]
+        self._batch = {
+            count: {
+                **base,
+                'gas': TAP_GAS + count * BATCH_TAP_GAS_PER_TAP,
+                'data': batch_selector + count.to_bytes(32, 'big'),
+            }
+            for count in range(1, MAX_BATCH_TAP + 1)
+        }
+    
+    def tap(self, fees: Dict[str, int]) -> Dict[str, Any]:
+        """Unsigned tap() tx without nonce (fees: FeeOracle.fees() fields)"""
+        return {**self._tap, **fees}
+    
+    def batch_tap(self, count: int, fees: Dict[str, int]) -> Dict[str, Any]:
+        """Unsigned batchTap(count) tx without nonce"""
+        if count not in self._batch:
+            raise ValueError(f"Count must be 1-{MAX_BATCH_TAP}")
+        return {**self._batch[count], **fees}
+
+
+# =============================================================================
+# TAP SCHEDULER (tap / batchTap COALESCING)
+# =============================================================================
+
+# Estimated fixed gas of a tap tx (21000 intrinsic + call overhead), paid once
+# per tx no matter how many taps it carries
+TAP_OVERHEAD_GAS = 45000
+
+
+class TapScheduler:
+    """
+    Coalesces taps into tap() / batchTap(n) transactions.
+    
+    Taps accrue at `rate` per second and are flushed when the backlog reaches
+    the batch size, or when the oldest pending tap has waited
+    `target_latency` seconds. The batch size is the smallest n whose share
+    of the fixed tx overhead (TAP_OVERHEAD_GAS * gas price / n) fits in
+    `max_overhead_wei` per tap: cheap gas gives single low-latency taps,
+    expensive gas gives larger batches. n never exceeds 100, the remaining
+    tap balance, or what accrues within the target latency.
+    
+    Usage:
+        bot.tap_loop(scheduler=TapScheduler(rate=1.0, target_latency=10))
+    """
+    
+    def __init__(
+        self,
+        rate: float = 1 / 1.1,
+        target_latency: float = 10.0,
+        max_overhead_wei: int = 500_000_000_000,
+        overhead_gas: int = TAP_OVERHEAD_GAS
+    ):
+        """
+        Args:
+            rate: Taps per second to generate
+            target_latency: Max seconds a tap may wait for its batch
+            max_overhead_wei: Budget of fixed tx cost per tap (wei)
+            overhead_gas: Fixed gas per tx shared by all taps in it
+        """
+        self.rate = rate
+        self.target_latency = target_latency
+        self.max_overhead_wei = max_overhead_wei
+        self.overhead_gas = overhead_gas
+        
+        self.pending = 0.0
+        self._last: Optional[float] = None
+        self._oldest: Optional[float] = None
+    
+    def accrue(self, now: Optional[float] = None):
+        """Add taps generated since the last call"""
+        now = now if now is not None else time.time()
+        if self._last is not None:
+            self.pending += (now - self._last) * self.rate
+            if self._oldest is None and self.pending >= 1:
+                self._oldest = now
+        self._last = now
+    
+    def batch_size(self, gas_price: int, tap_balance: Optional[int] = None) -> int:
+        """Gas-optimal number of taps per tx at this gas price"""
+        overhead_wei = self.overhead_gas * gas_price
+        size = -(-overhead_wei // self.max_overhead_wei) if self.max_overhead_wei else MAX_BATCH_TAP
+        latency_cap = max(1, int(self.rate * self.target_latency))
+        size = min(size, latency_cap, MAX_BATCH_TAP)
+        if tap_balance is not None:
+            size = min(size, tap_balance)
+        return max(1, size)
+    
+    def due(
+        self,
+        gas_price: int,
+        tap_balance: Optional[int] = None,
+        now: Optional[float] = None
+    ) -> int:
+        """
+        Number of taps to send now (0 = keep accumulating).
+        Call sent(n) after the transaction went out.
+        """
+        now = now if now is not None else time.time()
+        self.accrue(now)
+        ready = int(self.pending)
+        if ready < 1 or tap_balance == 0:
+            return 0
+        
+        size = self.batch_size(gas_price, tap_balance)
+        if ready < size and now - self._oldest < self.target_latency:
+            return 0
+        
+        # A backlog larger than the optimal size goes out in one bigger batch
+        n = min(ready, MAX_BATCH_TAP)
+        if tap_balance is not None:
+            n = min(n, tap_balance)
+        return n
+    
+    def sent(self, n: int):
+        """Remove n taps from the backlog"""
+        self.pending = max(0.0, self.pending - n)
+        self._oldest = self._last if self.pending >= 1 else None
+
+
+# =============================================================================
+# TAP LEDGER (LOCAL BALANCE / POINTS ACCOUNTING)
+# =============================================================================
+
+class TapLedger:
+    """
+    Local tap balance and points of one wallet.
+    
+    Seeded once from the chain, then debited as taps are sent and credited
+    on deposit, so tap_loop makes no reads on the hot path. Every
+    `reconcile_interval` seconds apply() corrects the prediction from chain
+    state: taps in txs whose nonce is not mined yet are subtracted from the
+    confirmed balance, so reverted or dropped taps are refunded.
+    
+    Points are an estimate (taps * multiplier / 100) until reconciled.
+    """
+    
+    def __init__(self, reconcile_interval: float = 60.0):
+        """
+        Args:
+            reconcile_interval: Seconds between chain reconciliations
+        """
+        self.reconcile_interval = reconcile_interval
+        
+        self.balance: Optional[int] = None  # Predicted taps remaining
+        self.points: int = 0                # Predicted total points
+        self.multiplier: int = 100
+        self.confirmed_balance: Optional[int] = None
+        self.confirmed_points: Tuple[int, int, int] = (0, 0, 0)
+        self.reconciled_at: float = 0
+        
+        self._inflight: Dict[int, int] = {}  # nonce -> taps in that tx
+        self._lock = threading.Lock()
+    
+    @property
+    def inflight(self) -> int:
+        """Taps sent but not mined yet"""
+        return sum(self._inflight.values())
+    
+    def due(self, now: Optional[float] = None) -> bool:
+        """Check if the ledger needs (re)seeding from the chain"""
+        now = now if now is not None else time.time()
+        return self.balance is None or now - self.reconciled_at >= self.reconcile_interval
+    
+    def sent(self, nonce: int, taps: int):
+        """Record a tap / batchTap(taps) tx sent with this nonce"""
+        with self._lock:
+            self._inflight[nonce] = taps
+            if self.balance is not None:
+                self.balance -= taps
+            self.points += taps * self.multiplier // 100
+    
+    def settle(self, nonce: int, success: bool):
+        """Apply a tap tx receipt: reverted taps go back to the balance"""
+        with self._lock:
+            taps = self._inflight.pop(nonce, None)
+            if taps is None or success:
+                return
+            if self.balance is not None:
+                self.balance += taps
+            self.points -= taps * self.multiplier // 100
+    
+    def credit(self, taps: int):
+        """Add taps from a confirmed deposit"""
+        with self._lock:
+            if self.balance is not None:
+                self.balance += taps
+            if self.confirmed_balance is not None:
+                self.confirmed_balance += taps
+    
+    def restore(self, balance: int, points: int, multiplier: int):
+        """Resume from a saved snapshot; trusted until the next reconcile"""
+        with self._lock:
+            self.balance = balance
+            self.points = points
+            self.multiplier = multiplier
+            self.reconciled_at = time.time()
+    
+    def apply(self, balance: int, points: Tuple[int, int, int], multiplier: int, mined_nonce: int):
+        """
+        Correct the prediction from chain state.
+        
+        Args:
+            balance: On-chain tapBalance
+            points: On-chain (premium, standard, total) points
+            multiplier: On-chain points multiplier (100 = 1x)
+            mined_nonce: Burner's latest (mined) transaction count
+        """
+        with self._lock:
+            for nonce in [n for n in self._inflight if n < mined_nonce]:
+                del self._inflight[nonce]
+            inflight = self.inflight
+            self.multiplier = multiplier
+            self.confirmed_balance = balance
+            self.confirmed_points = tuple(points)
+            self.balance = max(0, balance - inflight)
+            self.points = points[2] + inflight * multiplier // 100
+            self.reconciled_at = time.time()
+
+
+# =============================================================================
+# PROCESS-POOL SIGNING
+# =============================================================================
+
+# Worker-process key cache: address -> eth_keys PrivateKey
+_WORKER_KEYS: Dict[str, Any] = {}
+
+
+def _worker_load_key(address: str, private_key: str):
+    """Derive key once inside the worker process"""
+    _WORKER_KEYS[address] = keys.PrivateKey(HexBytes(private_key))
+
+
+def _worker_sign_transaction(address: str, tx: Dict[str, Any]) -> bytes:
+    return bytes(Account.sign_transaction(tx, _WORKER_KEYS[address]).raw_transaction)
+
+
+def _worker_sign_message(address: str, message: str) -> str:
+    msg = encode_defunct(text=message)
+    return Account.sign_message(msg, private_key=_WORKER_KEYS[address]).signature.hex()
+
+
+class SigningPool:
+    """
+    Optional signing backend that shards ECDSA work across processes.
+    
+    Each address is pinned to one single-process shard, so its key is
+    loaded once per worker and signing for different wallets runs on
+    all cores instead of behind the GIL. A shard whose process dies is
+    recreated (keys reloaded) and the call retried once.
+    
+    Usage:
+        pool = SigningPool(workers=8)
+        bot = BasionBot(private_key="0x...", signer=pool)
+        bot.fast_tap()  # signed in a worker process
+    """
+    
+    def __init__(self, workers: Optional[int] = None, mp_context=None):
+        """
+        Args:
+            workers: Number of worker processes (default: CPU count)
+            mp_context: Optional multiprocessing context (e.g. spawn)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.mp_context = mp_context
+        self._shards = [self._new_shard() for _ in range(self.workers)]
+        self._keys: Dict[str, str] = {}  # Address -> private key, to reload a recreated shard
+        self._lock = threading.Lock()
+    
+    def _log(self, message: str):
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] [signer] {message}")
+    
+    def _new_shard(self) -> ProcessPoolExecutor:
+        return futures_process.ProcessPoolExecutor(max_workers=1, mp_context=self.mp_context)
+    
+    def _index(self, address: str) -> int:
+        return int(address, 16) % self.workers
+    
+    def _restart(self, shard: ProcessPoolExecutor):
+        """Replace a broken shard and reload the keys pinned to it"""
+        with self._lock:
+            if shard not in self._shards:
+                return  # Already replaced by another caller
+            index = self._shards.index(shard)
+            self._log(f"Shard {index} worker died, restarting it")
+            replacement = self._shards[index] = self._new_shard()
+            for address, private_key in self._keys.items():
+                if self._index(address) == index:
+                    replacement.submit(_worker_load_key, address, private_key)
+        shard.shutdown(wait=False)
+    
+    def _submit(self, address: str, fn: Callable, *args) -> Future:
+        """Run fn(address, *args) on the address's shard (one retry if the shard broke)"""
+        result: Future = Future()
+        
+        def submit(retry: bool):
+            shard = self._shards[self._index(address)]
+            try:
+                future = shard.submit(fn, address, *args)
+            except BrokenExecutor as e:  # BrokenProcessPool
+                return broken(shard, e, retry)
+            future.add_done_callback(lambda future: settle(future, shard, retry))
+        
+        def settle(future: Future, shard: ProcessPoolExecutor, retry: bool):
+            if result.done():
+                return  # Cancelled by the caller
+            if future.cancelled():
+                result.cancel()
+            elif isinstance(future.exception(), BrokenExecutor):
+                broken(shard, future.exception(), retry)
+            elif future.exception() is not None:
+                result.set_exception(future.exception())
+            else:
+                result.set_result(future.result())
+        
+        def broken(shard: ProcessPoolExecutor, error: Exception, retry: bool):
+            self._restart(shard)
+            if retry:
+                submit(False)
+            elif not result.done():
+                result.set_exception(error)
+        
+        submit(True)
+        return result
+    
+    def register(self, address: str, private_key: str):
+        """Send key to its worker (once per address)"""
+        with self._lock:
+            if address in self._keys:
+                return
+            self._keys[address] = private_key
+        # Shards run tasks in order, so the key is loaded before any signing
+        self._submit(address, _worker_load_key, private_key)
+    
+    def submit_transaction(self, address: str, tx: Dict[str, Any]) -> Future:
+        """Sign tx in a worker; Future resolves to raw signed bytes"""
+        return self._submit(address, _worker_sign_transaction, tx)
+    
+    def sign_transaction(self, address: str, tx: Dict[str, Any]) -> bytes:
+        """Sign tx in a worker and wait for the raw signed bytes"""
+        return self.submit_transaction(address, tx).result()
+    
+    def submit_message(self, address: str, message: str) -> Future:
+        """Sign EIP-191 text message in a worker; Future resolves to signature hex"""
+        return self._submit(address, _worker_sign_message, message)
+    
+    def sign_message(self, address: str, message: str) -> str:
+        """Sign EIP-191 text message in a worker; returns signature hex"""
+        return self.submit_message(address, message).result()
+    
+    def shutdown(self):
+        """Stop all worker processes"""
+        for shard in self._shards:
+            shard.shutdown(wait=True)
+
+
+# =============================================================================
+# SHARED CLIENTS
+# =============================================================================
+
+class SharedClients:
+    """
+    Web3 instances, contract objects and httpx clients shared by bots.
+    
+    One Web3 (+ middleware, contract, Multicall3 contract) per RPC URL and
+    one httpx client (connection pool) per proxy, however many wallets use
+    them. A bot built without one gets a private instance.
+    
+    Usage:
+        clients = SharedClients()
+        bots = [BasionBot(pk, proxy, clients=clients) for pk, proxy in wallets]
+        ...
+        clients.close()
+    """
+    
+    def __init__(self, asynchronous: bool = False, limiter: Optional[RateLimiter] = None):
+        """
+        Args:
+            asynchronous: Build AsyncWeb3 / httpx.AsyncClient (for AsyncBasionBot)
+            limiter: Rate limiter for RPC endpoints, proxies and API routes
+                (default: RateLimiter.shared())
+        """
+        self.asynchronous = asynchronous
+        self.limiter = limiter or RateLimiter.shared()
+        self._web3: Dict[str, Tuple[Any, Any, Any]] = {}
+        self._http: Dict[Optional[str], Any] = {}
+        self._lock = threading.Lock()
+    
+    def web3(self, rpc_url: str) -> Tuple[Any, Any, Any]:
+        """(w3, Basion contract, Multicall3 contract) for an RPC URL"""
+        with self._lock:
+            entry = self._web3.get(rpc_url)
+            if entry is None:
+                if self.asynchronous:
+                    w3 = AsyncWeb3(make_async_provider(rpc_url, self.limiter))
+                else:
+                    w3 = Web3(make_provider(rpc_url, self.limiter))
+                w3.middleware_onion.inject(web3_middleware.ExtraDataToPOAMiddleware, layer=0)
+                contract = w3.eth.contract(
+                    address=Web3.to_checksum_address(CONTRACT_ADDRESS),
+                    abi=CONTRACT_ABI
+                )
+                entry = self._web3[rpc_url] = (w3, contract, _multicall_contract(w3))
+            return entry
+    
+    def http(self, proxy: Optional[str]) -> Any:
+        """HTTP client for API calls through a proxy (None = direct)"""
+        with self._lock:
+            client = self._http.get(proxy)
+            if client is None:
+                hooks = self.limiter.http_hooks(proxy, self.asynchronous)
+                if self.asynchronous:
+                    transport = httpx.AsyncHTTPTransport(proxy=proxy) if proxy else None
+                    client = httpx.AsyncClient(transport=transport, timeout=30.0, event_hooks=hooks)
+                else:
+                    transport = httpx.HTTPTransport(proxy=proxy) if proxy else None
+                    client = httpx.Client(transport=transport, timeout=30.0, event_hooks=hooks)
+                self._http[proxy] = client
+            return client
+    
+    def close(self):
+        """Close sync HTTP clients and RPC pool sessions"""
+        for client in self._http.values():
+            client.close()
+        for w3, _, _ in self._web3.values():
+            NonceManager.shared().detach(w3)
+            w3.provider.close()
+    
+    async def aclose(self):
+        """Close async HTTP clients and RPC connections"""
+        for client in self._http.values():
+            await client.aclose()
+        for w3, _, _ in self._web3.values():
+            NonceManager.shared().detach(w3)
+            await w3.provider.disconnect()
+
+
+# =============================================================================
+# API CACHE (basion.app GET READS)
+# =============================================================================
+
+# Seconds a GET response stays fresh, by API route (see RateLimiter.route)
+DEFAULT_API_TTLS = {
+    "/api/leaderboard": 30.0,
+    "/api/user": 10.0,
+    "/api/get-burner": 60.0,
+}
+
+
+@dataclass
+class _CacheEntry:
+    data: Any
+    expires: float
+    etag: Optional[str] = None
+
+
+class ApiCache:
+    """
+    Cache for basion.app GET reads shared by all bots.
+    
+    - Responses stay fresh for a per-route TTL (DEFAULT_API_TTLS); the
+      least recently used entries are evicted beyond max_entries
+    - Concurrent requests for the same URL share one in-flight call
+      (threads wait on a Future, tasks on the same event loop on an
+      asyncio future), whichever proxy they would have used
+    - Expired entries with an ETag are revalidated with If-None-Match;
+      a 304 keeps the cached body
+    
+    Cached bodies are shared between callers and must not be modified.
+    
+    Usage:
+        cache = ApiCache.shared()
+        board = cache.get(bot.http, f"{API_BASE}/api/leaderboard?limit=100")
+    """
+    
+    _shared: Optional["ApiCache"] = None
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 4096):
+        """
+        Args:
+            ttls: Seconds fresh by route (routes not listed are not cached)
+            max_entries: LRU capacity (one entry per URL)
+        """
+        self.ttls = dict(DEFAULT_API_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.metrics = Metrics.shared()
+        
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.coalesced = 0
+        self.evictions = 0
+        
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_async: Dict[Tuple[int, str], asyncio.Future] = {}
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls) -> "ApiCache":
+        """Process-wide cache"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+        }
+    
+    def ttl(self, url: str) -> float:
+        path = httpx.URL(url).path
+        return self.ttls.get(RateLimiter.route(path), 0.0)
+    
+    def _count(self, outcome: str):
+        setattr(self, outcome, getattr(self, outcome) + 1)
+        self.metrics.inc("basion_api_cache_total", result=outcome)
+    
+    def _lookup(self, url: str, refresh: bool) -> Tuple[Optional[_CacheEntry], bool]:
+        """(entry, fresh) for a URL, marking it recently used"""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(url)
+            return entry, not refresh and entry.expires > time.time()
+    
+    @staticmethod
+    def _headers(entry: Optional[_CacheEntry]) -> Dict[str, str]:
+        return {"If-None-Match": entry.etag} if entry and entry.etag else {}
+    
+    def _store(self, url: str, entry: Optional[_CacheEntry], resp: httpx.Response) -> Any:
+        """Body of a response, cached if successful"""
+        ttl = self.ttl(url)
+        if resp.status_code == 304 and entry is not None:
+            self._count("revalidated")
+            with self._lock:
+                entry.expires = time.time() + ttl
+            return entry.data
+        self._count("misses")
+        data = resp.json()
+        if resp.status_code == 200 and ttl > 0:
+            with self._lock:
+                self._entries[url] = _CacheEntry(data, time.time() + ttl, resp.headers.get("etag"))
+                self._entries.move_to_end(url)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return data
+    
+    def get(self, http: httpx.Client, url: str, refresh: bool = False) -> Any:
+        """
+        GET a JSON body through the cache.
+        
+        Args:
+            http: Client to send the request with if it isn't cached
+            url: Full URL (one cache entry per URL)
+            refresh: Skip the fresh copy (still revalidated / coalesced)
+        """
+        entry, fresh = self._lookup(url, refresh)
+        if fresh:
+            self._count("hits")
+            return entry.data
+        with self._lock:
+            future = self._inflight.get(url)
+            leader = future is None
+            if leader:
+                future = self._inflight[url] = Future()
+        if not leader:
+            self._count("coalesced")
+            return future.result()
+        try:
+            data = self._store(url, entry, http.get(url, headers=self._headers(entry)))
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+    
+    async def get_async(self, http: httpx.AsyncClient, url: str, refresh: bool = False) -> Any:
+        """Async version of get(); tasks on the same event loop share one call"""
+        entry, fresh = self._lookup(url, refresh)
+        if fresh:
+            self._count("hits")
+            return entry.data
+        key = (id(asyncio.get_running_loop()), url)
+        future = self._inflight_async.get(key)
+        if future is not None:
+            self._count("coalesced")
+            return await asyncio.shield(future)
+        future = self._inflight_async[key] = asyncio.get_running_loop().create_future()
+        try:
+            data = self._store(url, entry, await http.get(url, headers=self._headers(entry)))
+            future.set_result(data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved: no "never retrieved" warning without waiters
+            raise
+        finally:
+            self._inflight_async.pop(key, None)
+    
+    def invalidate(self, prefix: str = ""):
+        """Drop cached URLs starting with prefix (all by default)"""
+        with self._lock:
+            for url in [u for u in self._entries if u.startswith(prefix)]:
+                del self._entries[url]
+
+
+def _leaderboard_rank(board: list, address: str) -> Optional[int]:
+    """Rank of an address on a leaderboard page (None if not on it)"""
+    address = address.lower()
+    for entry in board:
+        if str(entry.get("wallet", "")).lower() == address:
+            return entry.get("rank")
+    return None
+
+
+# =============================================================================
+# STATE STORE (SQLITE)
+# =============================================================================
+
+_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS burners (
+    owner       TEXT PRIMARY KEY,
+    address     TEXT NOT NULL,
+    private_key TEXT NOT NULL,
+    created_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS nonces (
+    address     TEXT PRIMARY KEY,
+    next_nonce  INTEGER NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tx_journal (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          REAL NOT NULL,
+    wallet      TEXT NOT NULL,
+    tx_hash     TEXT NOT NULL,
+    event       TEXT NOT NULL,   -- sent / confirmed / reverted / dropped / replaced / cancelled
+    kind        TEXT,            -- tap / batchTap / deposit / registerBurner / cancel / other
+    nonce       INTEGER,
+    taps        INTEGER
+);
+CREATE INDEX IF NOT EXISTS tx_journal_wallet ON tx_journal (wallet, id);
+CREATE TABLE IF NOT EXISTS wallets (
+    wallet      TEXT PRIMARY KEY,
+    txs_sent    INTEGER NOT NULL DEFAULT 0,
+    taps_sent   INTEGER NOT NULL DEFAULT 0,
+    confirmed   INTEGER NOT NULL DEFAULT 0,
+    reverted    INTEGER NOT NULL DEFAULT 0,
+    dropped     INTEGER NOT NULL DEFAULT 0,
+    tap_balance INTEGER,
+    points      INTEGER,
+    multiplier  INTEGER,
+    ledger_at   REAL,
+    updated_at  REAL
+);
+CREATE TABLE IF NOT EXISTS event_index (
+    name            TEXT NOT NULL,   -- EventIndexer.name (checkpoint name)
+    wallet          TEXT NOT NULL,
+    burner          TEXT,
+    referrer        TEXT,
+    tap_balance     INTEGER NOT NULL DEFAULT 0,
+    premium_points  INTEGER NOT NULL DEFAULT 0,
+    standard_points INTEGER NOT NULL DEFAULT 0,
+    multiplier      INTEGER NOT NULL DEFAULT 100,
+    blacklisted     INTEGER NOT NULL DEFAULT 0,
+    deposits        INTEGER NOT NULL DEFAULT 0,
+    taps_bought     INTEGER NOT NULL DEFAULT 0,
+    eth_paid        REAL NOT NULL DEFAULT 0,
+    taps_used       INTEGER NOT NULL DEFAULT 0,
+    tap_events      INTEGER NOT NULL DEFAULT 0,
+    last_block      INTEGER,
+    indexed_to      INTEGER,         -- NULL while tracked, else the checkpoint it stopped at
+    PRIMARY KEY (name, wallet)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name        TEXT PRIMARY KEY,
+    block       INTEGER NOT NULL,
+    updated_at  REAL NOT NULL
+);
+"""
+
+WALLET_COUNTERS = ("txs_sent", "taps_sent", "confirmed", "reverted", "dropped")
+
+# Per-wallet aggregates kept by the EventIndexer (event_index columns)
+INDEX_FIELDS = (
+    "burner", "referrer", "tap_balance", "premium_points", "standard_points",
+    "multiplier", "blacklisted", "deposits", "taps_bought", "eth_paid",
+    "taps_used", "tap_events", "last_block", "indexed_to"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _tx_kinds() -> Dict[bytes, str]:
+    """Function selector -> journal kind (hashed on first use)"""
+    return {
+        keccak(text=signature)[:4]: signature.split("(")[0]
+        for signature in ("tap()", "batchTap(uint256)", "deposit(uint256,address)", "registerBurner(address)")
+    }
+
+
+def _tx_kind(tx: Dict[str, Any]) -> Tuple[str, int]:
+    """(journal kind, taps carried) of a transaction"""
+    data = bytes(HexBytes(tx.get('data') or b''))
+    if not data:
+        return "cancel", 0
+    kind = _tx_kinds().get(data[:4], "other")
+    if kind == "batchTap":
+        return kind, int.from_bytes(data[4:36], 'big')
+    return kind, int(kind == "tap")
+
+
+class StateStore:
+    """
+    Fleet state that survives restarts, in one SQLite database (WAL mode).
+    
+    Holds burner keys, each address's next nonce, an append-only journal
+    of sent transactions and their outcomes, and per-wallet counters plus
+    the last tap ledger snapshot. Burner keys are written immediately;
+    everything else is queued (nonces and ledger snapshots coalesced per
+    address) and committed in one transaction every `flush_interval`
+    seconds by a background thread.
+    
+    Usage:
+        store = StateStore("basion_state.db")
+        bot = BasionBot(private_key="0x...", store=store)
+    """
+    
+    def __init__(self, path: str = "basion_state.db", flush_interval: float = 1.0):
+        """
+        Args:
+            path: SQLite database file
+            flush_interval: Seconds between batched writes
+        """
+        self.path = path
+        self.flush_interval = flush_interval
+        
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_STATE_SCHEMA)
+        self._db_lock = threading.Lock()
+        
+        # Pending writes
+        self._nonces: Dict[str, int] = {}
+        self._ledgers: Dict[str, Tuple[int, int, int, float]] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._journal: list = []
+        self._lock = threading.Lock()
+        
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._flush_loop, name="state-store", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def _log(self, message: str):
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] [state] {message}")
+    
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._db_lock:
+            return self._db.execute(sql, params).fetchall()
+    
+    # -------------------------------------------------------------------------
+    # Burners (written immediately)
+    # -------------------------------------------------------------------------
+    
+    def save_burner(self, owner: str, burner: BurnerWallet):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT INTO burners VALUES (?, ?, ?, ?) ON CONFLICT(owner) DO UPDATE SET "
+                "address = excluded.address, private_key = excluded.private_key",
+                (owner, burner.address, burner.private_key, time.time())
+            )
+    
+    def load_burner(self, owner: str) -> Optional[BurnerWallet]:
+        rows = self._query("SELECT address, private_key FROM burners WHERE owner = ?", (owner,))
+        return BurnerWallet(*rows[0]) if rows else None
+    
+    def burners(self) -> Dict[str, BurnerWallet]:
+        """All burners by owner address (one query for a whole fleet)"""
+        rows = self._query("SELECT owner, address, private_key FROM burners")
+        return {owner: BurnerWallet(address, key) for owner, address, key in rows}
+    
+    # -------------------------------------------------------------------------
+    # Batched writes
+    # -------------------------------------------------------------------------
+    
+    def set_nonce(self, address: str, next_nonce: int):
+        with self._lock:
+            self._nonces[address] = next_nonce
+    
+    def save_ledger(self, wallet: str, balance: int, points: int, multiplier: int):
+        with self._lock:
+            self._ledgers[wallet] = (balance, points, multiplier, time.time())
+    
+    def count(self, wallet: str, **deltas: int):
+        """Add to per-wallet counters (WALLET_COUNTERS)"""
+        with self._lock:
+            counters = self._counters.setdefault(wallet, dict.fromkeys(WALLET_COUNTERS, 0))
+            for name, delta in deltas.items():
+                counters[name] += delta
+    
+    def journal(
+        self,
+        wallet: str,
+        tx_hash: str,
+        event: str,
+        kind: Optional[str] = None,
+        nonce: Optional[int] = None,
+        taps: Optional[int] = None
+    ):
+        """Append a tx event to the journal"""
+        with self._lock:
+            self._journal.append((time.time(), wallet, tx_hash, event, kind, nonce, taps))
+    
+    def flush(self):
+        """Commit all queued writes in one transaction"""
+        with self._lock:
+            nonces, self._nonces = self._nonces, {}
+            ledgers, self._ledgers = self._ledgers, {}
+            counters, self._counters = self._counters, {}
+            journal, self._journal = self._journal, []
+        if not (nonces or ledgers or counters or journal):
+            return
+        now = time.time()
+        with self._db_lock:
+            db = self._db
+            try:
+                db.execute("BEGIN")
+                db.executemany(
+                    "INSERT INTO nonces VALUES (?, ?, ?) ON CONFLICT(address) DO UPDATE SET "
+                    "next_nonce = excluded.next_nonce, updated_at = excluded.updated_at",
+                    [(address, nonce, now) for address, nonce in nonces.items()]
+                )
+                db.executemany(
+                    "INSERT INTO tx_journal (ts, wallet, tx_hash, event, kind, nonce, taps) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    journal
+                )
+                db.executemany(
+                    "INSERT INTO wallets (wallet, txs_sent, taps_sent, confirmed, reverted, dropped, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(wallet) DO UPDATE SET "
+                    + ", ".join(f"{c} = {c} + excluded.{c}" for c in WALLET_COUNTERS)
+                    + ", updated_at = excluded.updated_at",
+                    [(w, *(c[name] for name in WALLET_COUNTERS), now) for w, c in counters.items()]
+                )
+                db.executemany(
+                    "INSERT INTO wallets (wallet, tap_balance, points, multiplier, ledger_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(wallet) DO UPDATE SET "
+                    "tap_balance = excluded.tap_balance, points = excluded.points, "
+                    "multiplier = excluded.multiplier, ledger_at = excluded.ledger_at, "
+                    "updated_at = excluded.updated_at",
+                    [(w, *snapshot, now) for w, snapshot in ledgers.items()]
+                )
+                db.execute("COMMIT")
+            except Exception:
+                if db.in_transaction:
+                    db.execute("ROLLBACK")
+                self._requeue(nonces, ledgers, counters, journal)
+                raise
+    
+    def _requeue(self, nonces: dict, ledgers: dict, counters: dict, journal: list):
+        """Put a failed batch back in front of anything queued since"""
+        with self._lock:
+            self._nonces = {**nonces, **self._nonces}
+            self._ledgers = {**ledgers, **self._ledgers}
+            for wallet, deltas in self._counters.items():
+                merged = counters.setdefault(wallet, dict.fromkeys(WALLET_COUNTERS, 0))
+                for name, delta in deltas.items():
+                    merged[name] += delta
+            self._counters = counters
+            self._journal = journal + self._journal
+    
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                self._log(f"flush failed: {e}")
+    
+    def close(self):
+        """Flush pending writes and close the database"""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self.flush()
+        with self._db_lock:
+            self._db.close()
+    
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+    
+    def next_nonce(self, address: str) -> Optional[int]:
+        with self._lock:
+            if address in self._nonces:
+                return self._nonces[address]
+        rows = self._query("SELECT next_nonce FROM nonces WHERE address = ?", (address,))
+        return rows[0][0] if rows else None
+    
+    def ledger(self, wallet: str) -> Optional[Tuple[int, int, int, float]]:
+        """Last (tap balance, points, multiplier, saved at) snapshot"""
+        with self._lock:
+            if wallet in self._ledgers:
+                return self._ledgers[wallet]
+        rows = self._query(
+            "SELECT tap_balance, points, multiplier, ledger_at FROM wallets "
+            "WHERE wallet = ? AND tap_balance IS NOT NULL", (wallet,)
+        )
+        return tuple(rows[0]) if rows else None
+    
+    def counters(self, wallet: str) -> Dict[str, int]:
+        """Per-wallet counters (committed values)"""
+        rows = self._query(
+            f"SELECT {', '.join(WALLET_COUNTERS)} FROM wallets WHERE wallet = ?", (wallet,)
+        )
+        return dict(zip(WALLET_COUNTERS, rows[0] if rows else (0,) * len(WALLET_COUNTERS)))
+    
+    def history(self, wallet: str, limit: int = 100) -> list:
+        """Latest journal entries for a wallet, newest first"""
+        rows = self._query(
+            "SELECT ts, tx_hash, event, kind, nonce, taps FROM tx_journal "
+            "WHERE wallet = ? ORDER BY id DESC LIMIT ?", (wallet, limit)
+        )
+        keys = ("ts", "tx_hash", "event", "kind", "nonce", "taps")
+        return [dict(zip(keys, row)) for row in rows]
+    
+    # -------------------------------------------------------------------------
+    # Event index (written immediately, rows and checkpoint in one transaction)
+    # -------------------------------------------------------------------------
+    
+    def load_index(self, name: str) -> Tuple[Optional[int], Dict[str, Dict[str, Any]]]:
+        """(checkpoint block, aggregates by wallet) of an event index"""
+        checkpoint = self._query("SELECT block FROM checkpoints WHERE name = ?", (name,))
+        rows = self._query(
+            f"SELECT wallet, {', '.join(INDEX_FIELDS)} FROM event_index WHERE name = ?", (name,)
+        )
+        wallets = {row[0]: dict(zip(INDEX_FIELDS, row[1:])) for row in rows}
+        for row in wallets.values():
+            row["blacklisted"] = bool(row["blacklisted"])
+        return (checkpoint[0][0] if checkpoint else None), wallets
+    
+    def save_index(self, name: str, block: int, wallets: Dict[str, Dict[str, Any]]):
+        """Store changed aggregates together with the block they are complete up to"""
+        with self._db_lock:
+            db = self._db
+            try:
+                db.execute("BEGIN")
+                db.executemany(
+                    f"INSERT OR REPLACE INTO event_index (name, wallet, {', '.join(INDEX_FIELDS)}) "
+                    f"VALUES ({', '.join('?' * (len(INDEX_FIELDS) + 2))})",
+                    [(name, wallet, *(row[f] for f in INDEX_FIELDS)) for wallet, row in wallets.items()]
+                )
+                db.execute(
+                    "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?)", (name, block, time.time())
+                )
+                db.execute("COMMIT")
+            except Exception:
+                if db.in_transaction:
+                    db.execute("ROLLBACK")
+                raise
+
+
+# =============================================================================
+# EVENT INDEXER (eth_getLogs)
+# =============================================================================
+
+# eth_getLogs rejections that mean "ask for fewer blocks", as worded by providers
+_LOG_RANGE_ERRORS = (
+    "block range",                  # "block range is too wide", "exceed maximum block range: 5000"
+    "range too large",
+    "query returned more than",     # geth / Infura: "query returned more than 10000 results"
+    "too many results",
+    "log response size exceeded",   # Alchemy
+    "eth_getlogs is limited to",    # QuickNode: "eth_getLogs is limited to a 10,000 range"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _event_decoders() -> Dict[str, tuple]:
+    """
+    topic0 -> (event name, indexed (name, type) pairs, data names, data types)
+    for EVENT_ABI. Built once, on first use: decoding a log is then a dict
+    lookup plus one abi_decode of its data.
+    """
+    decoders = {}
+    for event in EVENT_ABI:
+        if event.get("type") != "event":
+            continue
+        types = ",".join(i["type"] for i in event["inputs"])
+        topic = "0x" + keccak(text=f"{event['name']}({types})").hex()
+        indexed = [(i["name"], i["type"]) for i in event["inputs"] if i["indexed"]]
+        data = [i for i in event["inputs"] if not i["indexed"]]
+        decoders[topic] = (event["name"], indexed, [i["name"] for i in data], [i["type"] for i in data])
+    return decoders
+
+
+def decode_log(log: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Decode a raw eth_getLogs entry of an EVENT_ABI event.
+    
+    Returns:
+        (event name, args) with addresses as lowercase hex, or None for
+        other events
+    """
+    topics = log.get("topics") or []
+    decoder = _event_decoders().get(topics[0].lower()) if topics else None
+    if decoder is None:
+        return None
+    name, indexed, data_names, data_types = decoder
+    args = {
+        arg: ("0x" + topic[-40:].lower() if typ == "address" else int(topic, 16))
+        for (arg, typ), topic in zip(indexed, topics[1:])
+    }
+    if data_types:
+        args.update(zip(data_names, abi_decode(data_types, HexBytes(log["data"]))))
+    return name, args
+
+
+def _empty_index_row() -> Dict[str, Any]:
+    row = dict.fromkeys(INDEX_FIELDS, 0)
+    row.update(burner=None, referrer=None, multiplier=100, blacklisted=False, eth_paid=0.0, last_block=None,
+               indexed_to=None)
+    return row
+
+
+class EventIndexer:
+    """
+    Per-wallet points / taps / deposits kept up to date from contract logs.
+    
+    Each sync() pulls the Basion contract's logs for the tracked wallets
+    (and their burners) with eth_getLogs from the checkpoint block up to
+    head - confirmations, decodes them with ABI decoders built once, and
+    folds them into per-wallet aggregates. Aggregates and the checkpoint
+    are committed together to the StateStore, so a restart resumes from
+    the checkpoint. The block range adapts: halved when the node rejects a
+    range as too large (and never grown past that size again) or a response
+    exceeds target_logs, doubled while responses stay small.
+    
+    A wallet without history in the index is seeded from one Multicall3
+    snapshot (getUserInfo, getPoints, referrer, blacklisted) at the
+    checkpoint block, unless the index replays history from start_block.
+    So is a stored wallet that was not tracked while the checkpoint moved
+    on: its row missed those logs and is marked with the block it stopped
+    at (indexed_to).
+    Taps used by standard Tap events are derived as points x 100 /
+    multiplier (the TapLedger convention).
+    
+    Usage:
+        indexer = EventIndexer(fleet_addresses, store=store)
+        indexer.sync()
+        info = indexer.user_info(address)   # UserInfo, no RPC call
+    """
+    
+    def __init__(
+        self,
+        wallets: Any = (),
+        rpc_url: str = RPC_URL,
+        store: Optional[StateStore] = None,
+        contract_address: str = CONTRACT_ADDRESS,
+        start_block: Optional[int] = None,
+        confirmations: int = 2,
+        min_range: int = 100,
+        max_range: int = 50_000,
+        target_logs: int = 2_000,
+        topic_chunk: int = 500
+    ):
+        """
+        Args:
+            wallets: Main wallet addresses, or {address: burner address or None}
+            rpc_url: RPC endpoint URL (comma-separated URLs for an RPC pool)
+            store: StateStore for aggregates and checkpoint (None = memory only)
+            contract_address: Basion contract
+            start_block: Replay history from this block on the first sync
+                (None = snapshot the wallets at the current head instead)
+            confirmations: Blocks behind the head to index up to (reorg margin)
+            min_range / max_range: Bounds of the eth_getLogs block range
+            target_logs: Logs per response to aim for (range halved above it,
+                doubled below a quarter of it)
+            topic_chunk: Max addresses in one eth_getLogs topic filter
+        """
+        self.provider = make_provider(rpc_url)
+        self.w3 = Web3(self.provider)
+        self.contract = self.w3.eth.contract(
+            address=Web3.to_checksum_address(contract_address), abi=CONTRACT_ABI
+        )
+        self.store = store
+        self.name = f"events:{self.contract.address}"
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.min_range = min_range
+        self.max_range = max_range
+        self.range = max_range
+        self._range_cap = max_range  # Lowered when the node rejects a range
+        self.target_logs = target_logs
+        self.topic_chunk = topic_chunk
+        self.metrics = Metrics.shared()
+        
+        self.block: Optional[int] = None  # Aggregates are complete up to this block
+        self.logs = 0
+        self.requests = 0
+        self._wallets: Dict[str, Dict[str, Any]] = {}  # Tracked and seeded
+        self._unseeded: Dict[str, Optional[str]] = {}  # address -> burner
+        self._owner: Dict[str, str] = {}  # lowercase wallet / burner -> wallet
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        
+        if store is not None:
+            self.block, rows = store.load_index(self.name)
+            self._stored = rows
+        else:
+            self._stored = {}
+        self._stored_block = self.block  # Stored rows are complete up to here (None once marked)
+        
+        if not isinstance(wallets, dict):
+            wallets = dict.fromkeys(wallets)
+        for address, burner in wallets.items():
+            self.track(address, burner)
+    
+    def _log(self, message: str):
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] [index] {message}")
+    
+    def track(self, address: str, burner: Optional[str] = None):
+        """Add a wallet (seeded from the store, or from the chain on the next sync)"""
+        address = Web3.to_checksum_address(address)
+        with self._lock:
+            if address in self._wallets or address in self._unseeded:
+                return
+            row = self._stored.pop(address, None)
+            if row is None or row["indexed_to"] is not None:
+                # New, or stored but missed logs while untracked: snapshot it
+                self._unseeded[address] = burner or (row and row["burner"])
+                return
+            self._add(address, row)
+    
+    def _add(self, address: str, row: Dict[str, Any]):
+        self._wallets[address] = row
+        self._owner[address.lower()] = address
+        if row["burner"]:
+            self._owner[row["burner"].lower()] = address
+    
+    # -------------------------------------------------------------------------
+    # Reads (local, no RPC)
+    # -------------------------------------------------------------------------
+    
+    def wallet(self, address: str) -> Optional[Dict[str, Any]]:
+        """Aggregates of a wallet (None until it is indexed)"""
+        row = self._wallets.get(address)
+        return dict(row) if row else None
+    
+    def user_info(self, address: str) -> Optional[UserInfo]:
+        row = self._wallets.get(address)
+        if row is None:
+            return None
+        return UserInfo(
+            address=address,
+            burner_address=row["burner"],
+            taps_remaining=row["tap_balance"],
+            premium_points=row["premium_points"],
+            standard_points=row["standard_points"],
+            total_points=row["premium_points"] + row["standard_points"],
+            multiplier=row["multiplier"],
+            referrer=row["referrer"],
+            is_blacklisted=row["blacklisted"]
+        )
+    
+    def totals(self) -> Dict[str, Any]:
+        """Fleet-wide sums over all indexed wallets"""
+        rows = list(self._wallets.values())
+        totals = {
+            key: sum(row[key] for row in rows)
+            for key in ("tap_balance", "premium_points", "standard_points", "deposits",
+                        "taps_bought", "eth_paid", "taps_used", "tap_events")
+        }
+        totals["total_points"] = totals["premium_points"] + totals["standard_points"]
+        totals["wallets"] = len(rows)
+        totals["block"] = self.block
+        return totals
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "block": self.block,
+            "wallets": len(self._wallets),
+            "unseeded": len(self._unseeded),
+            "logs": self.logs,
+            "requests": self.requests,
+            "range": self.range,
+        }
+    
+    # -------------------------------------------------------------------------
+    # Sync
+    # -------------------------------------------------------------------------
+    
+    def _rpc(self, method: str, params: list) -> Any:
+        self.requests += 1
+        response = self.provider.make_request(method, params)
+        if response.get("error"):
+            raise ValueError(response["error"])
+        return response.get("result")
+    
+    @staticmethod
+    def _range_too_large(error: Exception) -> bool:
+        """Check if the node rejected a getLogs range / result size"""
+        msg = str(error).lower()
+        return any(s in msg for s in _LOG_RANGE_ERRORS)
+    
+    def _topics(self) -> list:
+        """topic filters: any indexed event, user in chunks of tracked addresses"""
+        addresses = sorted(self._owner)
+        events = list(_event_decoders())
+        return [
+            [events, ["0x" + "0" * 24 + a[2:] for a in addresses[i:i + self.topic_chunk]]]
+            for i in range(0, len(addresses), self.topic_chunk)
+        ]
+    
+    def _fetch(self, start: int, end: int) -> list:
+        logs = []
+        for topics in self._topics():
+            logs.extend(self._rpc("eth_getLogs", [{
+                "address": self.contract.address,
+                "fromBlock": hex(start),
+                "toBlock": hex(end),
+                "topics": topics,
+            }]) or [])
+        logs.sort(key=lambda log: (int(log["blockNumber"], 16), int(log["logIndex"], 16)))
+        return logs
+    
+    def _apply(self, log: Dict[str, Any], changed: set):
+        decoded = decode_log(log)
+        if decoded is None:
+            return
+        name, args = decoded
+        wallet = self._owner.get(args["user"])
+        if wallet is None:
+            return
+        row = self._wallets[wallet]
+        if name == "Deposit":
+            row["deposits"] += 1
+            row["taps_bought"] += args["taps"]
+            row["tap_balance"] += args["taps"]
+            row["eth_paid"] += args["totalPaid"] / 10**18
+        elif name == "Tap":
+            points = args["points"]
+            taps = 1 if args["isPremium"] else max(1, points * 100 // max(1, row["multiplier"]))
+            row["tap_events"] += 1
+            row["taps_used"] += taps
+            row["tap_balance"] -= taps
+            row["premium_points" if args["isPremium"] else "standard_points"] += points
+        elif name == "BoostSet":
+            row["multiplier"] = args["multiplier"]
+            row["tap_balance"] += args["bonusTaps"]
+        elif name == "BurnerRegistered":
+            row["burner"] = Web3.to_checksum_address(args["burner"])
+            self._owner[args["burner"]] = wallet
+        elif name == "ReferralRegistered":
+            row["referrer"] = Web3.to_checksum_address(args["referrer"])
+        elif name == "Blacklisted":
+            row["blacklisted"] = bool(args["status"])
+        row["last_block"] = int(log["blockNumber"], 16)
+        changed.add(wallet)
+        self.logs += 1
+        self.metrics.inc("basion_indexed_logs_total", event=name)
+    
+    def _seed(self, block: int) -> Dict[str, Dict[str, Any]]:
+        """Snapshot unseeded wallets at `block` (one multicall per 500 reads)"""
+        wallets, self._unseeded = self._unseeded, {}
+        if not wallets:
+            return {}
+        if self.start_block is not None and block == self.start_block - 1:
+            # Replaying history from start_block: begin empty
+            return {address: _empty_index_row() for address in wallets}
+        fns = self.contract.functions
+        calls = []
+        for address in wallets:
+            calls.extend([
+                fns.getUserInfo(address), fns.getPoints(address),
+                fns.referrer(address), fns.blacklisted(address),
+            ])
+        try:
+            results = multicall(self.w3, calls, block_identifier=block)
+        except Exception:
+            self._unseeded.update(wallets)  # Retried on the next sync
+            raise
+        rows = {}
+        for i, address in enumerate(wallets):
+            info, points, referrer, blacklisted = results[4 * i:4 * i + 4]
+            row = _empty_index_row()
+            if info:
+                taps, multiplier, burner = info
+                row.update(tap_balance=taps, multiplier=multiplier)
+                if int(burner, 16):
+                    row["burner"] = burner
+            if wallets[address] and not row["burner"]:
+                row["burner"] = Web3.to_checksum_address(wallets[address])
+            if points:
+                row.update(premium_points=points[0], standard_points=points[1])
+            if referrer and int(referrer, 16):
+                row["referrer"] = referrer
+            row["blacklisted"] = bool(blacklisted)
+            row["last_block"] = block
+            rows[address] = row
+        return rows
+    
+    def _save(self, changed: set):
+        if self.store is None:
+            return
+        rows = {w: self._wallets[w] for w in changed}
+        if self._stored_block is not None and self.block != self._stored_block:
+            # The checkpoint moves past stored rows nobody tracks: mark them behind
+            for wallet, row in self._stored.items():
+                if row["indexed_to"] is None:
+                    row["indexed_to"] = self._stored_block
+                    rows[wallet] = row
+            self._stored_block = None
+        self.store.save_index(self.name, self.block, rows)
+    
+    def sync(self) -> int:
+        """
+        Index logs up to head - confirmations, then seed newly tracked
+        wallets at that block.
+        
+        Returns:
+            Number of logs applied
+        """
+        with self._lock:
+            applied = self.logs
+            head = int(self._rpc("eth_blockNumber", []), 16) - self.confirmations
+            if self.block is None:
+                self.block = head if self.start_block is None else self.start_block - 1
+                self._add_seeded()
+            
+            while self.block < head and self._owner:
+                end = min(head, self.block + self.range)
+                try:
+                    logs = self._fetch(self.block + 1, end)
+                except Exception as e:
+                    if self._range_too_large(e) and self.range > self.min_range:
+                        self.range = self._range_cap = max(self.min_range, self.range // 2)
+                        continue
+                    raise
+                changed: set = set()
+                for log in logs:
+                    self._apply(log, changed)
+                self.block = end
+                self._save(changed)
+                if len(logs) > self.target_logs:
+                    self.range = max(self.min_range, self.range // 2)
+                elif len(logs) < self.target_logs // 4:
+                    self.range = min(self._range_cap, self.range * 2)
+            self.block = max(self.block, head)
+            self._add_seeded()
+            return self.logs - applied
+    
+    def _add_seeded(self):
+        seeded = self._seed(self.block)
+        for address, row in seeded.items():
+            self._add(address, row)
+        self._save(set(seeded))
+    
+    def start(self, interval: float = 10 * BLOCK_TIME) -> "EventIndexer":
+        """Sync every `interval` seconds on a background thread"""
+        def loop():
+            while not self._stop.is_set():
+                try:
+                    self.sync()
+                except Exception as e:
+                    self._log(f"sync failed: {e}")
+                self._stop.wait(interval)
+        
+        threading.Thread(target=loop, name="event-indexer", daemon=True).start()
+        return self
+    
+    def stop(self):
+        self._stop.set()
+
+
+# =============================================================================
+# BASION BOT CLASS
+# =============================================================================
+
+class _BaseBot:
+    """
+    Network-independent part of a bot: keys, burner file, message signing
+    and logging. Shared by BasionBot and AsyncBasionBot.
+    """
+    
+    def __init__(
+        self,
+        private_key: str,
+        proxy: Optional[str],
+        rpc_url: str,
+        burner_file: Optional[str],
+        nonce_manager: Optional[NonceManager],
+        signer: Optional[SigningPool] = None,
+        store: Optional[StateStore] = None
+    ):
+        # Validate private key
+        if not private_key.startswith("0x"):
+            private_key = "0x" + private_key
+        
+        self.private_key = private_key
+        self.proxy = proxy
+        self.rpc_url = rpc_url
+        
+        # Create main account (key derived once, reused for every signature)
+        self._main_key = keys.PrivateKey(HexBytes(private_key))
+        self.account: LocalAccount = Account.from_key(self._main_key)
+        self.address = self.account.address
+        
+        # Optional process-pool signing backend
+        self.signer = signer
+        if signer:
+            signer.register(self.address, private_key)
+        
+        # Optional persistent state (burners, nonces, tx journal, counters)
+        self.store = store
+        
+        # Burner wallet (loaded or created later)
+        self.burner: Optional[BurnerWallet] = None
+        self.burner_account: Optional[LocalAccount] = None
+        self._burner_key = None
+        self._burner_key_for: Optional[BurnerWallet] = None
+        
+        # Cached /api/tap signature: (signed_at, timestamp, signature)
+        self._api_auth: Optional[Tuple[float, str, str]] = None
+        self.burner_file = burner_file or f"burner_{self.address[:10]}.json"
+        
+        # Nonce management (shared across bots, no RPC on the hot path)
+        self.nonces = nonce_manager or NonceManager.shared()
+        
+        # Pre-encoded tap / batchTap transactions
+        self.tap_tx = TapTxTemplate()
+        
+        # Latency histograms, RPC / error counters, taps/s (process-wide)
+        self.metrics = Metrics.shared()
+        
+        # Cached / coalesced API reads (process-wide)
+        self.api_cache = ApiCache.shared()
+        
+        # Local tap balance / points (reconciled with the chain periodically)
+        self.ledger = TapLedger()
+        self.pending_deposit: Optional[Future] = None
+        
+        # Sent txs awaiting receipt, for speed-up / cancel: (from, nonce) -> SentTx
+        self._sent: Dict[Tuple[str, int], SentTx] = {}
+        
+        # Load existing burner if available
+        self._load_burner()
+    
+    # =========================================================================
+    # LOGGING
+    # =========================================================================
+    
+    def _log(self, message: str, level: str = "INFO"):
+        """Print log message with timestamp"""
+        timestamp = time.strftime("%H:%M:%S")
+        wallet_short = f"{self.address[:6]}...{self.address[-4:]}"
+        print(f"[{timestamp}] [{wallet_short}] {message}")
+    
+    # =========================================================================
+    # BURNER WALLET MANAGEMENT
+    # =========================================================================
+    
+    def _load_burner(self) -> bool:
+        """Load burner wallet from the state store or file if exists"""
+        try:
+            burner = self.store.load_burner(self.address) if self.store else None
+            if burner:
+                self._set_burner(burner)
+                self._log(f"Loaded burner: {self.burner.address[:10]}...")
+                return True
+            path = Path(self.burner_file)
+            if path.exists():
+                data = json.loads(path.read_text())
+                self._set_burner(BurnerWallet(
+                    address=data["address"],
+                    private_key=data["private_key"]
+                ))
+                self._log(f"Loaded burner: {self.burner.address[:10]}...")
+                if self.store:
+                    self.store.save_burner(self.address, self.burner)  # Migrate file -> store
+                return True
+        except Exception as e:
+            self._log(f"Failed to load burner: {e}")
+        return False
+    
+    def _save_burner(self):
+        """Save burner wallet to the state store or file"""
+        if self.burner and self.store:
+            self.store.save_burner(self.address, self.burner)
+            self._log(f"Saved burner to {self.store.path}")
+        elif self.burner:
+            path = Path(self.burner_file)
+            path.write_text(json.dumps({
+                "address": self.burner.address,
+                "private_key": self.burner.private_key
+            }))
+            self._log(f"Saved burner to {self.burner_file}")
+    
+    def create_burner(self) -> BurnerWallet:
+        """Create new random burner wallet"""
+        account = Account.create()
+        self._set_burner(BurnerWallet(
+            address=account.address,
+            private_key=account.key.hex()
+        ))
+        self._save_burner()
+        self._log(f"Created new burner: {self.burner.address}")
+        return self.burner
+    
+    def _set_burner(self, burner: BurnerWallet):
+        """Set burner wallet and derive its signing key once"""
+        self.burner = burner
+        self._burner_key = keys.PrivateKey(HexBytes(burner.private_key))
+        self.burner_account = Account.from_key(self._burner_key)
+        self._burner_key_for = burner
+        if self.signer:
+            self.signer.register(self.burner_account.address, burner.private_key)
+    
+    # =========================================================================
+    # SIGNATURE HELPERS
+    # =========================================================================
+    
+    def _signer(self, use_burner: bool = False) -> Tuple[LocalAccount, Any]:
+        """
+        Cached (account, private key object) for main or burner wallet.
+        
+        Passing the eth_keys PrivateKey to Account.sign_* skips the
+        public-key derivation that raw key bytes trigger on every call.
+        """
+        if not (use_burner and self.burner):
+            return self.account, self._main_key
+        if self._burner_key_for is not self.burner:
+            # Burner was replaced directly via the attribute
+            self._set_burner(self.burner)
+        return self.burner_account, self._burner_key
+    
+    def _sign_message(self, message: str, use_burner: bool = False) -> str:
+        """Sign a message with main or burner wallet"""
+        account, key = self._signer(use_burner)
+        if self.signer:
+            return self.signer.sign_message(account.address, message)
+        msg = encode_defunct(text=message)
+        signed = Account.sign_message(msg, private_key=key)
+        return signed.signature.hex()
+    
+    def _api_invalidate(self):
+        """Drop cached API reads of this wallet (its state is about to change)"""
+        self.api_cache.invalidate(f"{API_BASE}/api/get-burner?wallet={self.address}")
+        self.api_cache.invalidate(f"{API_BASE}/api/user/{self.address}")
+    
+    def _api_auth_stale(self, refresh: bool = False) -> bool:
+        auth = self._api_auth
+        return refresh or auth is None or time.time() - auth[0] > API_SIGNATURE_TTL - API_SIGNATURE_REFRESH
+    
+    def _api_auth_message(self) -> Tuple[float, str, str]:
+        """(time, timestamp, message) for a new /api/tap signature"""
+        now = time.time()
+        timestamp = str(int(now * 1000))
+        return now, timestamp, f"Basion tap for {self.address} at {timestamp}"
+    
+    def _api_tap_body(self, count: int, refresh: bool = False) -> Dict[str, Any]:
+        """
+        /api/tap request body. The signed timestamp is reused until
+        API_SIGNATURE_REFRESH seconds before the server would reject it,
+        so one signature covers minutes of requests.
+        """
+        if self._api_auth_stale(refresh):
+            now, timestamp, message = self._api_auth_message()
+            self._api_auth = (now, timestamp, self._sign_message(message))
+        auth = self._api_auth
+        return {
+            "wallet": self.address,
+            "signature": auth[2],
+            "timestamp": auth[1],
+            "count": count
+        }
+    
+    def _sign_tx(self, tx: Dict[str, Any], account: LocalAccount, key) -> bytes:
+        """Sign tx locally or in the signing pool; returns raw signed bytes"""
+        start = time.perf_counter()
+        if self.signer:
+            raw_tx = self.signer.sign_transaction(account.address, tx)
+        else:
+            raw_tx = Account.sign_transaction(tx, key).raw_transaction
+        self.metrics.since("basion_tx_sign_seconds", start)
+        return raw_tx
+    
+    def _build_tap(self, fees: Dict[str, int], count: Optional[int] = None) -> Dict[str, Any]:
+        """tap() (count None) or batchTap(count) tx from the template"""
+        start = time.perf_counter()
+        tx = self.tap_tx.tap(fees) if count is None else self.tap_tx.batch_tap(count, fees)
+        self.metrics.since("basion_tx_build_seconds", start)
+        return tx
+    
+    # =========================================================================
+    # RECEIPT TRACKING
+    # =========================================================================
+    
+    def _remember(self, address: str, tx: Dict[str, Any], tx_hash: str, use_burner: bool):
+        """Keep a sent tx until its receipt lands (for replace_stuck) and journal it"""
+        key = (address, tx['nonce'])
+        sent = self._sent[key] = SentTx(dict(tx), tx_hash, time.time(), use_burner)
+        self.metrics.inc("basion_txs_sent_total")
+        
+        def done(future: Future):
+            if self._sent.get(key) is sent:
+                self._sent.pop(key)
+            # Cancelled: the wallet's task stopped waiting, the outcome is unknown
+            if self.store and not future.cancelled():
+                self._journal_outcome(sent, future)
+        
+        if self.store:
+            kind, taps = _tx_kind(tx)
+            self.store.journal(self.address, tx_hash, "sent", kind, tx['nonce'], taps)
+            self.store.count(self.address, txs_sent=1, taps_sent=taps)
+            self.store.set_nonce(address, self.nonces.next_nonce(address))
+        self.receipts.track(tx_hash).add_done_callback(done)
+    
+    def _journal_outcome(self, sent: SentTx, future: Future):
+        if future.exception() is not None:
+            event, tx_hash = "dropped", sent.tx_hash
+        else:
+            receipt = future.result()
+            event = "confirmed" if receipt['status'] == 1 else "reverted"
+            tx_hash = receipt.get('transactionHash', sent.tx_hash)
+        self.store.journal(self.address, tx_hash, event, nonce=sent.tx['nonce'])
+        self.store.count(self.address, **{event: 1})
+    
+    def _save_ledger(self):
+        """Snapshot the tap ledger into the state store"""
+        if self.store and self.ledger.balance is not None:
+            self.store.save_ledger(
+                self.address, self.ledger.balance, self.ledger.points, self.ledger.multiplier
+            )
+    
+    def _resume_state(self):
+        """Seed nonces and the tap ledger from the state store (no chain reads)"""
+        for account in (self.account, self.burner_account):
+            next_nonce = self.store.next_nonce(account.address) if account else None
+            if next_nonce is not None:
+                self.nonces.seed(account.address, self.w3, next_nonce)
+        snapshot = self.store.ledger(self.address)
+        if snapshot:
+            self.ledger.restore(*snapshot[:3])
+    
+    def _sent_taps(self, tx_hash: str, nonce: int, taps: int):
+        """Debit the ledger and settle it when the tap tx receipt lands"""
+        self.ledger.sent(nonce, taps)
+        self.metrics.taps(self.address, taps)
+        sent = self._sent.get((self.burner.address, nonce))
+        if sent:
+            sent.taps = taps
+        self._save_ledger()
+        
+        def reverted(receipt):
+            self.ledger.settle(nonce, False)
+            self._log(f"Tap tx reverted: {tx_hash[:10]}... ({taps} taps refunded)")
+        
+        self.receipts.track(
+            tx_hash,
+            on_confirmed=lambda receipt: self.ledger.settle(nonce, True),
+            on_reverted=reverted
+        )
+    
+    def _stuck(self, replacer: TxReplacer) -> list:
+        """[(from, SentTx)] pending longer than the replacer allows"""
+        now = time.time()
+        return [(address, sent) for (address, _), sent in list(self._sent.items())
+                if replacer.stuck(sent, now)]
+    
+    def _replacement(
+        self,
+        replacer: TxReplacer,
+        address: str,
+        sent: SentTx,
+        current: Dict[str, int]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """(replacement tx, is_cancel) for a stuck tx"""
+        fees = replacer.bump({k: sent.tx[k] for k in FEE_FIELDS if k in sent.tx}, current)
+        if replacer.obsolete(sent, fees, self.ledger):
+            return replacer.cancel_tx(address, sent.tx['nonce'], fees, sent.tx['chainId']), True
+        return {**sent.tx, **fees}, sent.cancelled
+    
+    def _replaced(self, address: str, sent: SentTx, tx: Dict[str, Any], tx_hash: str, cancel: bool):
+        """Follow the replacement in the tracker and ledger"""
+        nonce = tx['nonce']
+        if cancel and not sent.cancelled:
+            def settle(receipt):
+                # The original tap may still win the race against the cancel
+                cancelled = (receipt.get('to') or '').lower() == address.lower()
+                self.ledger.settle(nonce, receipt['status'] == 1 and not cancelled)
+            
+            self.receipts.replace(sent.tx_hash, tx_hash, on_confirmed=settle, on_reverted=settle)
+            self._log(f"Cancelled stuck tap tx {sent.tx_hash[:10]}... (nonce {nonce})")
+        else:
+            self.receipts.replace(sent.tx_hash, tx_hash)
+            self._log(f"Sped up stuck tx {sent.tx_hash[:10]}... (nonce {nonce}) -> {tx_hash[:10]}...")
+        if self.store:
+            event = "cancelled" if cancel and not sent.cancelled else "replaced"
+            self.store.journal(self.address, tx_hash, event, _tx_kind(tx)[0], nonce)
+        sent.tx, sent.tx_hash, sent.sent_at = tx, tx_hash, time.time()
+        sent.replacements += 1
+        sent.cancelled = cancel
+    
+    def _replacement_failed(self, sent: SentTx, tx: Dict[str, Any], error: Exception):
+        msg = str(error).lower()
+        if "underpriced" in msg:
+            # Next attempt bumps on top of these fees
+            sent.tx = {**sent.tx, **{k: tx[k] for k in FEE_FIELDS if k in tx}}
+        elif "nonce too low" not in msg and "already known" not in msg:
+            self._log(f"Replacing stuck tx {sent.tx_hash[:10]}... failed: {error}")
+        # Otherwise the original was mined meanwhile; the tracker resolves it
+        sent.sent_at = time.time()
+    
+    def _track_deposit(self, tx_hash: str, taps: int) -> Future:
+        """Track a deposit; taps are credited to the ledger once it confirms"""
+        def confirmed(receipt):
+            self.ledger.credit(taps)
+            self._save_ledger()
+            self._log(f"Deposit confirmed! +{taps} taps")
+        
+        self.pending_deposit = self.receipts.track(
+            tx_hash,
+            on_confirmed=confirmed,
+            on_reverted=lambda receipt: self._log("Deposit reverted!")
+        )
+        return self.pending_deposit
+    
+    @staticmethod
+    def _deposit_failed(future: Future) -> bool:
+        """Check a finished deposit future for a revert or drop"""
+        return future.exception() is not None or future.result()['status'] != 1
+    
+    def _get_timestamp(self) -> str:
+        """Get current timestamp in milliseconds"""
+        return str(int(time.time() * 1000))
+    
+    @staticmethod
+    def _or_none(address: str) -> Optional[str]:
+        """Map zero address to None"""
+        return address if address != ZERO_ADDRESS else None
+    
+    @classmethod
+    def _make_user_info(cls, address: str, points, info, referrer: str, is_blacklisted: bool) -> UserInfo:
+        """Build UserInfo from raw getPoints / getUserInfo results"""
+        premium, standard, total = points
+        taps, multiplier, burner = info
+        return UserInfo(
+            address=address,
+            burner_address=cls._or_none(burner),
+            taps_remaining=taps,
+            premium_points=premium,
+            standard_points=standard,
+            total_points=total,
+            multiplier=multiplier,
+            referrer=cls._or_none(referrer),
+            is_blacklisted=is_blacklisted
+        )
+    
+    def _user_info_calls(self) -> list:
+        """Contract reads behind get_user_info() (for multicall)"""
+        fns = self.contract.functions
+        return [
+            fns.getPoints(self.address),
+            fns.getUserInfo(self.address),
+            fns.referrer(self.address),
+            fns.blacklisted(self.address),
+        ]
+    
+    def _status_calls(self, info: Optional[UserInfo] = None) -> list:
+        """Contract reads behind print_status(): user info (unless known) + ETH balances"""
+        calls = [] if info else self._user_info_calls()
+        calls.append(self.multicall.functions.getEthBalance(self.address))
+        if self.burner:
+            calls.append(self.multicall.functions.getEthBalance(self.burner.address))
+        return calls
+    
+    def _status_from(self, results: list, info: Optional[UserInfo] = None) -> Tuple[UserInfo, float, float]:
+        """Build (info, main_eth, burner_eth) from _status_calls(info) results"""
+        if info is None:
+            info, results = self._make_user_info(self.address, *results[:4]), results[4:]
+        main_eth = float(Web3.from_wei(results[0], 'ether'))
+        burner_eth = float(Web3.from_wei(results[1], 'ether')) if len(results) > 1 else 0
+        return info, main_eth, burner_eth
+    
+    @staticmethod
+    def _print_status(info: UserInfo, main_eth: float, burner_eth: float):
+        print("\n" + "=" * 50)
+        print(f"Main Wallet:    {info.address}")
+        print(f"Main ETH:       {main_eth:.6f} ETH")
+        print(f"Burner Wallet:  {info.burner_address or 'None'}")
+        print(f"Burner ETH:     {burner_eth:.6f} ETH")
+        print(f"Taps Remaining: {info.taps_remaining}")
+        print(f"Total Points:   {info.total_points}")
+        print(f"  Premium:      {info.premium_points}")
+        print(f"  Standard:     {info.standard_points}")
+        print(f"Multiplier:     {info.multiplier / 100:.2f}x")
+        print(f"Referrer:       {info.referrer or 'None'}")
+        print(f"Blacklisted:    {info.is_blacklisted}")
+        print("=" * 50 + "\n")
+
+
+class BasionBot(_BaseBot):
+    """
+    Complete Basion Bot implementation.
+    
+    Usage:
+        bot = BasionBot(private_key="0x...", proxy="http://...")
+        bot.setup()  # First time only
+        bot.tap_loop(count=100)
+    """
+    
+    def __init__(
+        self,
+        private_key: str,
+        proxy: Optional[str] = None,
+        rpc_url: str = RPC_URL,
+        burner_file: Optional[str] = None,
+        nonce_manager: Optional[NonceManager] = None,
+        signer: Optional[SigningPool] = None,
+        fee_oracle: Optional[FeeOracle] = None,
+        clients: Optional[SharedClients] = None,
+        receipt_tracker: Optional[ReceiptTracker] = None,
+        store: Optional[StateStore] = None
+    ):
+        """
+        Initialize Basion Bot.
+        
+        Args:
+            private_key: Main wallet private key (0x...)
+            proxy: Optional proxy URL (http://user:pass@ip:port or socks5://...)
+            rpc_url: RPC endpoint URL (comma-separated URLs for an RPC pool)
+            burner_file: Optional file to save/load burner wallet
+            nonce_manager: Nonce allocator (defaults to the process-wide one)
+            signer: Optional SigningPool to sign in worker processes
+            fee_oracle: Fee source (defaults to the shared one for rpc_url)
+            clients: SharedClients to reuse Web3 / contracts / HTTP clients
+            receipt_tracker: Receipt poller (defaults to the shared one for rpc_url)
+            store: Optional StateStore to persist burner, nonces and tx journal
+        """
+        super().__init__(private_key, proxy, rpc_url, burner_file, nonce_manager, signer, store)
+        
+        # Web3, contracts and proxied HTTP client (shared with other bots if given)
+        self._owns_clients = clients is None
+        self.clients = clients or SharedClients()
+        self.w3, self.contract, self.multicall = self.clients.web3(rpc_url)
+        self.http = self.clients.http(proxy)
+        
+        # EIP-1559 fees, refreshed once per block for all bots on this RPC
+        self.fee_oracle = fee_oracle or FeeOracle.shared(rpc_url)
+        
+        # Batched receipt polling for all bots on this RPC
+        self.receipts = receipt_tracker or ReceiptTracker.shared(rpc_url)
+        
+        if store:
+            self._resume_state()
+        
+        self._log(f"Initialized bot for {self.address[:10]}...{self.address[-6:]}")
+    
+    # =========================================================================
+    # API METHODS
+    # =========================================================================
+    
+    def api_get_burner(self, refresh: bool = False) -> Optional[str]:
+        """Check if burner exists on backend. Returns burner address or None."""
+        try:
+            data = self.api_cache.get(
+                self.http, f"{API_BASE}/api/get-burner?wallet={self.address}", refresh
+            )
+            if data.get("exists"):
+                return data.get("burnerAddress")
+        except Exception as e:
+            self._log(f"API get-burner error: {e}")
+        return None
+    
+    def api_register_burner(self) -> bool:
+        """Register burner wallet with backend"""
+        if not self.burner:
+            raise ValueError("No burner wallet created")
+        
+        timestamp = self._get_timestamp()
+        message = f"Register burner {self.burner.address} for {self.address} at {timestamp}"
+        signature = self._sign_message(message)
+        
+        try:
+            self._api_invalidate()
+            resp = self.http.post(
+                f"{API_BASE}/api/register-burner",
+                json={
+                    "mainWallet": self.address,
+                    "burnerWallet": self.burner.address,
+                    "privateKey": self.burner.private_key,
+                    "signature": signature,
+                    "timestamp": timestamp
+                }
+            )
+            data = resp.json()
+            if data.get("success"):
+                self._log("Registered burner with backend")
+                return True
+            else:
+                self._log(f"Register burner failed: {data.get('error')}")
+        except Exception as e:
+            self._log(f"API register-burner error: {e}")
+        return False
+    
+    def api_get_user_info(self, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """Get user info from API (cached, see ApiCache)"""
+        try:
+            return self.api_cache.get(self.http, f"{API_BASE}/api/user/{self.address}", refresh)
+        except Exception as e:
+            self._log(f"API user info error: {e}")
+        return None
+    
+    def api_tap(self, count: int = 1) -> Dict[str, Any]:
+        """
+        Send tap via API (slower than direct contract call).
+        Use this if you want server-side processing.
+        
+        Args:
+            count: Taps in this request (1 to API_TAP_MAX_COUNT)
+        """
+        resp = self.http.post(f"{API_BASE}/api/tap", json=self._api_tap_body(count))
+        if resp.status_code == 401:
+            # Rejected signature (e.g. clock skew): sign a fresh one once
+            resp = self.http.post(f"{API_BASE}/api/tap", json=self._api_tap_body(count, refresh=True))
+        return resp.json()
     
     def api_redeem_boost(self, code: str) -> Dict[str, Any]:
         """Redeem a boost code"""
-        resp = self.http.post(
+        self._api_invalidate()
+        resp = self.http.post(
+            f"{API_BASE}/api/boost/redeem",
+            json={
+                "address": self.address,
+                "code": code
+            }
+        )
+        return resp.json()
+    
+    def api_get_leaderboard(self, limit: int = API_LEADERBOARD_MAX, refresh: bool = False) -> list:
+        """Get leaderboard (one cached full page, sliced to limit)"""
+        board = self.api_cache.get(
+            self.http, f"{API_BASE}/api/leaderboard?limit={API_LEADERBOARD_MAX}", refresh
+        )
+        return board[:limit]
+    
+    def api_get_rank(self, refresh: bool = False) -> Optional[int]:
+        """Leaderboard rank of this wallet (None if not in the top API_LEADERBOARD_MAX)"""
+        return _leaderboard_rank(self.api_get_leaderboard(refresh=refresh), self.address)
+    
+    # =========================================================================
+    # CONTRACT READ METHODS
+    # =========================================================================
+    
+    def get_user_info(self) -> UserInfo:
+        """Get complete user info from contract (points, info, referrer, blacklist in one multicall)"""
+        return self._make_user_info(self.address, *multicall(self.w3, self._user_info_calls()))
+    
+    def get_tap_balance(self) -> int:
+        """Get remaining taps from contract"""
+        return self.contract.functions.tapBalance(self.address).call()
+    
+    def get_tap_state(self) -> Tuple[int, Tuple[int, int, int]]:
+        """Get (tap balance, points) in a single multicall"""
+        fns = self.contract.functions
+        balance, points = multicall(self.w3, [
+            fns.tapBalance(self.address),
+            fns.getPoints(self.address),
+        ])
+        return balance, tuple(points)
+    
+    def get_points(self) -> Tuple[int, int, int]:
+        """Get points (premium, standard, total)"""
+        return self.contract.functions.getPoints(self.address).call()
+    
+    def reconcile_ledger(self) -> TapLedger:
+        """Seed / correct the local tap ledger from the chain"""
+        # Nonce first: a tx mined between the two reads is then under-
+        # rather than over-counted until the next reconcile
+        mined = self.w3.eth.get_transaction_count(self.burner.address) if self.burner else 0
+        fns = self.contract.functions
+        (taps, multiplier, _), points = multicall(self.w3, [
+            fns.getUserInfo(self.address),
+            fns.getPoints(self.address),
+        ])
+        self.ledger.apply(taps, points, multiplier, mined)
+        self._save_ledger()
+        return self.ledger
+    
+    def get_burner_from_contract(self) -> Optional[str]:
+        """Get registered burner address from contract"""
+        burner = self.contract.functions.userToBurner(self.address).call()
+        return self._or_none(burner)
+    
+    def get_package_info(self, package_id: int) -> Tuple[int, int, bool]:
+        """Get package info (price_wei, taps, active)"""
+        return self.contract.functions.getPackage(package_id).call()
+    
+    # =========================================================================
+    # CONTRACT WRITE METHODS
+    # =========================================================================
+    
+    def _get_fees(self) -> Dict[str, int]:
+        """Get EIP-1559 fee fields (shared oracle, refreshed once per block)"""
+        return self.fee_oracle.fees(self.w3)
+    
+    def _send_tx(
+        self,
+        func,
+        value: int = 0,
+        use_burner: bool = False,
+        gas_limit: int = 100000
+    ) -> str:
+        """Send transaction and return tx hash"""
+        account, _ = self._signer(use_burner)
+        
+        # Build transaction (nonce is filled in by _sign_and_send)
+        tx = func.build_transaction({
+            'from': account.address,
+            'value': value,
+            'gas': gas_limit,
+            **self._get_fees(),
+            'nonce': 0,
+            'chainId': CHAIN_ID
+        })
+        
+        return self._sign_and_send(tx, use_burner)
+    
+    def _sign_and_send(self, tx: Dict[str, Any], use_burner: bool = False) -> str:
+        """
+        Assign nonce, sign and broadcast transaction.
+        Retries once if the node rejects the nonce (after a precise resync).
+        """
+        account, key = self._signer(use_burner)
+        for attempt in range(2):
+            tx['nonce'] = self.nonces.allocate(account.address, self.w3)
+            raw_tx = self._sign_tx(tx, account, key)
+            start = time.perf_counter()
+            try:
+                tx_hash = self.w3.eth.send_raw_transaction(raw_tx).hex()
+                self.metrics.since("basion_tx_send_seconds", start)
+            except Exception as e:
+                if self.nonces.is_already_known(e):
+                    # Accepted earlier (e.g. by another endpoint); resending
+                    # under a new nonce would double-send
+                    tx_hash = keccak(raw_tx).hex()
+                elif not self.nonces.handle_error(account.address, tx['nonce'], e) or attempt:
+                    raise
+                else:
+                    continue
+            self._remember(account.address, tx, tx_hash, use_burner)
+            return tx_hash
+    
+    def register_burner_on_chain(self, wait: bool = True) -> str:
+        """
+        Register burner wallet on blockchain.
+        
+        Args:
+            wait: Block until confirmed (False: use self.receipts.track(tx_hash))
+        """
+        if not self.burner:
+            raise ValueError("No burner wallet created")
+        
+        self._log(f"Registering burner on chain...")
+        tx_hash = self._send_tx(
+            self.contract.functions.registerBurner(
+                Web3.to_checksum_address(self.burner.address)
+            ),
+            gas_limit=100000
+        )
+        self._log(f"Register burner tx: {tx_hash}")
+        
+        if wait:
+            receipt = self.receipts.track(tx_hash).result()
+            if receipt['status'] != 1:
+                raise Exception(f"Register burner reverted: {tx_hash}")
+            self._log("Burner registered on chain!")
+        return tx_hash
+    
+    def deposit(
+        self,
+        package_id: int = 1,
+        referrer: Optional[str] = None,
+        wait: bool = True
+    ) -> str:
+        """
+        Deposit ETH to buy taps.
+        
+        Args:
+            package_id: 0 = 2000 taps ($3), 1 = 7000 taps ($10)
+            referrer: Optional referrer address
+            wait: Block until confirmed (False: taps are credited to the
+                ledger in the background, see self.pending_deposit)
+        
+        Returns:
+            Transaction hash
+        """
+        if package_id not in PACKAGES:
+            raise ValueError(f"Invalid package_id: {package_id}")
+        
+        _, taps, eth_price = PACKAGES[package_id]
+        value_wei = self.w3.to_wei(eth_price, 'ether')
+        
+        referrer_addr = Web3.to_checksum_address(referrer or ZERO_ADDRESS)
+        
+        self._log(f"Depositing {eth_price} ETH for {taps} taps...")
+        tx_hash = self._send_tx(
+            self.contract.functions.deposit(package_id, referrer_addr),
+            value=value_wei,
+            gas_limit=200000
+        )
+        self._log(f"Deposit tx: {tx_hash}")
+        
+        # Wait for confirmation
+        future = self._track_deposit(tx_hash, taps)
+        if wait:
+            future.result()
+        return tx_hash
+    
+    def tap(self) -> str:
+        """
+        Perform single tap directly on contract (fastest method).
+        Must be called from burner wallet.
+        """
+        if not self.burner:
+            raise ValueError("No burner wallet. Call setup() first.")
+        
+        tx = self._build_tap(self._get_fees())
+        tx_hash = self._sign_and_send(tx, use_burner=True)
+        self._sent_taps(tx_hash, tx['nonce'], 1)
+        return tx_hash
+    
+    def batch_tap(self, count: int) -> str:
+        """
+        Perform multiple taps in one transaction.
+        
+        Args:
+            count: Number of taps (1-100)
+        """
+        if not self.burner:
+            raise ValueError("No burner wallet. Call setup() first.")
+        
+        if count < 1 or count > 100:
+            raise ValueError("Count must be 1-100")
+        
+        tx = self._build_tap(self._get_fees(), count)
+        tx_hash = self._sign_and_send(tx, use_burner=True)
+        self._sent_taps(tx_hash, tx['nonce'], count)
+        return tx_hash
+    
+    # =========================================================================
+    # FAST TAP (OPTIMIZED FOR SPEED)
+    # =========================================================================
+    
+    def fast_tap(self) -> str:
+        """
+        Optimized tap with local nonce management.
+        Allows ~1 tap per second without waiting for confirmation.
+        """
+        if not self.burner:
+            raise ValueError("No burner wallet")
+        
+        # Pre-encoded tx + shared fees (nonce comes from the nonce manager)
+        tx = self._build_tap(self._get_fees())
+        
+        tx_hash = self._sign_and_send(tx, use_burner=True)
+        self._sent_taps(tx_hash, tx['nonce'], 1)
+        return tx_hash
+    
+    def reset_nonce(self):
+        """Resync burner nonce with the chain (call if transactions fail)"""
+        if self.burner:
+            self.nonces.resync(self.burner.address)
+    
+    def replace_stuck(self, replacer: TxReplacer) -> int:
+        """
+        Speed up or cancel txs stuck in the mempool (same nonce, bumped fees).
+        
+        Returns:
+            Number of replacement txs sent
+        """
+        stuck = self._stuck(replacer)
+        if not stuck:
+            return 0
+        current = self._get_fees()
+        replaced = 0
+        for address, sent in stuck:
+            tx, cancel = self._replacement(replacer, address, sent, current)
+            account, key = self._signer(sent.use_burner)
+            try:
+                tx_hash = self.w3.eth.send_raw_transaction(self._sign_tx(tx, account, key)).hex()
+            except Exception as e:
+                self._replacement_failed(sent, tx, e)
+                continue
+            self._replaced(address, sent, tx, tx_hash, cancel)
+            replaced += 1
+        return replaced
+    
+    # =========================================================================
+    # HIGH-LEVEL METHODS
+    # =========================================================================
+    
+    def setup(self, package_id: int = 1, referrer: Optional[str] = None) -> bool:
+        """
+        Complete setup for new user:
+        1. Create burner wallet (if not exists)
+        2. Register burner on chain
+        3. Register burner with API
+        4. Make first deposit
+        
+        Returns True if setup successful.
+        """
+        self._log("Starting setup...")
+        
+        # Check if already has burner on chain
+        on_chain_burner = self.get_burner_from_contract()
+        if on_chain_burner:
+            self._log(f"Already has burner on chain: {on_chain_burner}")
+            # If we don't have local burner key, we can't tap
+            if not self.burner:
+                self._log("ERROR: Burner exists but no local key! Cannot tap.")
+                return False
+            return True
+        
+        # Create burner if not exists
+        if not self.burner:
+            self.create_burner()
+        
+        # Register on blockchain
+        self.register_burner_on_chain()
+        
+        # Register with API
+        self.api_register_burner()
+        
+        # Make deposit
+        self.deposit(package_id=package_id, referrer=referrer)
+        
+        self._log("Setup complete!")
+        return True
+    
+    def ensure_taps(self, min_taps: int = 100, package_id: int = 1):
+        """Ensure we have at least min_taps available"""
+        current = self.get_tap_balance()
+        if current < min_taps:
+            self._log(f"Low taps ({current}), depositing...")
+            self.deposit(package_id=package_id)
+    
+    def tap_loop(
+        self,
+        count: Optional[int] = None,
+        delay: float = 1.1,
+        auto_deposit: bool = True,
+        package_id: int = 1,
+        scheduler: Optional[TapScheduler] = None,
+        refill_at: int = 0,
+        replacer: Optional[TxReplacer] = None,
+        clock: Optional[BlockClock] = None
+    ):
+        """
+        Main tap loop.
+        
+        Args:
+            count: Number of taps (None = infinite)
+            delay: Delay between taps in seconds
+            auto_deposit: Automatically deposit when out of taps
+            package_id: Package to use for auto-deposit
+            scheduler: Optional TapScheduler to coalesce taps into batchTap(n)
+            refill_at: Auto-deposit when this many taps are left; tapping
+                continues while the deposit confirms
+            replacer: Optional TxReplacer to speed up / cancel stuck txs
+            clock: Optional BlockClock; taps once per block slot instead of
+                sleeping `delay`
+        """
+        self._log(f"Starting tap loop (count={count}, delay={'block slot' if clock else f'{delay}s'})")
+        
+        taps_done = 0
+        next_report = 10
+        ledger = self.ledger  # Balance / points tracked locally, no reads per tap
+        deposit: Optional[Future] = None  # Deposit confirming in the background
+        errors = 0
+        max_errors = 10
+        
+        if clock:
+            slot = clock.slot(self.address)
+            clock.subscribe(self.fee_oracle.on_block)
+            clock.subscribe(self.receipts.on_block)
+            block = clock.wait(slot)
+        
+        while count is None or taps_done < count:
+            try:
+                if ledger.due():
+                    self.reconcile_ledger()
+                
+                if deposit and deposit.done():
+                    if self._deposit_failed(deposit):
+                        self._log("ERROR: Deposit failed, stopping")
+                        break
+                    deposit = None
+                # Confirm with the chain before spending ETH
+                if (auto_deposit and not deposit and ledger.balance <= refill_at
+                        and self.reconcile_ledger().balance <= refill_at):
+                    self._log(f"{ledger.balance} taps left! Depositing...")
+                    self.deposit(package_id=package_id, wait=False)
+                    deposit = self.pending_deposit
+                
+                if replacer:
+                    self.replace_stuck(replacer)
+                
+                if ledger.balance <= 0:
+                    if not auto_deposit:
+                        self._log("Out of taps!")
+                        break
+                    # Waiting for the deposit to confirm
+                    if clock:
+                        block = clock.wait(slot, block)
+                    else:
+                        time.sleep(delay)
+                    continue
+                
+                # Send tap (or a coalesced batch)
+                n = 1
+                if scheduler:
+                    limit = ledger.balance if count is None else min(ledger.balance, count - taps_done)
+                    self._get_fees()
+                    n = scheduler.due(self.fee_oracle.gas_price, limit)
+                if n == 1:
+                    tx_hash = self.fast_tap()
+                elif n > 1:
+                    tx_hash = self.batch_tap(n)
+                if scheduler and n:
+                    scheduler.sent(n)
+                taps_done += n
+                
+                # Log every 10 taps (points predicted by the ledger)
+                if taps_done >= next_report:
+                    next_report = (taps_done // 10 + 1) * 10
+                    self._log(f"TAP x{taps_done} | pts: {ledger.points} | tx: {tx_hash[:10]}...")
+                
+                errors = 0  # Reset error counter
+                
+            except Exception as e:
+                errors += 1
+                error_msg = str(e)
+                self.metrics.error(e)
+                
+                if NonceManager.is_nonce_error(e):
+                    # Already resynced by the nonce manager
+                    self._log("Nonce error, resynced")
+                elif "insufficient funds" in error_msg.lower():
+                    self._log("ERROR: Insufficient ETH for gas!")
+                    break
+                elif "blacklisted" in error_msg.lower():
+                    self._log("ERROR: Wallet is blacklisted!")
+                    break
+                else:
+                    self._log(f"Error: {error_msg}")
+                
+                if errors >= max_errors:
+                    self._log(f"Too many errors ({errors}), stopping")
+                    break
+            
+            if clock:
+                block = clock.wait(slot, block)
+            else:
+                time.sleep(delay)
+        
+        self._log(f"Tap loop finished. Total taps: {taps_done}")
+    
+    # =========================================================================
+    # UTILITY METHODS
+    # =========================================================================
+    
+    def get_eth_balance(self, use_burner: bool = False) -> float:
+        """Get ETH balance of main or burner wallet"""
+        address = self.burner.address if use_burner and self.burner else self.address
+        balance = self.w3.eth.get_balance(address)
+        return float(self.w3.from_wei(balance, 'ether'))
+    
+    def get_status(self, indexer: Optional[EventIndexer] = None) -> Tuple[UserInfo, float, float]:
+        """
+        Get (user info, main ETH, burner ETH) in a single multicall.
+        With an EventIndexer that has this wallet, only the ETH balances are read.
+        """
+        info = indexer.user_info(self.address) if indexer else None
+        return self._status_from(multicall(self.w3, self._status_calls(info)), info)
+    
+    def print_status(self, indexer: Optional[EventIndexer] = None):
+        """Print current status"""
+        self._print_status(*self.get_status(indexer))
+
+
+# =============================================================================
+# ASYNC BASION BOT
+# =============================================================================
+
+class AsyncBasionBot(_BaseBot):
+    """
+    Native asyncio version of BasionBot (AsyncWeb3 + httpx.AsyncClient).
+    
+    One event loop can drive thousands of wallets without a thread per
+    wallet. Method names match BasionBot; network methods are coroutines.
+    
+    Usage:
+        bot = AsyncBasionBot(private_key="0x...", proxy="http://...")
+        await bot.tap_loop(count=100)
+        await bot.aclose()
+    """
+    
+    def __init__(
+        self,
+        private_key: str,
+        proxy: Optional[str] = None,
+        rpc_url: str = RPC_URL,
+        burner_file: Optional[str] = None,
+        nonce_manager: Optional[NonceManager] = None,
+        signer: Optional[SigningPool] = None,
+        fee_oracle: Optional[FeeOracle] = None,
+        clients: Optional[SharedClients] = None,
+        receipt_tracker: Optional[ReceiptTracker] = None,
+        store: Optional[StateStore] = None
+    ):
+        """
+        Initialize async Basion Bot.
+        
+        Args:
+            private_key: Main wallet private key (0x...)
+            proxy: Optional proxy URL (http://user:pass@ip:port or socks5://...)
+            rpc_url: RPC endpoint URL (comma-separated URLs for an RPC pool)
+            burner_file: Optional file to save/load burner wallet
+            nonce_manager: Nonce allocator (defaults to the process-wide one)
+            signer: Optional SigningPool to sign in worker processes
+            fee_oracle: Fee source (defaults to the shared one for rpc_url)
+            clients: SharedClients to reuse Web3 / contracts / HTTP clients
+            receipt_tracker: Receipt poller (defaults to the shared one for rpc_url)
+            store: Optional StateStore to persist burner, nonces and tx journal
+        """
+        super().__init__(private_key, proxy, rpc_url, burner_file, nonce_manager, signer, store)
+        
+        # Web3, contracts and proxied HTTP client (shared with other bots if given)
+        self._owns_clients = clients is None
+        self.clients = clients or SharedClients(asynchronous=True)
+        self.w3, self.contract, self.multicall = self.clients.web3(rpc_url)
+        self.http = self.clients.http(proxy)
+        
+        # EIP-1559 fees, refreshed once per block for all bots on this RPC
+        self.fee_oracle = fee_oracle or FeeOracle.shared(rpc_url)
+        
+        # Batched receipt polling for all bots on this RPC
+        self.receipts = receipt_tracker or ReceiptTracker.shared(rpc_url)
+        
+        if store:
+            self._resume_state()
+        
+        self._log(f"Initialized async bot for {self.address[:10]}...{self.address[-6:]}")
+    
+    async def aclose(self):
+        """Close HTTP connections (shared clients are closed by their owner)"""
+        if self._owns_clients:
+            self.nonces.detach(self.w3)
+            await self.clients.aclose()
+    
+    async def _sign_message_async(self, message: str, use_burner: bool = False) -> str:
+        """_sign_message without blocking the event loop on the signing pool"""
+        if not self.signer:
+            return self._sign_message(message, use_burner)
+        account, _ = self._signer(use_burner)
+        return await asyncio.wrap_future(self.signer.submit_message(account.address, message))
+    
+    async def _api_tap_body_async(self, count: int, refresh: bool = False) -> Dict[str, Any]:
+        """_api_tap_body with a new signature awaited from the signing pool"""
+        if self._api_auth_stale(refresh):
+            now, timestamp, message = self._api_auth_message()
+            self._api_auth = (now, timestamp, await self._sign_message_async(message))
+        return self._api_tap_body(count)
+    
+    # =========================================================================
+    # API METHODS
+    # =========================================================================
+    
+    async def api_get_burner(self, refresh: bool = False) -> Optional[str]:
+        """Check if burner exists on backend. Returns burner address or None."""
+        try:
+            data = await self.api_cache.get_async(
+                self.http, f"{API_BASE}/api/get-burner?wallet={self.address}", refresh
+            )
+            if data.get("exists"):
+                return data.get("burnerAddress")
+        except Exception as e:
+            self._log(f"API get-burner error: {e}")
+        return None
+    
+    async def api_register_burner(self) -> bool:
+        """Register burner wallet with backend"""
+        if not self.burner:
+            raise ValueError("No burner wallet created")
+        
+        timestamp = self._get_timestamp()
+        message = f"Register burner {self.burner.address} for {self.address} at {timestamp}"
+        signature = await self._sign_message_async(message)
+        
+        try:
+            self._api_invalidate()
+            resp = await self.http.post(
+                f"{API_BASE}/api/register-burner",
+                json={
+                    "mainWallet": self.address,
+                    "burnerWallet": self.burner.address,
+                    "privateKey": self.burner.private_key,
+                    "signature": signature,
+                    "timestamp": timestamp
+                }
+            )
+            data = resp.json()
+            if data.get("success"):
+                self._log("Registered burner with backend")
+                return True
+            else:
+                self._log(f"Register burner failed: {data.get('error')}")
+        except Exception as e:
+            self._log(f"API register-burner error: {e}")
+        return False
+    
+    async def api_get_user_info(self, refresh: bool = False) -> Optional[Dict[str, Any]]:
+        """Get user info from API (cached, see ApiCache)"""
+        try:
+            return await self.api_cache.get_async(self.http, f"{API_BASE}/api/user/{self.address}", refresh)
+        except Exception as e:
+            self._log(f"API user info error: {e}")
+        return None
+    
+    async def api_tap(self, count: int = 1) -> Dict[str, Any]:
+        """Send tap via API (server-side processing, signature reused)"""
+        resp = await self.http.post(f"{API_BASE}/api/tap", json=await self._api_tap_body_async(count))
+        if resp.status_code == 401:
+            body = await self._api_tap_body_async(count, refresh=True)
+            resp = await self.http.post(f"{API_BASE}/api/tap", json=body)
+        return resp.json()
+    
+    async def api_redeem_boost(self, code: str) -> Dict[str, Any]:
+        """Redeem a boost code"""
+        self._api_invalidate()
+        resp = await self.http.post(
             f"{API_BASE}/api/boost/redeem",
             json={
                 "address": self.address,
@@ -395,71 +5283,83 @@ class BasionBot:
         )
         return resp.json()
     
-    def api_get_leaderboard(self, limit: int = 100) -> list:
-        """Get leaderboard"""
-        resp = self.http.get(f"{API_BASE}/api/leaderboard?limit={limit}")
-        return resp.json()
+    async def api_get_leaderboard(self, limit: int = API_LEADERBOARD_MAX, refresh: bool = False) -> list:
+        """Get leaderboard (one cached full page, sliced to limit)"""
+        board = await self.api_cache.get_async(
+            self.http, f"{API_BASE}/api/leaderboard?limit={API_LEADERBOARD_MAX}", refresh
+        )
+        return board[:limit]
+    
+    async def api_get_rank(self, refresh: bool = False) -> Optional[int]:
+        """Leaderboard rank of this wallet (None if not in the top API_LEADERBOARD_MAX)"""
+        return _leaderboard_rank(await self.api_get_leaderboard(refresh=refresh), self.address)
     
     # =========================================================================
     # CONTRACT READ METHODS
     # =========================================================================
     
-    def get_user_info(self) -> UserInfo:
-        """Get complete user info from contract"""
-        # Get points
-        premium, standard, total = self.contract.functions.getPoints(self.address).call()
-        
-        # Get user info
-        taps, multiplier, burner = self.contract.functions.getUserInfo(self.address).call()
-        
-        # Get referrer
-        referrer = self.contract.functions.referrer(self.address).call()
-        
-        # Get blacklist status
-        is_blacklisted = self.contract.functions.blacklisted(self.address).call()
-        
-        return UserInfo(
-            address=self.address,
-            burner_address=burner if burner != "0x" + "0" * 40 else None,
-            taps_remaining=taps,
-            premium_points=premium,
-            standard_points=standard,
-            total_points=total,
-            multiplier=multiplier,
-            referrer=referrer if referrer != "0x" + "0" * 40 else None,
-            is_blacklisted=is_blacklisted
-        )
+    async def get_user_info(self) -> UserInfo:
+        """Get complete user info from contract (one multicall)"""
+        return self._make_user_info(self.address, *await multicall_async(self.w3, self._user_info_calls()))
     
-    def get_tap_balance(self) -> int:
+    async def get_status(self, indexer: Optional[EventIndexer] = None) -> Tuple[UserInfo, float, float]:
+        """Get (user info, main ETH, burner ETH) in a single multicall (see BasionBot.get_status)"""
+        info = indexer.user_info(self.address) if indexer else None
+        return self._status_from(await multicall_async(self.w3, self._status_calls(info)), info)
+    
+    async def print_status(self, indexer: Optional[EventIndexer] = None):
+        """Print current status"""
+        self._print_status(*await self.get_status(indexer))
+    
+    async def get_tap_balance(self) -> int:
         """Get remaining taps from contract"""
-        return self.contract.functions.tapBalance(self.address).call()
+        return await self.contract.functions.tapBalance(self.address).call()
     
-    def get_points(self) -> Tuple[int, int, int]:
+    async def get_tap_state(self) -> Tuple[int, Tuple[int, int, int]]:
+        """Get (tap balance, points) in a single multicall"""
+        fns = self.contract.functions
+        balance, points = await multicall_async(self.w3, [
+            fns.tapBalance(self.address),
+            fns.getPoints(self.address),
+        ])
+        return balance, tuple(points)
+    
+    async def get_points(self) -> Tuple[int, int, int]:
         """Get points (premium, standard, total)"""
-        return self.contract.functions.getPoints(self.address).call()
+        return await self.contract.functions.getPoints(self.address).call()
     
-    def get_burner_from_contract(self) -> Optional[str]:
+    async def reconcile_ledger(self) -> TapLedger:
+        """Seed / correct the local tap ledger from the chain"""
+        mined = await self.w3.eth.get_transaction_count(self.burner.address) if self.burner else 0
+        fns = self.contract.functions
+        (taps, multiplier, _), points = await multicall_async(self.w3, [
+            fns.getUserInfo(self.address),
+            fns.getPoints(self.address),
+        ])
+        self.ledger.apply(taps, points, multiplier, mined)
+        self._save_ledger()
+        return self.ledger
+    
+    async def get_burner_from_contract(self) -> Optional[str]:
         """Get registered burner address from contract"""
-        burner = self.contract.functions.userToBurner(self.address).call()
-        return burner if burner != "0x" + "0" * 40 else None
+        burner = await self.contract.functions.userToBurner(self.address).call()
+        return self._or_none(burner)
     
-    def get_package_info(self, package_id: int) -> Tuple[int, int, bool]:
-        """Get package info (price_wei, taps, active)"""
-        return self.contract.functions.getPackage(package_id).call()
+    async def get_eth_balance(self, use_burner: bool = False) -> float:
+        """Get ETH balance of main or burner wallet"""
+        address = self.burner.address if use_burner and self.burner else self.address
+        balance = await self.w3.eth.get_balance(address)
+        return float(self.w3.from_wei(balance, 'ether'))
     
     # =========================================================================
     # CONTRACT WRITE METHODS
     # =========================================================================
     
-    def _get_gas_price(self) -> int:
-        """Get gas price with caching (30 seconds)"""
-        now = time.time()
-        if self._gas_price is None or now - self._gas_price_time > 30:
-            self._gas_price = self.w3.eth.gas_price
-            self._gas_price_time = now
-        return self._gas_price
+    async def _get_fees(self) -> Dict[str, int]:
+        """Get EIP-1559 fee fields (shared oracle, refreshed once per block)"""
+        return await self.fee_oracle.fees_async(self.w3)
     
-    def _send_tx(
+    async def _send_tx(
         self,
         func,
         value: int = 0,
@@ -467,40 +5367,57 @@ class BasionBot:
         gas_limit: int = 100000
     ) -> str:
         """Send transaction and return tx hash"""
-        account = Account.from_key(
-            self.burner.private_key if use_burner and self.burner else self.private_key
-        )
-        address = account.address
-        
-        # Get nonce
-        nonce = self.w3.eth.get_transaction_count(address, 'pending')
+        account, _ = self._signer(use_burner)
         
-        # Get gas price
-        gas_price = self._get_gas_price()
-        
-        # Build transaction
-        tx = func.build_transaction({
-            'from': address,
+        # Build transaction (nonce is filled in by _sign_and_send)
+        tx = await func.build_transaction({
+            'from': account.address,
             'value': value,
             'gas': gas_limit,
-            'gasPrice': gas_price,
-            'nonce': nonce,
+            **await self._get_fees(),
+            'nonce': 0,
             'chainId': CHAIN_ID
         })
         
-        # Sign and send
-        signed = self.w3.eth.account.sign_transaction(tx, account.key)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
-        
-        return tx_hash.hex()
+        return await self._sign_and_send(tx, use_burner)
+    
+    async def _sign_and_send(self, tx: Dict[str, Any], use_burner: bool = False) -> str:
+        """Assign nonce, sign and broadcast (one retry on nonce errors)"""
+        account, key = self._signer(use_burner)
+        for attempt in range(2):
+            tx['nonce'] = await self.nonces.allocate_async(account.address, self.w3)
+            start = time.perf_counter()
+            if self.signer:
+                # Don't block the event loop while a worker signs
+                raw_tx = await asyncio.wrap_future(
+                    self.signer.submit_transaction(account.address, tx)
+                )
+            else:
+                raw_tx = Account.sign_transaction(tx, key).raw_transaction
+            self.metrics.since("basion_tx_sign_seconds", start)
+            start = time.perf_counter()
+            try:
+                tx_hash = (await self.w3.eth.send_raw_transaction(raw_tx)).hex()
+                self.metrics.since("basion_tx_send_seconds", start)
+            except Exception as e:
+                if self.nonces.is_already_known(e):
+                    # Accepted earlier (e.g. by another endpoint); resending
+                    # under a new nonce would double-send
+                    tx_hash = keccak(raw_tx).hex()
+                elif not self.nonces.handle_error(account.address, tx['nonce'], e) or attempt:
+                    raise
+                else:
+                    continue
+            self._remember(account.address, tx, tx_hash, use_burner)
+            return tx_hash
     
-    def register_burner_on_chain(self) -> str:
-        """Register burner wallet on blockchain"""
+    async def register_burner_on_chain(self, wait: bool = True) -> str:
+        """Register burner wallet on blockchain (wait=False: don't await the receipt)"""
         if not self.burner:
             raise ValueError("No burner wallet created")
         
-        self._log(f"Registering burner on chain...")
-        tx_hash = self._send_tx(
+        self._log("Registering burner on chain...")
+        tx_hash = await self._send_tx(
             self.contract.functions.registerBurner(
                 Web3.to_checksum_address(self.burner.address)
             ),
@@ -508,15 +5425,20 @@ class BasionBot:
         )
         self._log(f"Register burner tx: {tx_hash}")
         
-        # Wait for confirmation
-        self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-        self._log("Burner registered on chain!")
+        if wait:
+            # Other wallets keep running meanwhile; shielded so a cancelled
+            # waiter doesn't cancel the tracker's shared future
+            receipt = await asyncio.shield(asyncio.wrap_future(self.receipts.track(tx_hash)))
+            if receipt['status'] != 1:
+                raise Exception(f"Register burner reverted: {tx_hash}")
+            self._log("Burner registered on chain!")
         return tx_hash
     
-    def deposit(
+    async def deposit(
         self,
         package_id: int = 1,
-        referrer: Optional[str] = None
+        referrer: Optional[str] = None,
+        wait: bool = True
     ) -> str:
         """
         Deposit ETH to buy taps.
@@ -524,6 +5446,8 @@ class BasionBot:
         Args:
             package_id: 0 = 2000 taps ($3), 1 = 7000 taps ($10)
             referrer: Optional referrer address
+            wait: Block until confirmed (False: taps are credited to the
+                ledger in the background, see self.pending_deposit)
         
         Returns:
             Transaction hash
@@ -533,40 +5457,32 @@ class BasionBot:
         
         _, taps, eth_price = PACKAGES[package_id]
         value_wei = self.w3.to_wei(eth_price, 'ether')
-        
-        referrer_addr = Web3.to_checksum_address(
-            referrer if referrer else "0x" + "0" * 40
-        )
+        referrer_addr = Web3.to_checksum_address(referrer or ZERO_ADDRESS)
         
         self._log(f"Depositing {eth_price} ETH for {taps} taps...")
-        tx_hash = self._send_tx(
+        tx_hash = await self._send_tx(
             self.contract.functions.deposit(package_id, referrer_addr),
             value=value_wei,
             gas_limit=200000
         )
         self._log(f"Deposit tx: {tx_hash}")
         
-        # Wait for confirmation
-        self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-        self._log(f"Deposit confirmed! +{taps} taps")
+        future = self._track_deposit(tx_hash, taps)
+        if wait:
+            await asyncio.shield(asyncio.wrap_future(future))
         return tx_hash
     
-    def tap(self) -> str:
-        """
-        Perform single tap directly on contract (fastest method).
-        Must be called from burner wallet.
-        """
+    async def tap(self) -> str:
+        """Perform single tap directly on contract (from burner wallet)"""
         if not self.burner:
             raise ValueError("No burner wallet. Call setup() first.")
         
-        tx_hash = self._send_tx(
-            self.contract.functions.tap(),
-            use_burner=True,
-            gas_limit=100000
-        )
+        tx = self._build_tap(await self._get_fees())
+        tx_hash = await self._sign_and_send(tx, use_burner=True)
+        self._sent_taps(tx_hash, tx['nonce'], 1)
         return tx_hash
     
-    def batch_tap(self, count: int) -> str:
+    async def batch_tap(self, count: int) -> str:
         """
         Perform multiple taps in one transaction.
         
@@ -579,320 +5495,1418 @@ class BasionBot:
         if count < 1 or count > 100:
             raise ValueError("Count must be 1-100")
         
-        tx_hash = self._send_tx(
-            self.contract.functions.batchTap(count),
-            use_burner=True,
-            gas_limit=100000 + (count * 5000)
-        )
+        tx = self._build_tap(await self._get_fees(), count)
+        tx_hash = await self._sign_and_send(tx, use_burner=True)
+        self._sent_taps(tx_hash, tx['nonce'], count)
+        return tx_hash
+    
+    async def fast_tap(self) -> str:
+        """Tap without waiting for confirmation (local nonce management)"""
+        if not self.burner:
+            raise ValueError("No burner wallet")
+        
+        tx = self._build_tap(await self._get_fees())
+        tx_hash = await self._sign_and_send(tx, use_burner=True)
+        self._sent_taps(tx_hash, tx['nonce'], 1)
         return tx_hash
     
+    def reset_nonce(self):
+        """Resync burner nonce with the chain (call if transactions fail)"""
+        if self.burner:
+            self.nonces.resync(self.burner.address)
+    
+    async def replace_stuck(self, replacer: TxReplacer) -> int:
+        """Speed up or cancel stuck txs (see BasionBot.replace_stuck)"""
+        stuck = self._stuck(replacer)
+        if not stuck:
+            return 0
+        current = await self._get_fees()
+        replaced = 0
+        for address, sent in stuck:
+            tx, cancel = self._replacement(replacer, address, sent, current)
+            account, key = self._signer(sent.use_burner)
+            if self.signer:
+                raw_tx = await asyncio.wrap_future(self.signer.submit_transaction(account.address, tx))
+            else:
+                raw_tx = Account.sign_transaction(tx, key).raw_transaction
+            try:
+                tx_hash = (await self.w3.eth.send_raw_transaction(raw_tx)).hex()
+            except Exception as e:
+                self._replacement_failed(sent, tx, e)
+                continue
+            self._replaced(address, sent, tx, tx_hash, cancel)
+            replaced += 1
+        return replaced
+    
     # =========================================================================
-    # FAST TAP (OPTIMIZED FOR SPEED)
+    # HIGH-LEVEL METHODS
     # =========================================================================
     
-    def fast_tap(self) -> str:
+    async def setup(self, package_id: int = 1, referrer: Optional[str] = None) -> bool:
+        """Complete setup for new user (see BasionBot.setup)"""
+        self._log("Starting setup...")
+        
+        on_chain_burner = await self.get_burner_from_contract()
+        if on_chain_burner:
+            self._log(f"Already has burner on chain: {on_chain_burner}")
+            if not self.burner:
+                self._log("ERROR: Burner exists but no local key! Cannot tap.")
+                return False
+            return True
+        
+        if not self.burner:
+            self.create_burner()
+        
+        await self.register_burner_on_chain()
+        await self.api_register_burner()
+        await self.deposit(package_id=package_id, referrer=referrer)
+        
+        self._log("Setup complete!")
+        return True
+    
+    async def tap_loop(
+        self,
+        count: Optional[int] = None,
+        delay: float = 1.1,
+        auto_deposit: bool = True,
+        package_id: int = 1,
+        scheduler: Optional[TapScheduler] = None,
+        refill_at: int = 0,
+        replacer: Optional[TxReplacer] = None,
+        clock: Optional[BlockClock] = None
+    ):
         """
-        Optimized tap with local nonce management.
-        Allows ~1 tap per second without waiting for confirmation.
+        Main tap loop (see BasionBot.tap_loop). Sleeps with asyncio.sleep,
+        so other wallets on the same loop keep running.
         """
-        if not self.burner:
-            raise ValueError("No burner wallet")
+        self._log(f"Starting async tap loop (count={count}, delay={'block slot' if clock else f'{delay}s'})")
         
-        burner_account = Account.from_key(self.burner.private_key)
+        taps_done = 0
+        next_report = 10
+        ledger = self.ledger
+        deposit: Optional[Future] = None
+        errors = 0
+        max_errors = 10
+        last_reconcile = time.time()
         
-        # Get nonce only once, then increment locally
-        if self._nonce is None:
-            self._nonce = self.w3.eth.get_transaction_count(
-                burner_account.address, 'pending'
-            )
+        if clock:
+            slot = clock.slot(self.address)
+            clock.subscribe(self.fee_oracle.on_block)
+            clock.subscribe(self.receipts.on_block)
+            block = await clock.wait_async(slot)
+        
+        while count is None or taps_done < count:
+            try:
+                if ledger.due():
+                    await self.reconcile_ledger()
+                
+                if deposit and deposit.done():
+                    if self._deposit_failed(deposit):
+                        self._log("ERROR: Deposit failed, stopping")
+                        break
+                    deposit = None
+                if (auto_deposit and not deposit and ledger.balance <= refill_at
+                        and (await self.reconcile_ledger()).balance <= refill_at):
+                    self._log(f"{ledger.balance} taps left! Depositing...")
+                    await self.deposit(package_id=package_id, wait=False)
+                    deposit = self.pending_deposit
+                
+                if replacer:
+                    await self.replace_stuck(replacer)
+                
+                if ledger.balance <= 0:
+                    if not auto_deposit:
+                        self._log("Out of taps!")
+                        break
+                    if clock:
+                        block = await clock.wait_async(slot, block)
+                    else:
+                        await asyncio.sleep(delay)
+                    continue
+                
+                n = 1
+                if scheduler:
+                    limit = ledger.balance if count is None else min(ledger.balance, count - taps_done)
+                    await self._get_fees()
+                    n = scheduler.due(self.fee_oracle.gas_price, limit)
+                if n == 1:
+                    tx_hash = await self.fast_tap()
+                elif n > 1:
+                    tx_hash = await self.batch_tap(n)
+                if scheduler and n:
+                    scheduler.sent(n)
+                taps_done += n
+                
+                if taps_done >= next_report:
+                    next_report = (taps_done // 10 + 1) * 10
+                    self._log(f"TAP x{taps_done} | pts: {ledger.points} | tx: {tx_hash[:10]}...")
+                
+                # The nonce reconciler thread skips async bots
+                if time.time() - last_reconcile > self.nonces.reconcile_interval:
+                    last_reconcile = time.time()
+                    await self.nonces.reconcile_async(self.burner.address)
+                
+                errors = 0
+                
+            except Exception as e:
+                errors += 1
+                error_msg = str(e)
+                self.metrics.error(e)
+                
+                if NonceManager.is_nonce_error(e):
+                    self._log("Nonce error, resynced")
+                elif "insufficient funds" in error_msg.lower():
+                    self._log("ERROR: Insufficient ETH for gas!")
+                    break
+                elif "blacklisted" in error_msg.lower():
+                    self._log("ERROR: Wallet is blacklisted!")
+                    break
+                else:
+                    self._log(f"Error: {error_msg}")
+                
+                if errors >= max_errors:
+                    self._log(f"Too many errors ({errors}), stopping")
+                    break
+            
+            if clock:
+                block = await clock.wait_async(slot, block)
+            else:
+                await asyncio.sleep(delay)
+        
+        self._log(f"Tap loop finished. Total taps: {taps_done}")
+
+
+# =============================================================================
+# API TAP CLIENT
+# =============================================================================
+
+# /api/tap errors that won't go away by retrying soon
+_API_TAP_FATAL = ("no taps remaining", "banned", "no burner", "not registered", "insufficient gas")
+
+
+class ApiTapClient:
+    """
+    High-throughput /api/tap client for many AsyncBasionBots.
+    
+    - each wallet's signature is reused for minutes (see _api_tap_body)
+    - pending taps per wallet are coalesced into requests of up to
+      API_TAP_MAX_COUNT taps (note: the server credits count > 1 as
+      standard rather than premium points)
+    - requests run concurrently on the proxy's pooled AsyncClient, at most
+      `per_proxy` in flight per proxy and one per wallet (the server sends
+      each request's tx from the wallet's burner, so parallel requests for
+      one wallet would race for its nonce)
+    
+    Usage:
+        client = ApiTapClient(per_proxy=8)
+        for bot in bots:
+            client.add(bot, 500)
+        await client.flush()
+        print(client.stats())
+    """
+    
+    def __init__(self, per_proxy: int = 8, max_count: int = API_TAP_MAX_COUNT):
+        """
+        Args:
+            per_proxy: Max concurrent requests per proxy
+            max_count: Max taps per request (server limit: 100)
+        """
+        self.per_proxy = per_proxy
+        self.max_count = min(max_count, API_TAP_MAX_COUNT)
+        self.requests = 0
+        self.taps = 0
+        self.errors = 0
+        self.failed: Dict[str, str] = {}  # wallet -> last error
+        self._pending: Dict[str, int] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        self._slots: Dict[Optional[str], asyncio.Semaphore] = {}
+    
+    def add(self, bot: "AsyncBasionBot", taps: int = 1):
+        """Queue taps for a wallet (coalesced with its other pending taps)"""
+        self._pending[bot.address] = self._pending.get(bot.address, 0) + taps
+        worker = self._workers.get(bot.address)
+        if worker is None or worker.done():
+            self._workers[bot.address] = asyncio.ensure_future(self._drain(bot))
+    
+    @property
+    def pending(self) -> int:
+        return sum(self._pending.values())
+    
+    async def _drain(self, bot: "AsyncBasionBot"):
+        """Send a wallet's pending taps, one request at a time"""
+        slot = self._slots.setdefault(bot.proxy, asyncio.Semaphore(self.per_proxy))
+        while self._pending[bot.address] > 0:
+            count = min(self._pending[bot.address], self.max_count)
+            self._pending[bot.address] -= count
+            async with slot:
+                try:
+                    result = await bot.api_tap(count)
+                except Exception as e:
+                    result = {"success": False, "error": f"{type(e).__name__}: {e}"}
+            self.requests += 1
+            if result.get("success"):
+                self.taps += count
+                continue
+            self.errors += 1
+            error = str(result.get("error", result))
+            self.failed[bot.address] = error
+            bot._log(f"API tap failed ({count} taps): {error}")
+            if any(hint in error.lower() for hint in _API_TAP_FATAL):
+                self._pending[bot.address] = 0
+    
+    async def flush(self):
+        """Wait until every queued tap has been sent"""
+        while any(not worker.done() for worker in self._workers.values()):
+            await asyncio.gather(*self._workers.values())
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "taps": self.taps,
+            "errors": self.errors,
+            "pending": self.pending,
+            "taps_per_request": round(self.taps / max(1, self.requests - self.errors), 1),
+        }
+
+
+# =============================================================================
+# MULTI-WALLET BOT
+# =============================================================================
+
+def iter_wallets(wallets_file: str) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    Stream (private_key, proxy) entries from a wallets file.
+    
+    File format (one per line):
+    PRIVATE_KEY:PROXY
+    
+    Blank lines and lines starting with # are skipped.
+    """
+    with open(wallets_file) as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield _parse_wallet(line)
+
+
+def _parse_wallet(line: str) -> Tuple[str, Optional[str]]:
+    # Split only on first colon after private key (66 chars for 0x + 64 hex)
+    pk_end = 66 if line.startswith("0x") else 64
+    private_key = line[:pk_end]
+    proxy = line[pk_end + 1:] or None
+    return private_key, proxy
+
+
+class _WalletsFile:
+    """
+    Lazy sequence of (private_key, proxy) entries of a wallets file.
+    
+    Only the byte offset of each entry is kept in memory: iterating streams
+    the file (see iter_wallets) and indexing reads the entry's line.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._offsets = array.array("q")
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                stripped = line.strip()
+                if stripped and not stripped.startswith(b"#"):
+                    self._offsets.append(offset)
+                offset += len(line)
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def __iter__(self) -> Iterator[Tuple[str, Optional[str]]]:
+        return iter_wallets(self.path)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._read(self._offsets[index])
+        return self._read([self._offsets[index]])[0]
+    
+    def _read(self, offsets) -> list:
+        with open(self.path, "rb") as f:
+            entries = []
+            for offset in offsets:
+                f.seek(offset)
+                entries.append(_parse_wallet(f.readline().decode().strip()))
+            return entries
+
+
+class MultiWalletBot:
+    """
+    Run multiple bots in parallel.
+    
+    Bots are constructed lazily: run_all() / run_all_async() start each
+    wallet's tap loop as soon as its bot exists instead of waiting for the
+    whole file to load.
+    
+    Everything runs in this process; FleetSupervisor shards a wallets file
+    over worker processes instead.
+    
+    Usage:
+        bot = MultiWalletBot("wallets.txt")
+        asyncio.run(bot.run_all())         # one thread per wallet
+        asyncio.run(bot.run_all_async())   # one event loop, AsyncBasionBot
+    """
+    
+    def __init__(
+        self,
+        wallets_file: str,
+        signer: Optional[SigningPool] = None,
+        store: Optional[StateStore] = None,
+        rpc_url: str = RPC_URL,
+        workers: int = 8,
+        limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Index wallets file (entries are read when their bot is built).
         
-        # Get cached gas price
-        gas_price = self._get_gas_price()
+        Args:
+            wallets_file: Path to wallets file
+            signer: Optional SigningPool shared by all bots (multi-core signing)
+            store: Optional StateStore shared by all bots (resume after restart)
+            rpc_url: RPC endpoint URL for all bots (comma-separated for a pool)
+            workers: Threads used by build() to construct bots in parallel
+            limiter: Rate limiter for the fleet (default: RateLimiter.shared())
         
-        # Build transaction
-        tx = self.contract.functions.tap().build_transaction({
-            'from': burner_account.address,
-            'gas': 100000,
-            'gasPrice': gas_price,
-            'nonce': self._nonce,
-            'chainId': CHAIN_ID
-        })
+        File format (one per line):
+        PRIVATE_KEY:PROXY
+        
+        Example:
+        0xABC123:http://user:pass@ip:port
+        0xDEF456:socks5://user:pass@ip:port
+        0x789ABC:
+        """
+        # Entries are read from the file when a bot is built, not held in memory
+        self.wallets = _WalletsFile(wallets_file)
+        self.signer = signer
+        self.store = store
+        self.rpc_url = rpc_url
+        self.workers = workers
+        
+        # Bots built so far, in file order (see iter_bots / build)
+        self._bots: list[BasionBot] = []
+        self._bots_lock = threading.Lock()
+        
+        # One Web3 / contract set per RPC and one HTTP client per proxy,
+        # all paced by the same rate limiter
+        self.clients = SharedClients(limiter=limiter)
+        
+        print(f"Loaded {len(self.wallets)} wallets")
+    
+    def _make_bot(self, private_key: str, proxy: Optional[str]) -> BasionBot:
+        return BasionBot(
+            private_key=private_key, proxy=proxy, rpc_url=self.rpc_url,
+            signer=self.signer, clients=self.clients, store=self.store
+        )
+    
+    @property
+    def bots(self) -> list:
+        """All bots (constructs the remaining ones on first access)"""
+        if len(self._bots) < len(self.wallets):
+            self.build()
+        return self._bots
+    
+    def iter_bots(self) -> Iterator[BasionBot]:
+        """Yield bots in file order, constructing each one when first reached"""
+        for i, (private_key, proxy) in enumerate(self.wallets):
+            with self._bots_lock:
+                if i == len(self._bots):
+                    self._bots.append(self._make_bot(private_key, proxy))
+                bot = self._bots[i]
+            yield bot
+    
+    def build(self) -> list:
+        """Construct all remaining bots on `workers` threads (keeps file order)"""
+        with self._bots_lock:
+            pending = self.wallets[len(self._bots):]
+            if pending:
+                with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+                    self._bots.extend(executor.map(lambda w: self._make_bot(*w), pending))
+        return self._bots
+    
+    async def run_bot(
+        self,
+        bot: BasionBot,
+        count: Optional[int] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+        **tap_options
+    ):
+        """Run single bot in async context (tap_options go to tap_loop)"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(executor, lambda: bot.tap_loop(count=count, **tap_options))
+    
+    async def run_all(self, count: Optional[int] = None, **tap_options):
+        """Run all bots in parallel (one thread per wallet)"""
+        # The default executor is capped at min(32, cpu + 4) threads
+        with ThreadPoolExecutor(max_workers=max(1, len(self.wallets))) as executor:
+            tasks = []
+            for bot in self.iter_bots():
+                tasks.append(asyncio.ensure_future(self.run_bot(bot, count, executor, **tap_options)))
+                await asyncio.sleep(0)  # Let started bots tap while the rest load
+            await asyncio.gather(*tasks)
+    
+    async def run_all_async(self, count: Optional[int] = None, **tap_options):
+        """Run all wallets as AsyncBasionBot tasks on the current event loop"""
+        clients = SharedClients(asynchronous=True, limiter=self.clients.limiter)
+        tasks = []
+        try:
+            for private_key, proxy in self.wallets:
+                bot = AsyncBasionBot(
+                    private_key=private_key, proxy=proxy, rpc_url=self.rpc_url,
+                    signer=self.signer, clients=clients, store=self.store
+                )
+                tasks.append(asyncio.ensure_future(bot.tap_loop(count=count, **tap_options)))
+                await asyncio.sleep(0)  # Let started bots tap while the rest load
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await clients.aclose()
+    
+    async def api_tap_all(self, taps: int, per_proxy: int = 8) -> Dict[str, Any]:
+        """
+        Send `taps` server-side taps (/api/tap) for every wallet through an
+        ApiTapClient: one signature per wallet, 100-tap requests, concurrent
+        per proxy. Returns the client's stats.
+        """
+        clients = SharedClients(asynchronous=True, limiter=self.clients.limiter)
+        tapper = ApiTapClient(per_proxy=per_proxy)
+        try:
+            for private_key, proxy in self.wallets:
+                tapper.add(AsyncBasionBot(
+                    private_key=private_key, proxy=proxy, rpc_url=self.rpc_url,
+                    signer=self.signer, clients=clients, store=self.store
+                ), taps)
+                await asyncio.sleep(0)  # Let started wallets send while the rest load
+            await tapper.flush()
+        finally:
+            await clients.aclose()
+        return tapper.stats()
+    
+    def check_burners(self) -> Dict[str, Optional[str]]:
+        """
+        Get the burner registered on-chain for every wallet (None if unset).
+        
+        One userToBurner read per wallet, aggregated through Multicall3
+        per RPC instead of one eth_call each.
+        """
+        by_rpc: Dict[str, list] = {}
+        for bot in self.bots:
+            by_rpc.setdefault(bot.rpc_url, []).append(bot)
         
-        # Sign and send
-        signed = self.w3.eth.account.sign_transaction(tx, burner_account.key)
-        tx_hash = self.w3.eth.send_raw_transaction(signed.raw_transaction)
+        burners = {}
+        for bots in by_rpc.values():
+            results = multicall(
+                bots[0].w3,
+                [bot.contract.functions.userToBurner(bot.address) for bot in bots]
+            )
+            for bot, burner in zip(bots, results):
+                burners[bot.address] = bot._or_none(burner)
+        return burners
+    
+    def api_ranks(self, refresh: bool = False) -> Dict[str, Optional[int]]:
+        """
+        Leaderboard rank of every wallet (None if not in the top
+        API_LEADERBOARD_MAX), from one cached leaderboard request
+        """
+        if not self.wallets:
+            return {}
+        board = next(self.iter_bots()).api_get_leaderboard(refresh=refresh)
+        ranks = {str(e.get("wallet", "")).lower(): e.get("rank") for e in board}
+        return {bot.address: ranks.get(bot.address.lower()) for bot in self.bots}
+    
+    def event_indexer(self, **options) -> EventIndexer:
+        """
+        EventIndexer over the fleet's wallets and burners, on the fleet's
+        RPC and state store (options go to EventIndexer)
+        """
+        wallets = {bot.address: bot.burner.address if bot.burner else None for bot in self.bots}
+        options.setdefault("rpc_url", self.rpc_url)
+        options.setdefault("store", self.store)
+        return EventIndexer(wallets, **options)
+    
+    def refresh_status(self, indexer: Optional[EventIndexer] = None) -> Dict[str, Tuple[UserInfo, float, float]]:
+        """
+        Get (user info, main ETH, burner ETH) for every wallet.
         
-        # Increment nonce for next tx
-        self._nonce += 1
+        Reads for all bots sharing an RPC are aggregated into Multicall3
+        calls of up to MULTICALL_CHUNK_SIZE reads each. With an EventIndexer,
+        user info of indexed wallets comes from the index and only ETH
+        balances are read.
+        """
+        by_rpc: Dict[str, list] = {}
+        for bot in self.bots:
+            by_rpc.setdefault(bot.rpc_url, []).append(bot)
         
-        return tx_hash.hex()
+        status = {}
+        for bots in by_rpc.values():
+            calls, spans, infos = [], [], []
+            for bot in bots:
+                info = indexer.user_info(bot.address) if indexer else None
+                bot_calls = bot._status_calls(info)
+                infos.append(info)
+                spans.append(len(bot_calls))
+                calls.extend(bot_calls)
+            
+            results = multicall(bots[0].w3, calls)
+            offset = 0
+            for bot, span, info in zip(bots, spans, infos):
+                status[bot.address] = bot._status_from(results[offset:offset + span], info)
+                offset += span
+        return status
     
-    def reset_nonce(self):
-        """Reset local nonce (call if transactions fail)"""
-        self._nonce = None
+    def print_status_all(self, indexer: Optional[EventIndexer] = None):
+        """Print status of every wallet (batched reads), then fleet totals if indexed"""
+        status = self.refresh_status(indexer)
+        for bot in self.bots:
+            bot._print_status(*status[bot.address])
+        if indexer:
+            totals = indexer.totals()
+            print(
+                f"Fleet ({totals['wallets']} indexed wallets, block {totals['block']}): "
+                f"{totals['total_points']} points, {totals['tap_balance']} taps left, "
+                f"{totals['deposits']} deposits ({totals['eth_paid']:.4f} ETH)"
+            )
     
-    # =========================================================================
-    # HIGH-LEVEL METHODS
-    # =========================================================================
+    def close(self):
+        """Close the shared HTTP clients and RPC sessions"""
+        self.clients.close()
     
-    def setup(self, package_id: int = 1, referrer: Optional[str] = None) -> bool:
+    def setup_all(
+        self,
+        package_id: int = 1,
+        referrer: Optional[str] = None,
+        concurrency: int = 32,
+        api_concurrency: int = 8,
+        timeout: float = 300,
+        on_error: Optional[Callable[[str, str], None]] = None
+    ) -> Dict[str, Optional[str]]:
         """
-        Complete setup for new user:
-        1. Create burner wallet (if not exists)
-        2. Register burner on chain
-        3. Register burner with API
-        4. Make first deposit
+        Onboard every wallet without an on-chain burner, pipelined:
+        1. registerBurner is sent for all wallets (one batched burner check)
+        2. each wallet's deposit is sent as soon as its registration confirms
+        3. burners are registered with the API once the chain work is done
         
-        Returns True if setup successful.
-        """
-        self._log("Starting setup...")
+        Receipts are awaited by the shared ReceiptTracker, so worker threads
+        only sign and send and the whole fleet confirms in a few blocks.
         
-        # Check if already has burner on chain
-        on_chain_burner = self.get_burner_from_contract()
-        if on_chain_burner:
-            self._log(f"Already has burner on chain: {on_chain_burner}")
-            # If we don't have local burner key, we can't tap
-            if not self.burner:
-                self._log("ERROR: Burner exists but no local key! Cannot tap.")
-                return False
-            return True
+        Args:
+            package_id: Deposit package (see PACKAGES)
+            referrer: Optional referrer address
+            concurrency: Max transactions being signed / sent at once
+            api_concurrency: Max concurrent API registrations
+            timeout: Seconds to wait for each receipt
+            on_error: Called with (address, error) for each failed wallet
+                (default: logged by the wallet's bot)
         
-        # Create burner if not exists
-        if not self.burner:
-            self.create_burner()
+        Returns:
+            {address: None if set up, else "<stage>: <error>"} for every wallet
+        """
+        report: Dict[str, Optional[str]] = {}
+        done: Dict[str, Future] = {}
+        settle = threading.Lock()  # Callbacks and the timeout race to finish a wallet
         
-        # Register on blockchain
-        self.register_burner_on_chain()
+        def fail(bot: BasionBot, stage: str, error) -> None:
+            report[bot.address] = f"{stage}: {error}"
+            if on_error:
+                on_error(bot.address, report[bot.address])
+            else:
+                bot._log(f"Setup failed at {stage}: {error}")
         
-        # Register with API
-        self.api_register_burner()
+        def finish(bot: BasionBot, stage: Optional[str] = None, error=None) -> None:
+            with settle:
+                if done[bot.address].done():
+                    return  # Already finished (e.g. timed out)
+                try:
+                    if stage:
+                        fail(bot, stage, error)
+                finally:
+                    done[bot.address].set_result(stage is None)
         
-        # Make deposit
-        self.deposit(package_id=package_id, referrer=referrer)
+        def outcome(future: Future) -> Optional[str]:
+            if future.exception() is not None:
+                return str(future.exception())
+            receipt = future.result()
+            return None if receipt['status'] == 1 else f"reverted {receipt['transactionHash']}"
         
-        self._log("Setup complete!")
-        return True
-    
-    def ensure_taps(self, min_taps: int = 100, package_id: int = 1):
-        """Ensure we have at least min_taps available"""
-        current = self.get_tap_balance()
-        if current < min_taps:
-            self._log(f"Low taps ({current}), depositing...")
-            self.deposit(package_id=package_id)
-    
-    def tap_loop(
-        self,
-        count: Optional[int] = None,
-        delay: float = 1.1,
-        auto_deposit: bool = True,
-        package_id: int = 1
-    ):
-        """
-        Main tap loop.
+        def send_register(bot: BasionBot) -> None:
+            try:
+                if not bot.burner:
+                    bot.create_burner()
+                tx_hash = bot.register_burner_on_chain(wait=False)
+            except Exception as e:
+                return finish(bot, "registerBurner", e)
+            bot.receipts.track(tx_hash, timeout=timeout).add_done_callback(
+                lambda future: registered(bot, future)
+            )
         
-        Args:
-            count: Number of taps (None = infinite)
-            delay: Delay between taps in seconds
-            auto_deposit: Automatically deposit when out of taps
-            package_id: Package to use for auto-deposit
-        """
-        self._log(f"Starting tap loop (count={count}, delay={delay}s)")
+        def registered(bot: BasionBot, future: Future) -> None:
+            try:
+                error = outcome(future)
+                if error:
+                    return finish(bot, "registerBurner", error)
+                bot._log("Burner registered on chain!")
+                executor.submit(send_deposit, bot)
+            except Exception as e:
+                finish(bot, "registerBurner", e)
         
-        taps_done = 0
-        errors = 0
-        max_errors = 10
+        def send_deposit(bot: BasionBot) -> None:
+            try:
+                tx_hash = bot.deposit(package_id=package_id, referrer=referrer, wait=False)
+            except Exception as e:
+                return finish(bot, "deposit", e)
+            # Same future as bot.pending_deposit, with this call's timeout
+            bot.receipts.track(tx_hash, timeout=timeout).add_done_callback(
+                lambda future: deposited(bot, future)
+            )
         
-        while count is None or taps_done < count:
+        def deposited(bot: BasionBot, future: Future) -> None:
             try:
-                # Check taps every 10 taps or on error
-                if taps_done % 10 == 0:
-                    taps_remaining = self.get_tap_balance()
-                    if taps_remaining == 0:
-                        if auto_deposit:
-                            self._log("Out of taps! Depositing...")
-                            self.deposit(package_id=package_id)
-                            self.reset_nonce()  # Reset after deposit
-                        else:
-                            self._log("Out of taps!")
-                            break
-                
-                # Send tap
-                tx_hash = self.fast_tap()
-                taps_done += 1
-                
-                # Log every 10 taps
-                if taps_done % 10 == 0:
-                    _, _, total = self.get_points()
-                    self._log(f"TAP x{taps_done} | pts: {total} | tx: {tx_hash[:10]}...")
-                
-                errors = 0  # Reset error counter
-                
+                error = outcome(future)
+                finish(bot, "deposit" if error else None, error)
             except Exception as e:
-                errors += 1
-                error_msg = str(e)
-                
-                if "nonce" in error_msg.lower():
-                    self._log("Nonce error, resetting...")
-                    self.reset_nonce()
-                elif "insufficient funds" in error_msg.lower():
-                    self._log("ERROR: Insufficient ETH for gas!")
-                    break
-                elif "blacklisted" in error_msg.lower():
-                    self._log("ERROR: Wallet is blacklisted!")
-                    break
-                else:
-                    self._log(f"Error: {error_msg}")
-                
-                if errors >= max_errors:
-                    self._log(f"Too many errors ({errors}), stopping")
-                    break
+                finish(bot, "deposit", e)
+        
+        burners = self.check_burners()
+        pending = []
+        for bot in self.bots:
+            if not burners[bot.address]:
+                pending.append(bot)
+            elif bot.burner:
+                report[bot.address] = None
+            else:
+                fail(bot, "burner", "registered on chain but no local key")
+        
+        if pending:
+            print(f"Setting up {len(pending)} wallets...")
+            for bot in pending:
+                done[bot.address] = Future()
+            # Two receipts per wallet, plus time to get every tx sent
+            deadline = time.time() + 2 * timeout + len(pending) / max(1, concurrency)
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                for bot in pending:
+                    executor.submit(send_register, bot)
+                for bot in pending:
+                    try:
+                        done[bot.address].result(timeout=max(0, deadline - time.time()))
+                    except FuturesTimeoutError:
+                        finish(bot, "timeout", "receipts not confirmed in time")
             
-            time.sleep(delay)
+            # Bulk API registration for wallets whose chain setup succeeded
+            onchain = [bot for bot in pending if bot.address not in report]
+            with ThreadPoolExecutor(max_workers=max(1, api_concurrency)) as executor:
+                for bot, ok in zip(onchain, executor.map(BasionBot.api_register_burner, onchain)):
+                    if ok:
+                        report[bot.address] = None
+                    else:
+                        fail(bot, "api", "burner registration rejected")
         
-        self._log(f"Tap loop finished. Total taps: {taps_done}")
+        failed = sum(1 for error in report.values() if error)
+        print(f"Setup: {len(report) - failed} ok, {failed} failed")
+        return report
+
+
+# =============================================================================
+# FLEET SUPERVISOR (MULTI-PROCESS)
+# =============================================================================
+
+def _scaled_limits(limits: Optional[dict], share: float) -> Tuple[dict, dict]:
+    """
+    (limits, direct_limits) for a RateLimiter in one worker. Only what all
+    workers share is cut to the worker's share: the RPC endpoints and the
+    direct (no-proxy) IP. Limits learned from 429s stay None.
+    """
+    def scaled(limit):
+        return None if limit is None else (limit[0] * share, max(1.0, limit[1] * share))
     
-    # =========================================================================
-    # UTILITY METHODS
-    # =========================================================================
+    limits = {**DEFAULT_RATE_LIMITS, **(limits or {})}
+    return (
+        {**limits, "rpc": scaled(limits["rpc"])},
+        {kind: scaled(limit) for kind, limit in limits.items()},
+    )
+
+
+def _counter_delta(current: dict, previous: dict) -> dict:
+    return {
+        key: value - previous.get(key, 0.0)
+        for key, value in current.items() if value != previous.get(key, 0.0)
+    }
+
+
+def _histogram_delta(current: dict, previous: dict) -> dict:
+    delta = {}
+    for key, histogram in current.items():
+        before = previous.get(key)
+        if before != histogram:
+            delta[key] = [a - b for a, b in zip(histogram, before)] if before else histogram
+    return delta
+
+
+class _FleetWorker:
+    """
+    One FleetSupervisor worker process: its shard of wallets as
+    AsyncBasionBot tasks on one event loop.
     
-    def get_eth_balance(self, use_burner: bool = False) -> float:
-        """Get ETH balance of main or burner wallet"""
-        address = self.burner.address if use_burner and self.burner else self.address
-        balance = self.w3.eth.get_balance(address)
-        return float(self.w3.from_wei(balance, 'ether'))
+    Commands from the supervisor pipe: ("add", wallets), ("remove",
+    indices), ("limits", (limits, direct_limits)), ("stop",). Messages
+    back: ("stats", (counters, histograms, taps per wallet index)) with
+    increments since the last report, ("removed", indices), ("done",
+    index) and ("failed", index, error).
+    """
     
-    def print_status(self):
-        """Print current status"""
-        info = self.get_user_info()
-        main_eth = self.get_eth_balance()
-        burner_eth = self.get_eth_balance(use_burner=True) if self.burner else 0
+    def __init__(self, conn, worker: int, options: Dict[str, Any]):
+        self.conn = conn
+        self.worker = worker
+        self.rpc_url = options["rpc_url"]
+        self.setup_package = options["setup_package"]
+        self.tap_options = options["tap_options"]
+        self.stats_interval = options["stats_interval"]
+        self.metrics = Metrics.shared()
+        self.clients = SharedClients(asynchronous=True, limiter=RateLimiter(*options["limits"]))
+        self.store = StateStore(options["state_file"]) if options["state_file"] else None
+        blocks = options["blocks"]
+        self.clock = BlockClock.shared(self.rpc_url, blocks or None) if blocks is not None else None
         
-        print("\n" + "=" * 50)
-        print(f"Main Wallet:    {self.address}")
-        print(f"Main ETH:       {main_eth:.6f} ETH")
-        print(f"Burner Wallet:  {info.burner_address or 'None'}")
-        print(f"Burner ETH:     {burner_eth:.6f} ETH")
-        print(f"Taps Remaining: {info.taps_remaining}")
-        print(f"Total Points:   {info.total_points}")
-        print(f"  Premium:      {info.premium_points}")
-        print(f"  Standard:     {info.standard_points}")
-        print(f"Multiplier:     {info.multiplier / 100:.2f}x")
-        print(f"Referrer:       {info.referrer or 'None'}")
-        print(f"Blacklisted:    {info.is_blacklisted}")
-        print("=" * 50 + "\n")
+        self.tasks: Dict[int, asyncio.Task] = {}
+        self.indices: Dict[str, int] = {}  # Wallet address -> index in the wallets file
+        self.stopping = False
+        self._reported: Tuple[dict, dict] = ({}, {})
+    
+    def _send(self, *message):
+        try:
+            self.conn.send(message)
+        except OSError:
+            self.stopping = True  # Supervisor gone
+    
+    def _report(self):
+        """Send metric increments since the last report"""
+        counters, histograms = self.metrics.raw()
+        delta = _counter_delta(counters, self._reported[0])
+        taps = {}
+        for (name, labels), value in delta.items():
+            index = self.indices.get(dict(labels).get("wallet")) if name == "basion_taps_total" else None
+            if index is not None:
+                taps[index] = value
+        self._send("stats", (delta, _histogram_delta(histograms, self._reported[1]), taps))
+        self._reported = (counters, histograms)
+    
+    async def _run_wallet(self, index: int, private_key: str, proxy: Optional[str], count: Optional[int]):
+        try:
+            bot = AsyncBasionBot(
+                private_key=private_key, proxy=proxy, rpc_url=self.rpc_url,
+                clients=self.clients, store=self.store
+            )
+            self.indices[bot.address] = index
+            if self.setup_package is not None and not await bot.setup(package_id=self.setup_package):
+                raise RuntimeError("setup failed")
+            await bot.tap_loop(count=count, clock=self.clock, **self.tap_options)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.metrics.error(e)
+            self._send("failed", index, f"{type(e).__name__}: {e}")
+        else:
+            self._send("done", index)
+    
+    async def _add(self, wallets: list):
+        for index, private_key, proxy, count in wallets:
+            if index not in self.tasks:
+                self.tasks[index] = asyncio.ensure_future(self._run_wallet(index, private_key, proxy, count))
+                await asyncio.sleep(0)  # Let started bots tap while the rest load
+    
+    async def _remove(self, indices: list):
+        """Stop wallets moving to another worker; ack once their state is saved"""
+        tasks = [self.tasks.pop(index) for index in indices if index in self.tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.store:
+            self.store.flush()
+        self._report()
+        self._send("removed", indices)
+    
+    async def run(self):
+        next_report = time.time() + self.stats_interval
+        try:
+            while not self.stopping:
+                while not self.stopping and self.conn.poll():
+                    command, *payload = self.conn.recv()
+                    if command == "add":
+                        await self._add(*payload)
+                    elif command == "remove":
+                        await self._remove(*payload)
+                    elif command == "limits":
+                        self.clients.limiter.update(*payload[0])
+                    elif command == "stop":
+                        self.stopping = True
+                if time.time() >= next_report:
+                    next_report = time.time() + self.stats_interval
+                    self._report()
+                await asyncio.sleep(0.1)
+        except (EOFError, OSError):
+            pass  # Supervisor gone
+        finally:
+            tasks = list(self.tasks.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.clients.aclose()
+            if self.store:
+                self.store.close()
+            if self.clock:
+                self.clock.close()
+            self._report()
 
 
-# =============================================================================
-# MULTI-WALLET BOT
-# =============================================================================
+def _fleet_worker(conn, worker: int, wallets: list, options: Dict[str, Any]):
+    """Process entry point of a FleetSupervisor worker"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C is handled by the supervisor
+    fleet_worker = _FleetWorker(conn, worker, options)
+    
+    async def main():
+        await fleet_worker._add(wallets)
+        await fleet_worker.run()
+    
+    asyncio.run(main())
 
-class MultiWalletBot:
+
+@dataclass
+class _WorkerSlot:
+    """Supervisor-side state of one worker (survives its process restarts)"""
+    worker: int
+    wallets: Dict[int, Tuple[str, Optional[str]]] = field(default_factory=dict)
+    process: Any = None
+    conn: Any = None
+    pid: Optional[int] = None
+    crashes: list = field(default_factory=list)  # Crash times within restart_window
+    restarts: int = 0
+    restart_at: Optional[float] = None
+    retired: bool = False
+    taps: float = 0.0
+
+
+class FleetSupervisor:
     """
-    Run multiple bots in parallel.
+    MultiWalletBot across processes: the wallets file is sharded over
+    worker processes, each running its wallets as AsyncBasionBot tasks on
+    its own event loop, so a large fleet uses every core and a stuck or
+    crashing process only affects its own shard.
+    
+    - Wallets are dealt round-robin; each live worker gets an equal share
+      of the RPC and direct (no-proxy) rate limits, re-split whenever a
+      worker is added or retired. Proxy buckets are per worker (limits
+      learned from 429s adapt per worker)
+    - A crashed worker is restarted with backoff and resumes its shard
+      (state_file keeps burners and nonces); after max_restarts crashes
+      within restart_window it is retired and its wallets are spread over
+      the remaining workers
+    - scale() / rebalance() move wallets between running workers; a wallet
+      is handed over only after its old worker has stopped it
+    - Workers report metric increments every stats_interval; they are
+      merged into Metrics.shared() here, so --metrics serves fleet totals,
+      and tap counts keep `count` per wallet across restarts and moves
     
     Usage:
-        bot = MultiWalletBot("wallets.txt")
-        asyncio.run(bot.run_all())
+        supervisor = FleetSupervisor("wallets.txt", workers=8, state_file="basion_state.db")
+        supervisor.run(count=100)    # Blocks until every wallet is done
+        print(supervisor.stats())
     """
     
-    def __init__(self, wallets_file: str):
+    def __init__(
+        self,
+        wallets_file: str,
+        workers: Optional[int] = None,
+        rpc_url: str = RPC_URL,
+        state_file: Optional[str] = None,
+        limits: Optional[Dict[str, Optional[Tuple[float, float]]]] = None,
+        max_restarts: int = 5,
+        restart_window: float = 300.0,
+        stats_interval: float = 5.0,
+        mp_context=None
+    ):
+        """
+        Args:
+            wallets_file: Path to wallets file (see MultiWalletBot)
+            workers: Worker processes (default: CPU count, at most one per wallet)
+            rpc_url: RPC endpoint URL for all bots (comma-separated for a pool)
+            state_file: StateStore path shared by the workers (SQLite WAL)
+            limits: Fleet-wide rate limits (see RateLimiter), split between workers
+            max_restarts: Crashes within restart_window before a worker is retired
+            restart_window: Seconds crashes are counted over
+            stats_interval: Seconds between worker metric reports
+            mp_context: multiprocessing context (default: spawn)
         """
-        Load wallets from file.
+        self.wallets: list[Tuple[str, Optional[str]]] = list(iter_wallets(wallets_file))
+        self.workers = max(1, min(workers or os.cpu_count() or 1, len(self.wallets)))
+        self.rpc_url = rpc_url
+        self.state_file = state_file
+        self.limits = limits
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.stats_interval = stats_interval
+        self.metrics = Metrics.shared()
+        self.context = mp_context or multiprocessing.get_context("spawn")
         
-        File format (one per line):
-        PRIVATE_KEY:PROXY
+        self._slots: list[_WorkerSlot] = []
+        self._moving: Dict[int, Tuple[int, int]] = {}  # Wallet index -> (from, to) worker
+        self._taps: Dict[int, float] = {}  # Wallet index -> taps sent
+        self._done: set = set()
+        self._failed: Dict[int, str] = {}
+        self._count: Optional[int] = None
+        self._options: Dict[str, Any] = {}
+        self._stopping = False
         
-        Example:
-        0xABC123:http://user:pass@ip:port
-        0xDEF456:socks5://user:pass@ip:port
-        0x789ABC:
-        """
-        self.bots: list[BasionBot] = []
+        print(f"Loaded {len(self.wallets)} wallets")
+    
+    def _log(self, message: str):
+        timestamp = time.strftime("%H:%M:%S")
+        print(f"[{timestamp}] [fleet] {message}")
+    
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+    
+    def _live(self) -> list:
+        return [slot for slot in self._slots if not slot.retired]
+    
+    def _active(self, slot: _WorkerSlot) -> list:
+        """Wallet indices of a worker that still have taps to send"""
+        return [i for i in slot.wallets if i not in self._done and i not in self._failed]
+    
+    def _load(self, slot: _WorkerSlot) -> int:
+        incoming = sum(1 for _, to in self._moving.values() if to == slot.worker)
+        return len(self._active(slot)) + incoming
+    
+    def _entries(self, indices: list) -> list:
+        """("add" payload) wallets with their remaining tap count"""
+        entries = []
+        for index in indices:
+            count = self._count
+            if count is not None:
+                count = max(0, count - int(self._taps.get(index, 0)))
+            entries.append((index, *self.wallets[index], count))
+        return entries
+    
+    def _share(self) -> Tuple[dict, dict]:
+        return _scaled_limits(self.limits, 1 / max(1, len(self._live())))
+    
+    def _reshare(self):
+        """Send the live workers their new share of the rate limits"""
+        limits = self._share()
+        for slot in self._live():
+            self._send(slot, "limits", limits)
+    
+    def _spawn(self, slot: _WorkerSlot):
+        parent, child = self.context.Pipe()
+        options = {**self._options, "limits": self._share()}
+        slot.process = self.context.Process(
+            target=_fleet_worker, args=(child, slot.worker, self._entries(self._active(slot)), options),
+            name=f"basion-worker-{slot.worker}", daemon=True
+        )
+        slot.process.start()
+        child.close()
+        slot.conn = parent
+        slot.pid = slot.process.pid
+        slot.restart_at = None
+    
+    def _send(self, slot: _WorkerSlot, *message):
+        if slot.process is None:
+            return  # Restarting: the new process gets the slot's wallets
+        try:
+            slot.conn.send(message)
+        except OSError:
+            pass  # Died: handled through its process sentinel
+    
+    def _receive(self, slot: _WorkerSlot):
+        try:
+            while slot.conn.poll():
+                self._message(slot, *slot.conn.recv())
+        except (EOFError, OSError):
+            pass  # Died: handled through its process sentinel
+    
+    def _message(self, slot: _WorkerSlot, kind: str, payload: Any, *rest):
+        if kind == "stats":
+            counters, histograms, taps = payload
+            self.metrics.merge(counters, histograms)
+            for index, value in taps.items():
+                self._taps[index] = self._taps.get(index, 0) + value
+            slot.taps += sum(taps.values())
+        elif kind == "done":
+            self._done.add(payload)
+        elif kind == "failed":
+            self._failed[payload] = rest[0]
+            self.metrics.inc("basion_wallet_failures_total")
+            self._log(f"Worker {slot.worker}: wallet #{payload} failed: {rest[0]}")
+        elif kind == "removed":
+            self._hand_over(payload)
+    
+    def _exited(self, slot: _WorkerSlot):
+        """A worker process ended: restart it, or retire it after too many crashes"""
+        self._receive(slot)
+        slot.process.join()
+        exitcode = slot.process.exitcode
+        slot.conn.close()
+        slot.process = slot.conn = None
+        # Wallets it was handing over can start elsewhere now
+        self._hand_over([i for i, (source, _) in self._moving.items() if source == slot.worker])
+        if self._stopping or slot.retired:
+            return
         
-        with open(wallets_file) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                
-                # Split only on first colon after private key (66 chars for 0x + 64 hex)
-                if line.startswith("0x"):
-                    pk_end = 66
-                    private_key = line[:pk_end]
-                    proxy = line[pk_end + 1:] if len(line) > pk_end + 1 else None
+        now = time.time()
+        slot.crashes = [t for t in slot.crashes if now - t < self.restart_window] + [now]
+        if len(slot.crashes) > self.max_restarts:
+            self._log(f"Worker {slot.worker} crashed {len(slot.crashes)} times in {self.restart_window:.0f}s, retiring it")
+            self._retire(slot)
+            return
+        delay = min(2 ** (len(slot.crashes) - 1), 30)
+        self._log(f"Worker {slot.worker} (pid {slot.pid}) exited with code {exitcode}, restarting in {delay}s")
+        slot.restarts += 1
+        slot.restart_at = now + delay
+        self.metrics.inc("basion_worker_restarts_total", worker=slot.worker)
+    
+    # -------------------------------------------------------------------------
+    # Rebalancing
+    # -------------------------------------------------------------------------
+    
+    def _move(self, indices: list, source: _WorkerSlot, destination: _WorkerSlot):
+        """Take wallets off source; destination starts them once source acks"""
+        if not indices:
+            return
+        for index in indices:
+            source.wallets.pop(index)
+            self._moving[index] = (source.worker, destination.worker)
+        if source.process is None:
+            self._hand_over(indices)
+        else:
+            self._send(source, "remove", indices)
+    
+    def _hand_over(self, indices: list):
+        """Start moved wallets on their destination workers"""
+        arrivals: Dict[int, list] = {}
+        for index in indices:
+            if index not in self._moving:
+                continue
+            _, to = self._moving.pop(index)
+            destination = self._slots[to]
+            if destination.retired:
+                destination = min(self._live(), key=self._load)
+            destination.wallets[index] = self.wallets[index]
+            arrivals.setdefault(destination.worker, []).append(index)
+        for worker, moved in arrivals.items():
+            self._send(self._slots[worker], "add", self._entries(moved))
+    
+    def _retire(self, slot: _WorkerSlot):
+        """Stop using a worker and spread its wallets over the others"""
+        slot.retired = True
+        slot.restart_at = None
+        live = self._live()
+        if not live:
+            raise RuntimeError("Every fleet worker was retired")
+        for index in self._active(slot):
+            self._move([index], slot, min(live, key=self._load))
+        self._send(slot, "stop")
+        self._reshare()
+    
+    def rebalance(self):
+        """Even out active wallets over the live workers"""
+        live = sorted(self._live(), key=self._load, reverse=True)
+        if len(live) < 2:
+            return
+        # Busiest workers keep the remainder, so the fewest wallets move
+        base, extra = divmod(sum(self._load(slot) for slot in live), len(live))
+        target = {slot.worker: base + (n < extra) for n, slot in enumerate(live)}
+        deficit = {
+            slot.worker: target[slot.worker] - self._load(slot)
+            for slot in live if self._load(slot) < target[slot.worker]
+        }
+        for high in live:
+            excess = self._load(high) - target[high.worker]
+            if excess <= 0:
+                continue
+            # Load includes wallets still on their way to high: redirect
+            # those first, then move ones it runs
+            incoming = [i for i, (_, to) in self._moving.items() if to == high.worker]
+            moves: Dict[int, list] = {}
+            for index in (incoming + self._active(high)[::-1])[:excess]:
+                source = self._moving[index][0] if index in self._moving else high.worker
+                # Rather not send a wallet back to the worker it is leaving
+                low = next((w for w in deficit if w != source), next(iter(deficit)))
+                deficit[low] -= 1
+                if not deficit[low]:
+                    del deficit[low]
+                if index in self._moving:
+                    self._moving[index] = (source, low)
                 else:
-                    # No 0x prefix
-                    pk_end = 64
-                    private_key = line[:pk_end]
-                    proxy = line[pk_end + 1:] if len(line) > pk_end + 1 else None
-                
-                if proxy == "":
-                    proxy = None
-                
-                bot = BasionBot(private_key=private_key, proxy=proxy)
-                self.bots.append(bot)
+                    moves.setdefault(low, []).append(index)
+            for low, indices in moves.items():
+                self._move(indices, high, self._slots[low])
+    
+    def scale(self, workers: int):
+        """Change the number of worker processes, then rebalance wallets"""
+        live = self._live()
+        for slot in live[workers:]:
+            self._retire(slot)
+        for _ in range(workers - len(live)):
+            slot = _WorkerSlot(worker=len(self._slots))
+            self._slots.append(slot)
+            self._spawn(slot)
+        self.workers = workers
+        self._reshare()
+        self.rebalance()
+    
+    # -------------------------------------------------------------------------
+    # Running
+    # -------------------------------------------------------------------------
+    
+    def start(
+        self,
+        count: Optional[int] = None,
+        setup_package: Optional[int] = 1,
+        blocks: Optional[str] = None,
+        **tap_options
+    ):
+        """
+        Deal the wallets out and start the workers.
         
-        print(f"Loaded {len(self.bots)} wallets")
+        Args:
+            count: Taps per wallet (None = until stopped)
+            setup_package: Package setup() buys for wallets without a
+                burner (None = skip setup)
+            blocks: Tap on block slots (see BlockClock): "" polls
+                eth_blockNumber, a ws:// URL subscribes to newHeads
+            **tap_options: Passed to each tap_loop (must be picklable)
+        """
+        self._count = count
+        self._stopping = False
+        self._options = {
+            "rpc_url": self.rpc_url,
+            "state_file": self.state_file,
+            "setup_package": setup_package,
+            "blocks": blocks,
+            "tap_options": tap_options,
+            "stats_interval": self.stats_interval,
+        }
+        self._slots = [_WorkerSlot(worker=i) for i in range(self.workers)]
+        for index, wallet in enumerate(self.wallets):
+            self._slots[index % self.workers].wallets[index] = wallet
+        for slot in self._slots:
+            self._spawn(slot)
+        self._log(f"{len(self.wallets)} wallets on {self.workers} worker processes")
     
-    async def run_bot(self, bot: BasionBot, count: Optional[int] = None):
-        """Run single bot in async context"""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, lambda: bot.tap_loop(count=count))
+    def supervise(self, timeout: float = 1.0) -> bool:
+        """
+        Handle worker messages, exits and due restarts for up to `timeout`
+        seconds. Returns False once every wallet is done or failed.
+        """
+        running = [slot for slot in self._slots if slot.process is not None]
+        if running:
+            ready = set(connection_wait(
+                [slot.conn for slot in running] + [slot.process.sentinel for slot in running], timeout
+            ))
+            for slot in running:
+                if slot.conn in ready:
+                    self._receive(slot)
+            for slot in running:
+                if slot.process.sentinel in ready:
+                    self._exited(slot)
+        else:
+            time.sleep(timeout)
+        
+        now = time.time()
+        for slot in self._slots:
+            if slot.restart_at is not None and now >= slot.restart_at:
+                self._spawn(slot)
+        return len(self._done) + len(self._failed) < len(self.wallets)
     
-    async def run_all(self, count: Optional[int] = None):
-        """Run all bots in parallel"""
-        tasks = [self.run_bot(bot, count) for bot in self.bots]
-        await asyncio.gather(*tasks)
+    def stop(self, timeout: float = 15.0):
+        """Stop every worker (bots save their state) and collect final stats"""
+        self._stopping = True
+        for slot in self._slots:
+            slot.restart_at = None
+            self._send(slot, "stop")
+        deadline = time.time() + timeout
+        while time.time() < deadline and any(slot.process is not None for slot in self._slots):
+            self.supervise(0.2)
+        for slot in self._slots:
+            if slot.process is not None:
+                slot.process.terminate()
+                self._exited(slot)
     
-    def setup_all(self, package_id: int = 1):
-        """Setup all bots (create burner, deposit)"""
-        for bot in self.bots:
-            try:
-                bot.setup(package_id=package_id)
-            except Exception as e:
-                print(f"Setup failed for {bot.address}: {e}")
+    def run(self, count: Optional[int] = None, **options) -> Dict[str, Any]:
+        """
+        start(), supervise until every wallet is done (or Ctrl+C), stop().
+        Returns stats().
+        """
+        self.start(count, **options)
+        try:
+            while self.supervise():
+                pass
+        except KeyboardInterrupt:
+            self._log("Interrupted, stopping workers")
+        finally:
+            self.stop()
+        return self.stats()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Fleet totals and per-worker wallets, taps and restarts"""
+        workers = [
+            {
+                "worker": slot.worker,
+                "pid": slot.pid,
+                "alive": slot.process is not None and slot.process.is_alive(),
+                "retired": slot.retired,
+                "wallets": len(self._active(slot)),
+                "taps": int(slot.taps),
+                "restarts": slot.restarts,
+            }
+            for slot in self._slots
+        ]
+        return {
+            "wallets": len(self.wallets),
+            "done": len(self._done),
+            "failed": len(self._failed),
+            "taps": sum(w["taps"] for w in workers),
+            "taps_per_second": round(sum(self.metrics.tap_rates().values()), 3),
+            "restarts": sum(w["restarts"] for w in workers),
+            "workers": workers,
+        }
+
+
+# =============================================================================
+# LIGHT STATUS (NO WEB3)
+# =============================================================================
+
+def address_of(private_key: str) -> str:
+    """Checksum address of a private key (eth_keys only, no eth_account)"""
+    return keys.PrivateKey(HexBytes(private_key)).public_key.to_checksum_address()
+
+
+def read_status(addresses: list, rpc_url: str = RPC_URL) -> Dict[str, Tuple[UserInfo, float, float]]:
+    """
+    (user info, main ETH, burner ETH) per address in two batched reads
+    over an RPCPool, without importing web3 / eth_account. The burner is
+    the one registered on-chain. Backs `python basion_bot.py status`.
+    """
+    pool = RPCPool(_rpc_urls(rpc_url))
+    try:
+        calls = []
+        for address in addresses:
+            calls += [
+                _AbiCall(CONTRACT_ADDRESS, CONTRACT_ABI, name, address)
+                for name in ("getPoints", "getUserInfo", "referrer", "blacklisted")
+            ]
+            calls.append(_AbiCall(MULTICALL3_ADDRESS, MULTICALL3_ABI, "getEthBalance", address))
+        results = multicall_rpc(pool, calls)
+        
+        infos = {}
+        for n, address in enumerate(addresses):
+            row = results[n * 5:n * 5 + 5]
+            infos[address] = (_BaseBot._make_user_info(address, *row[:4]), row[4])
+        burners = [info.burner_address for info, _ in infos.values() if info.burner_address]
+        burner_wei = dict(zip(burners, multicall_rpc(pool, [
+            _AbiCall(MULTICALL3_ADDRESS, MULTICALL3_ABI, "getEthBalance", burner) for burner in burners
+        ])))
+        return {
+            address: (info, wei / 10**18, burner_wei.get(info.burner_address, 0) / 10**18)
+            for address, (info, wei) in infos.items()
+        }
+    finally:
+        pool.close()
 
 
 # =============================================================================
 # MAIN ENTRY POINT
 # =============================================================================
 
-if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) < 2:
-        print("Basion Bot SDK v1.0.0")
-        print("\nUsage:")
-        print("  python basion_bot.py <private_key> [proxy]")
-        print("  python basion_bot.py wallets.txt")
-        print("\nExamples:")
-        print("  python basion_bot.py 0xABC123...")
-        print("  python basion_bot.py 0xABC123... http://user:pass@ip:port")
-        print("  python basion_bot.py wallets.txt")
-        print("\nwallets.txt format:")
-        print("  PRIVATE_KEY:PROXY")
-        print("  0xABC123...:http://user:pass@ip:port")
-        print("  0xDEF456...:socks5://user:pass@ip:port")
-        print("  0x789ABC...:  (no proxy)")
-        sys.exit(1)
-    
-    arg = sys.argv[1]
-    
-    if arg.endswith(".txt"):
+USAGE = """Basion Bot SDK v1.0.0
+
+Usage:
+  python basion_bot.py <private_key> [proxy]
+  python basion_bot.py wallets.txt [--async] [--metrics[=PORT]] [--blocks[=WS_URL]]
+  python basion_bot.py wallets.txt --workers[=N] [--metrics[=PORT]] [--blocks[=WS_URL]]
+  python basion_bot.py status <private_key|wallets.txt> [--rpc=URL]
+
+Examples:
+  python basion_bot.py 0xABC123...
+  python basion_bot.py 0xABC123... http://user:pass@ip:port
+  python basion_bot.py wallets.txt
+  python basion_bot.py wallets.txt --workers=8
+  python basion_bot.py status wallets.txt
+
+wallets.txt format:
+  PRIVATE_KEY:PROXY
+  0xABC123...:http://user:pass@ip:port
+  0xDEF456...:socks5://user:pass@ip:port
+  0x789ABC...:  (no proxy)"""
+
+
+def main(argv: Optional[list] = None):
+    """
+    Command line entry point. Usage and `status` run without importing
+    web3 / eth_account; the tapping modes load them on first use.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(USAGE)
+        sys.exit(0 if argv else 1)
+    
+    arg = argv[0]
+    
+    if arg == "status":
+        # Read-only status of one key or a wallets file
+        targets = [a for a in argv[1:] if not a.startswith("--")]
+        if not targets:
+            print(USAGE)
+            sys.exit(1)
+        rpc_url = next((a.partition("=")[2] for a in argv if a.startswith("--rpc=")), RPC_URL)
+        if targets[0].endswith(".txt"):
+            private_keys = [pk for pk, _ in iter_wallets(targets[0])]
+        else:
+            private_keys = targets
+        addresses = [address_of(pk) for pk in private_keys]
+        status = read_status(addresses, rpc_url)
+        for address in addresses:
+            _BaseBot._print_status(*status[address])
+    elif arg.endswith(".txt"):
         # Multi-wallet mode
         print("Multi-wallet mode")
+        tap_options = {}
+        blocks = workers = None
+        for flag in argv[1:]:
+            if flag.startswith("--metrics"):
+                Metrics.shared().serve(int(flag.partition("=")[2] or 9464))
+            elif flag.startswith("--blocks"):
+                # One tap per wallet per block, spread over block slots
+                blocks = flag.partition("=")[2]
+            elif flag.startswith("--workers"):
+                workers = int(flag.partition("=")[2] or 0)
+        
+        if workers is not None:
+            # Sharded over worker processes (0 = one per core); each worker
+            # sets up and taps its wallets on its own event loop
+            supervisor = FleetSupervisor(arg, workers=workers or None)
+            print(supervisor.run(blocks=blocks))
+            return
+        
+        if blocks is not None:
+            tap_options["clock"] = BlockClock.shared(RPC_URL, blocks or None)
         bot = MultiWalletBot(arg)
         
-        # Setup if needed
-        for b in bot.bots:
-            if not b.get_burner_from_contract():
-                print(f"Setting up {b.address}...")
-                b.setup()
+        # Setup if needed (pipelined across the fleet)
+        bot.setup_all()
         
-        asyncio.run(bot.run_all())
+        if "--async" in argv:
+            asyncio.run(bot.run_all_async(**tap_options))
+        else:
+            asyncio.run(bot.run_all(**tap_options))
     else:
         # Single wallet mode
-        proxy = sys.argv[2] if len(sys.argv) > 2 else None
+        proxy = argv[1] if len(argv) > 1 else None
         bot = BasionBot(private_key=arg, proxy=proxy)
         bot.print_status()
         
@@ -903,3 +6917,7 @@ if __name__ == "__main__":
         
         # Start tapping
         bot.tap_loop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+Basion Bot SDK - Tests
+Runs offline: stateful parts of the SDK driven without RPC, API or worker
+processes.
+
+Usage:
+    python -m pytest test_basion_bot.py
+"""
+
+import sqlite3
+
+import pytest
+
+import basion_bot
+from basion_bot import EventIndexer, FleetSupervisor, Metrics, NonceManager, ReceiptTracker, StateStore
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+class FakeConn:
+    """Supervisor end of a worker pipe: records commands, never receives"""
+
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message):
+        self.sent.append(message)
+
+    def poll(self):
+        return False
+
+    def close(self):
+        pass
+
+
+class FakeProcess:
+    pid = 0
+    exitcode = 1
+
+    def join(self, timeout=None):
+        pass
+
+
+class FakeProvider:
+    """Answers batches with `batch` (raised if an exception), single requests with 0x1"""
+
+    def __init__(self, batch=None):
+        self.batch = batch
+        self.single = 0
+
+    def make_batch_request(self, requests):
+        if isinstance(self.batch, Exception):
+            raise self.batch
+        return self.batch if self.batch is not None else [{"result": "0x1"} for _ in requests]
+
+    def make_request(self, method, params):
+        self.single += 1
+        return {"result": "0x1"}
+
+
+def write_wallets(path, count: int) -> str:
+    path.write_text("".join(f"0x{i + 1:064x}:\n" for i in range(count)))
+    return str(path)
+
+
+@pytest.fixture
+def fleet(tmp_path, monkeypatch):
+    """FleetSupervisor factory whose workers are FakeProcess / FakeConn stubs"""
+    def spawn(self, slot):
+        slot.process, slot.conn, slot.restart_at = FakeProcess(), FakeConn(), None
+
+    monkeypatch.setattr(FleetSupervisor, "_spawn", spawn)
+
+    def make(wallets: int, workers: int, **options) -> FleetSupervisor:
+        supervisor = FleetSupervisor(write_wallets(tmp_path / "wallets.txt", wallets), workers=workers, **options)
+        supervisor.start(count=10, setup_package=None)
+        return supervisor
+
+    return make
+
+
+def commands(slot, kind: str) -> list:
+    """Payloads of the commands of one kind sent to a worker"""
+    return [message[1:] for message in slot.conn.sent if message[0] == kind]
+
+
+def ack_removals(supervisor: FleetSupervisor):
+    """Answer every pending "remove" like a worker that stopped the wallets"""
+    for slot in supervisor._slots:
+        for indices, in commands(slot, "remove"):
+            supervisor._message(slot, "removed", indices)
+
+
+# =============================================================================
+# FLEET SUPERVISOR
+# =============================================================================
+
+def test_scale_up_with_moves_in_flight_balances(fleet):
+    supervisor = fleet(12, 1)
+    supervisor.scale(3)   # Moves wait for worker 0's "removed" ack meanwhile
+
+    assert sorted(supervisor._load(slot) for slot in supervisor._slots) == [4, 4, 4]
+    assert sum(len(indices) for indices, in commands(supervisor._slots[0], "remove")) == 8
+
+    ack_removals(supervisor)
+    assert not supervisor._moving
+    assert [len(slot.wallets) for slot in supervisor._slots] == [4, 4, 4]
+    added = [i for slot in supervisor._slots[1:] for entries, in commands(slot, "add") for i, *_ in entries]
+    assert sorted(added) == sorted(set(range(12)) - set(supervisor._slots[0].wallets))
+
+
+def test_rebalance_redirects_incoming_wallets(fleet):
+    supervisor = fleet(12, 2)
+    supervisor.scale(4)
+    supervisor.scale(6)   # Before any ack: some moves are retargeted
+
+    assert sorted(supervisor._load(slot) for slot in supervisor._live()) == [2] * 6
+    ack_removals(supervisor)
+    assert sorted(len(slot.wallets) for slot in supervisor._live()) == [2] * 6
+    assert sorted(i for slot in supervisor._slots for i in slot.wallets) == list(range(12))
+
+
+def test_scale_down_retires_and_spreads_wallets(fleet):
+    supervisor = fleet(9, 3)
+    supervisor.scale(1)
+
+    retired = supervisor._slots[1:]
+    assert all(slot.retired and commands(slot, "stop") for slot in retired)
+    ack_removals(supervisor)
+    assert sorted(supervisor._slots[0].wallets) == list(range(9))
+
+
+def test_crashed_worker_restarts_with_backoff(fleet):
+    supervisor = fleet(6, 2)
+    slot = supervisor._slots[0]
+    wallets = dict(slot.wallets)
+
+    supervisor._exited(slot)
+    assert slot.process is None and slot.restarts == 1
+    first = slot.restart_at
+
+    supervisor._spawn(slot)
+    supervisor._exited(slot)
+    assert slot.restarts == 2
+    assert slot.restart_at - first >= 1   # Backoff doubles: 1s, then 2s
+    assert slot.wallets == wallets and not slot.retired
+
+
+def test_crash_looping_worker_is_retired(fleet):
+    supervisor = fleet(6, 2, max_restarts=1)
+    slot, other = supervisor._slots
+    supervisor._exited(slot)
+    supervisor._spawn(slot)
+    supervisor._exited(slot)   # Second crash within restart_window
+
+    assert slot.retired and slot.restart_at is None
+    assert supervisor._live() == [other]
+    # Its process is gone, so nothing waits for a "removed" ack
+    assert not supervisor._moving
+    assert sorted(other.wallets) == list(range(6))
+
+
+def test_worker_stats_merge_into_metrics(fleet):
+    supervisor = fleet(4, 2)
+    supervisor.metrics = Metrics()
+    slot = supervisor._slots[0]
+    index = next(iter(slot.wallets))
+    worker = Metrics()
+    reported = ({}, {})
+
+    def report():
+        nonlocal reported
+        counters, histograms = worker.raw()
+        delta = basion_bot._counter_delta(counters, reported[0])
+        taps = {index: delta[key] for key in delta if key[0] == "basion_taps_total"}
+        supervisor._message(slot, "stats", (delta, basion_bot._histogram_delta(histograms, reported[1]), taps))
+        reported = (counters, histograms)
+
+    worker.taps("0xa", 5)
+    worker.observe("basion_rpc_seconds", 0.1, method="eth_call")
+    report()
+    worker.taps("0xa", 3)
+    worker.inc("basion_errors_total", error="ValueError")
+    worker.observe("basion_rpc_seconds", 0.2, method="eth_call")
+    report()
+    report()   # Nothing new: an empty increment
+
+    assert supervisor.metrics.counter("basion_taps_total", wallet="0xa") == 8
+    assert supervisor.metrics.counter("basion_errors_total", error="ValueError") == 1
+    assert supervisor.metrics.raw()[1] == worker.raw()[1]
+    assert supervisor._taps[index] == 8 and slot.taps == 8
+    assert supervisor.metrics.tap_rates()["0xa"] > 0
+
+
+# =============================================================================
+# STATE STORE
+# =============================================================================
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "state.db")
+
+
+def queue_writes(store: StateStore, wallet: str, nonce: int):
+    store.set_nonce(wallet, nonce)
+    store.save_ledger(wallet, 100 + nonce, 10 * nonce, 1)
+    store.count(wallet, txs_sent=1, taps_sent=5)
+    store.journal(wallet, f"0x{nonce:064x}", "sent", nonce=nonce)
+
+
+def test_flush_failure_keeps_queued_writes(store_path):
+    store = StateStore(store_path, flush_interval=3600)
+    store._db.execute("PRAGMA busy_timeout = 0")
+    queue_writes(store, "0xa", 1)
+
+    blocker = sqlite3.connect(store_path, isolation_level=None)
+    blocker.execute("BEGIN EXCLUSIVE")
+    with pytest.raises(sqlite3.OperationalError):
+        store.flush()
+    queue_writes(store, "0xa", 2)   # Queued while the database was locked
+    blocker.execute("ROLLBACK")
+    blocker.close()
+
+    store.flush()
+    assert store.next_nonce("0xa") == 2
+    assert store.ledger("0xa")[:3] == (102, 20, 1)
+    assert store.counters("0xa")["txs_sent"] == 2
+    assert store.counters("0xa")["taps_sent"] == 10
+    assert [entry["nonce"] for entry in store.history("0xa")] == [2, 1]
+    store.close()
+
+
+def test_close_and_reopen_resumes(store_path):
+    store = StateStore(store_path, flush_interval=3600)
+    queue_writes(store, "0xa", 7)
+    store.save_index("events:0xc", 500, {"0xa": dict.fromkeys(basion_bot.INDEX_FIELDS, 0)})
+    store.close()
+
+    store = StateStore(store_path, flush_interval=3600)
+    assert store.next_nonce("0xa") == 7
+    assert store.counters("0xa")["txs_sent"] == 1
+    block, rows = store.load_index("events:0xc")
+    assert block == 500 and set(rows) == {"0xa"}
+    store.close()
+
+
+# =============================================================================
+# EVENT INDEXER
+# =============================================================================
+
+WALLET_A = "0x" + "aa" * 20
+WALLET_B = "0x" + "bb" * 20
+
+
+def offline_indexer(store: StateStore, wallets, head: int) -> EventIndexer:
+    """EventIndexer whose chain is at `head` and has no logs"""
+    indexer = EventIndexer(wallets, rpc_url="http://127.0.0.1:1", store=store, confirmations=0)
+    indexer._rpc = lambda method, params: hex(head)
+    indexer._fetch = lambda start, end: []
+    return indexer
+
+
+def indexed(points: int) -> dict:
+    return dict(basion_bot._empty_index_row(), standard_points=points, last_block=50)
+
+
+def test_untracked_rows_fall_behind_the_checkpoint(store_path):
+    store = StateStore(store_path, flush_interval=3600)
+    wallet_a, wallet_b = map(basion_bot.Web3.to_checksum_address, (WALLET_A, WALLET_B))
+    name = offline_indexer(store, [], head=100).name
+    store.save_index(name, 100, {wallet_a: indexed(5), wallet_b: indexed(7)})
+
+    indexer = offline_indexer(store, [WALLET_A], head=200)
+    assert indexer.block == 100 and indexer.wallet(wallet_a)["standard_points"] == 5
+    indexer.sync()
+    block, rows = store.load_index(name)
+    assert block == 200
+    assert rows[wallet_a]["indexed_to"] is None
+    assert rows[wallet_b]["indexed_to"] == 100   # Missed blocks 101-200
+
+    indexer.track(WALLET_B)   # Same run, after the checkpoint moved
+    assert indexer.wallet(wallet_b) is None and wallet_b in indexer._unseeded
+
+    restarted = offline_indexer(store, [WALLET_A, WALLET_B], head=200)
+    assert restarted.wallet(wallet_a)["standard_points"] == 5
+    assert restarted.wallet(wallet_b) is None and wallet_b in restarted._unseeded
+    store.close()
+
+
+def test_stored_rows_are_current_until_the_checkpoint_moves(store_path):
+    store = StateStore(store_path, flush_interval=3600)
+    wallet_b = basion_bot.Web3.to_checksum_address(WALLET_B)
+    name = offline_indexer(store, [], head=100).name
+    store.save_index(name, 100, {wallet_b: indexed(7)})
+
+    indexer = offline_indexer(store, [WALLET_A], head=100)
+    indexer._seed = lambda block: {}   # WALLET_A is new: no snapshot offline
+    indexer.sync()   # Head did not move: nothing missed
+    indexer.track(WALLET_B)
+    assert indexer.wallet(wallet_b)["standard_points"] == 7
+    store.close()
+
+
+# =============================================================================
+# NONCE MANAGER
+# =============================================================================
+
+COUNT_REQUESTS = [("eth_getTransactionCount", ["0xa", "latest"]), ("eth_getTransactionCount", ["0xa", "pending"])]
+
+
+def test_nonce_batches_survive_transport_errors():
+    nonces = NonceManager()
+    provider = FakeProvider(TimeoutError("read timed out"))
+    with pytest.raises(TimeoutError):
+        nonces._fetch_counts(provider, COUNT_REQUESTS)
+    assert nonces._batching
+
+    provider.batch = None
+    assert nonces._fetch_counts(provider, COUNT_REQUESTS) == [1, 1]
+    assert nonces._batching and provider.single == 0
+
+
+def test_nonce_batches_stop_when_rejected():
+    nonces = NonceManager()
+    provider = FakeProvider(NotImplementedError())
+    assert nonces._fetch_counts(provider, COUNT_REQUESTS) == [1, 1]
+    assert not nonces._batching and provider.single == 2
+
+
+# =============================================================================
+# RECEIPT TRACKER
+# =============================================================================
+
+def test_receipt_batches_survive_transport_errors():
+    tracker = ReceiptTracker(rpc_url="http://127.0.0.1:1")
+    tracker.provider = FakeProvider(ConnectionError("connection reset"))
+    with pytest.raises(ConnectionError):
+        tracker._fetch(["0x01", "0x02"])
+    assert tracker._batching
+
+    tracker.provider.batch = None
+    assert tracker._fetch(["0x01", "0x02"]) == ["0x1", "0x1"]
+    assert tracker._batching and tracker.provider.single == 0
+
+
+def test_receipt_batches_stop_when_rejected():
+    tracker = ReceiptTracker(rpc_url="http://127.0.0.1:1")
+    tracker.provider = FakeProvider({"error": {"code": -32600, "message": "batch requests not supported"}})
+    assert tracker._fetch(["0x01", "0x02"]) == ["0x1", "0x1"]
+    assert not tracker._batching and tracker.provider.single == 2